@@ -35,6 +35,7 @@ setup(
         'sql_antipattern_scanner': [
             'config/*.json',
             'static/*.css',
+            'static/*.js',
         ]
     },
     include_package_data=True,
@@ -2,4 +2,24 @@
 from .sql_antipattern_scanner import *
 from .antipatterns import *
 from .cli import *
-from .report_generator import *
\ No newline at end of file
+from .report_generator import *
+from .rule_packs import *
+from .dialects import *
+from .statements import *
+from .diff_scan import *
+from .watch import *
+from .literals import *
+from .history import *
+from .schema_catalog import *
+from .plan_verification import *
+from .cost_model import *
+from .rewrites import *
+from .embedded_sql import *
+from .workload import *
+from .streaming import *
+from .suppression import *
+from .gating import *
+from .compiled_scanner import *
+from .migrations import *
+from .index_advisor import *
+from .sharding import *
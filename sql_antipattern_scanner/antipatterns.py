@@ -69,4 +69,31 @@ DEFAULT_ANTIPATTERNS = [
              Antipattern("Correlated Subquery", "Correlated subqueries can lead to poor performance, especially with large datasets.",
                          "High", "Consider rewriting the query using JOINs or uncorrelated subqueries for better performance.",
                          "Use JOIN instead of EXISTS when possible"))
-        ]
\ No newline at end of file
+        ]
+
+# Antipatterns that only exist in specific dialects, paired with dialects they apply to
+DIALECT_ANTIPATTERNS = [
+            (re.compile(r'\bORDER\s+BY\s+RANDOM\(\)', re.IGNORECASE),
+             Antipattern("ORDER BY RANDOM()", "Using ORDER BY RANDOM() for random sorting assigns a random key to every row and sorts the full result.",
+                         "High", "Use TABLESAMPLE or filter on a random key range instead of sorting the whole table.",
+                         "SELECT * FROM table TABLESAMPLE SYSTEM (1) LIMIT 10"),
+             ('postgres', 'sqlite', 'snowflake')),
+
+            (re.compile(r'\bORDER\s+BY\s+NEWID\(\)', re.IGNORECASE),
+             Antipattern("ORDER BY NEWID()", "Using ORDER BY NEWID() for random sorting generates a GUID for every row and sorts the full result.",
+                         "High", "Use TABLESAMPLE or filter on a random key range instead of sorting the whole table.",
+                         "SELECT TOP 10 * FROM table TABLESAMPLE (1 PERCENT)"),
+             ('tsql',)),
+
+            (re.compile(r'\bWITH\s*\(\s*NOLOCK\s*\)', re.IGNORECASE),
+             Antipattern("NOLOCK Hint", "NOLOCK reads uncommitted data and can skip or double-read rows during page splits.",
+                         "Medium", "Use READ COMMITTED SNAPSHOT isolation instead of NOLOCK hints.",
+                         "ALTER DATABASE db SET READ_COMMITTED_SNAPSHOT ON"),
+             ('tsql',)),
+
+            (re.compile(r'\bSQL_CALC_FOUND_ROWS\b', re.IGNORECASE),
+             Antipattern("SQL_CALC_FOUND_ROWS", "SQL_CALC_FOUND_ROWS forces the server to compute the full result even when LIMIT is used.",
+                         "High", "Run a separate COUNT(*) query when the total is needed.",
+                         "SELECT COUNT(*) FROM table WHERE condition"),
+             ('mysql',)),
+        ]
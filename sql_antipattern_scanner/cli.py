@@ -1,11 +1,49 @@
 # sql_antipattern_scanner/sql_antipattern_scanner/cli.py
+import os
 import argparse
-from typing import List, Tuple, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Any, Optional
 from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.compiled_scanner import ScannerBuilder
 from sql_antipattern_scanner.tests.test_sql_antipattern_scanner import run_tests
-from sql_antipattern_scanner.report_generator import ReportGenerator
+from sql_antipattern_scanner.report_generator import ReportGenerator, MINIMAL_FIELDS, REPORT_FIELDS, issue_entry, parse_fields
+from sql_antipattern_scanner.rule_packs import load_rule_pack, discover_rule_packs
+from sql_antipattern_scanner.dialects import SUPPORTED_DIALECTS, detect_dialect, detect_directory_dialect
+from sql_antipattern_scanner.diff_scan import git_diff, scan_diff, parse_unified_diff, changed_statements
+from sql_antipattern_scanner.gating import Gate, GateEvaluator
+from sql_antipattern_scanner.statements import Finding, StatementSpan, locate_findings, split_statements
+from sql_antipattern_scanner.history import FindingsStore
+from sql_antipattern_scanner.suppression import Baseline
+from sql_antipattern_scanner.schema_catalog import SchemaCatalog
+from sql_antipattern_scanner.cost_model import CostModel, estimate_findings
+from sql_antipattern_scanner.rewrites import RewriteEngine
+from sql_antipattern_scanner.embedded_sql import extract_tree, scan_embedded, source_files
+from sql_antipattern_scanner.workload import WorkloadAnalyzer, read_workload
+from sql_antipattern_scanner.index_advisor import IndexAdvisor
+from sql_antipattern_scanner.sharding import ShardManifest, scan_shard, save_partial, load_partial, merge_partials
+from sql_antipattern_scanner.plan_verification import PlanVerifier, PlanEvidence, rank_issues, evidence_dict
+import json
+from sql_antipattern_scanner.watch import watch
+from sql_antipattern_scanner.streaming import SAMPLING_MODES, StreamingScanner, stream
+import sys
 import sqlparse
 
+SHARD_COMMANDS = ("shard", "scan-shard", "merge")
+
+def add_scanner_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add options configuring scanner, as read by create_scanner.
+
+    :param parser: Argument parser to add options to
+    """
+    parser.add_argument("--rule-pack", action="append", default=[], help="Path to YAML/JSON rule pack (can be repeated)")
+    parser.add_argument("--discover-rule-packs", action="store_true", help="Load rule packs registered by installed packages")
+    parser.add_argument("--dialect", choices=list(SUPPORTED_DIALECTS) + ["auto"], help="SQL dialect to apply dialect-specific rules for ('auto' to detect)")
+    parser.add_argument("--schema", help="Schema catalog (DDL .sql file, JSON dump or SQLite database) for schema-aware checks")
+    parser.add_argument("--max-bytes", type=int, help="Maximum statement size in bytes to scan in full")
+    parser.add_argument("--max-tokens", type=int, help="Maximum number of tokens to parse per statement")
+    parser.add_argument("--max-depth", type=int, help="Maximum parenthesis nesting depth to parse")
+    parser.add_argument("--timeout", type=float, help="Wall time budget per statement in seconds")
+
 def main() -> None:
     """
     Main function to run SQL Antipattern Scanner CLI.
@@ -13,35 +51,394 @@ def main() -> None:
     Parses command-line arguments, runs scanner on provided SQL,
     and generates report in specified format.
     """
+    # Sharded runs use subcommands; everything else keeps flat options with optional sql_file
+    if len(sys.argv) > 1 and sys.argv[1] in SHARD_COMMANDS:
+        sys.exit(shard_main(sys.argv[1:]))
+
     parser = argparse.ArgumentParser(description="SQL Antipattern Scanner")
     parser.add_argument("sql_file", nargs='?', help="Path to SQL file to scan")
     parser.add_argument("--query", help="SQL query to scan")
-    parser.add_argument("--format", nargs='?', choices=["json", "csv", "html"], default="json", const="json", help="Output format (default: json)")
-    parser.add_argument("--output", help="Output file path")
+    parser.add_argument("--format", nargs='?', choices=["json", "csv", "html", "html-large", "minimal"], default="json", const="json", help="Output format (default: json; html-large writes paginated report with lazily loaded data chunks to --output directory; minimal writes one compact JSON object per finding with file, line, name and severity)")
+    parser.add_argument("--output", help="Output file path (directory for html-large, default: report)")
+    parser.add_argument("--fields", help=f"Comma-separated report fields to compute and include, for json, csv and minimal formats ({', '.join(REPORT_FIELDS)})")
     parser.add_argument("--run-tests", action="store_true", help="Run unit tests")
+    add_scanner_arguments(parser)
+    parser.add_argument("--verify-plans", metavar="DDL", help="DDL file or SQLite database to confirm full scans with EXPLAIN QUERY PLAN in SQLite")
+    parser.add_argument("--advise-indexes", action="store_true", help="Add ranked composite index recommendations for scanned statements (or --workload) to report")
+    parser.add_argument("--advise-limit", type=int, default=20, help="Maximum number of index recommendations (default: 20)")
+    parser.add_argument("--sort-by", choices=["severity", "cost"], default="severity", help="Order findings by severity or by estimated statement cost (default: severity)")
+    parser.add_argument("--fix", action="store_true", help="Rewrite mechanically fixable antipatterns in sql_file in place (or print rewritten --query) before scanning")
+    parser.add_argument("--patch", action="store_true", help="Print unified diff of mechanical rewrites without changing sql_file")
+    parser.add_argument("--embedded", metavar="PATH", help="Scan SQL embedded in Python, Java, Kotlin and Go sources under PATH")
+    parser.add_argument("--workers", type=int, help="Worker processes for --embedded extraction (default: CPU count)")
+    parser.add_argument("--workload", metavar="PATH", help="Analyze ordered statement stream (JSON Lines with sql, session, timestamp; or SQL script) for N+1, repeated and chatty query patterns")
+    parser.add_argument("--workload-window", type=float, default=1.0, help="Window length in seconds for --workload grouping per session (default: 1.0)")
+    parser.add_argument("--diff", help="Path to unified diff; scan only changed statements of SQL files in it")
+    parser.add_argument("--git-range", help="Git revision range to diff (e.g. origin/main...HEAD); scan only changed statements")
+    parser.add_argument("--repo-root", default=".", help="Repository root that diff paths are relative to (default: .)")
+    parser.add_argument("--watch", metavar="DIR", help="Watch directory and emit findings of modified SQL files as JSON Lines")
+    parser.add_argument("--debounce", type=float, default=0.3, help="Seconds of quiet before rescanning in watch mode (default: 0.3)")
+    parser.add_argument("--stream", metavar="PATH", help="Sample live statement stream, one statement per line ('-' for stdin), and emit snapshots as JSON Lines")
+    parser.add_argument("--sample", choices=SAMPLING_MODES, default="reservoir", help="Sampling mode for --stream (default: reservoir)")
+    parser.add_argument("--sample-size", type=int, default=100, help="Reservoir size, or cap of uniform sample, per snapshot (default: 100)")
+    parser.add_argument("--sample-rate", type=float, default=0.01, help="Sampling probability in uniform mode (default: 0.01)")
+    parser.add_argument("--top-k", type=int, default=20, help="Most frequent query shapes to scan per snapshot (default: 20)")
+    parser.add_argument("--snapshot-interval", type=float, default=10.0, help="Seconds between stream snapshots (default: 10)")
+    parser.add_argument("--fail-on", choices=["Critical", "High", "Medium", "Low"], help="Exit with status 1 at first finding of this severity or higher, without rendering report")
+    parser.add_argument("--max-score", type=int, help="Exit with status 1 as soon as severity score exceeds N, without rendering report")
+    parser.add_argument("--baseline", metavar="FILE", help="Baseline of accepted findings; only findings absent from it are reported")
+    parser.add_argument("--update-baseline", action="store_true", help="Write findings of this run to --baseline instead of filtering by it")
+    parser.add_argument("--history", metavar="DB", help="SQLite findings history store to record this run in")
+    parser.add_argument("--history-label", help="Label recorded with run in history store (e.g. commit hash)")
+    parser.add_argument("--history-query", choices=["new", "fixed", "top-rules", "trend"], help="Query history store given by --history and print JSON")
     args = parser.parse_args()
+    try:
+        args.fields = parse_fields(args.fields) if args.fields else (MINIMAL_FIELDS if args.format == "minimal" else None)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.fields is not None and args.format in ("html", "html-large"):
+        parser.error("--fields requires json, csv or minimal format")
 
     if args.run_tests:
         print("Running unit tests...")
         run_tests()
         print("Unit tests completed.")
 
+    # Gating answers pass/fail with early exit, so no report is generated
+    if args.fail_on or args.max_score is not None:
+        if not (args.sql_file or args.query or args.diff or args.git_range):
+            parser.error("--fail-on and --max-score require sql_file, --query, --diff or --git-range")
+        sys.exit(run_gate(args))
+
     # Check if we need to generate a report
-    if args.sql_file or args.query:
+    if args.history_query:
+        if not args.history:
+            parser.error("--history-query requires --history")
+        print(json.dumps(query_history(args.history, args.history_query), indent=2))
+    elif args.watch:
+        watch(args.watch, create_scanner(args), debounce=args.debounce)
+    elif args.stream:
+        streaming = StreamingScanner(create_scanner(args), sampling=args.sample, sample_size=args.sample_size,
+                                     sample_rate=args.sample_rate, top_k=args.top_k)
+        if args.stream == "-":
+            stream(sys.stdin, streaming, interval=args.snapshot_interval)
+        else:
+            with open(args.stream, 'r') as f:
+                stream(f, streaming, interval=args.snapshot_interval)
+    elif args.embedded:
+        embedded = extract_tree(args.embedded, args.workers)
+        scanner = create_scanner(args, '\n'.join(item.sql for item in embedded))
+        findings = scan_embedded(scanner, embedded)
+        print(f"Scanned {len(embedded)} embedded SQL string(s)", file=sys.stderr)
+
+        record_history(args, findings)
+        findings = filter_baseline(args, findings)
+
+        report_data = generate_findings_report_data(scanner, findings, fields=args.fields)
+        add_index_advice(report_data, args, scanner, (item.sql for item in embedded))
+        write_report(report_data, args)
+    elif args.workload:
+        scanner = create_scanner(args)
+        findings = WorkloadAnalyzer(window=args.workload_window, source=args.workload).analyze(read_workload(args.workload))
+        print(f"Analyzed workload {args.workload}", file=sys.stderr)
+
+        record_history(args, findings)
+        findings = filter_baseline(args, findings)
+
+        report_data = generate_findings_report_data(scanner, findings, fields=args.fields)
+        # Every logged execution counts, so frequent statements weigh more; log is read again rather than held in memory
+        add_index_advice(report_data, args, scanner, (event.sql for event in read_workload(args.workload)))
+        write_report(report_data, args)
+    elif args.diff or args.git_range:
+        if args.diff:
+            with open(args.diff, 'r') as f:
+                diff_text = f.read()
+        else:
+            diff_text = git_diff(args.git_range, args.repo_root)
+
+        scanner = create_scanner(args, diff_text)
+        findings, scanned_files = scan_diff(scanner, diff_text, args.repo_root)
+        print(f"Scanned changed statements in {len(scanned_files)} file(s)", file=sys.stderr)
+
+        record_history(args, findings)
+        findings = filter_baseline(args, findings)
+
+        plan_evidence = None
+        if args.verify_plans:
+            findings, plan_evidence = verify_findings(PlanVerifier.from_file(args.verify_plans), findings, args.repo_root)
+
+        report_data = generate_findings_report_data(scanner, findings, plan_evidence=plan_evidence, fields=args.fields)
+        if args.sort_by == "cost":
+            add_finding_costs(report_data, create_cost_model(args), findings, args.repo_root, include_costs=args.fields is None)
+        write_report(report_data, args)
+    elif args.sql_file or args.query:
         sql: str = get_sql_input(args)
+        if args.fix or args.patch:
+            sql = apply_rewrites(args, sql)
 
-        scanner = SQLAntipatternScanner()
-        issues: List[Tuple[Any, str, str]] = scanner.scan_sql(sql)
-        
-        report_data: dict = generate_report_data(scanner, issues, sql)
+        scanner = create_scanner(args, sql)
+        result = scanner.scan(sql)
+        issues: List[Tuple[Any, str, str]] = result.issues
+        source = args.sql_file or "<query>"
+        findings = locate_findings(issues, sql, source)
+        record_history(args, findings)
+        if args.baseline:
+            findings = filter_baseline(args, findings, {source: sql})
+            issues = [(finding.antipattern, finding.offending_sql, finding.context) for finding in findings]
 
-        report_generator = ReportGenerator()
-        report: str = generate_report(report_generator, report_data, args.format)
+        plan_evidence = None
+        if args.verify_plans:
+            ranked = rank_issues(issues, PlanVerifier.from_file(args.verify_plans).verify(sql, issues))
+            issues = [issue for issue, _ in ranked]
+            plan_evidence = [evidence for _, evidence in ranked]
+        
+        report_data: dict = generate_report_data(scanner, issues, sql, result.partial_reasons, plan_evidence,
+                                                 args.fields, source)
+        if args.sort_by == "cost":
+            # Issues may have been filtered or reordered since they were located
+            add_finding_costs(report_data, create_cost_model(args), locate_findings(issues, sql, source),
+                              args.repo_root, {source: sql}, args.fields is None)
+        add_index_advice(report_data, args, scanner, (statement.text for statement in split_statements(sql)))
 
-        output_report(report, args.output, args.format)
+        write_report(report_data, args)
     elif not args.run_tests:
         parser.print_help()
 
+def gate_inputs(args: argparse.Namespace) -> Iterator[Tuple[str, str, Optional[List[StatementSpan]]]]:
+    """
+    Read inputs to gate lazily, so evaluation can stop before later files are read.
+
+    :param args: Parsed command-line arguments
+    :return: Iterator of (file path, contents, statements to check or None for all)
+    """
+    if args.diff or args.git_range:
+        if args.diff:
+            with open(args.diff, 'r') as f:
+                diff_text = f.read()
+        else:
+            diff_text = git_diff(args.git_range, args.repo_root)
+        for path, lines in sorted(parse_unified_diff(diff_text).items()):
+            full_path = os.path.join(args.repo_root, path)
+            if not path.endswith('.sql') or not os.path.isfile(full_path):
+                continue
+            with open(full_path, 'r') as f:
+                sql = f.read()
+            yield path, sql, changed_statements(split_statements(sql), lines)
+    elif args.query:
+        yield "<query>", args.query, None
+    elif os.path.isdir(args.sql_file):
+        for path in source_files(args.sql_file, ('.sql',)):
+            with open(path, 'r') as f:
+                yield path, f.read(), None
+    else:
+        with open(args.sql_file, 'r') as f:
+            yield args.sql_file, f.read(), None
+
+def run_gate(args: argparse.Namespace) -> int:
+    """
+    Evaluate --fail-on / --max-score gate, stopping at first statement that breaches it.
+
+    :param args: Parsed command-line arguments
+    :return: Exit status: 1 if gate is breached, 0 otherwise
+    """
+    baseline = Baseline.load(args.baseline) if args.baseline and not args.update_baseline else None
+    evaluator = GateEvaluator(create_scanner(args, args.query or ""), Gate(args.fail_on, args.max_score), baseline)
+    breach = evaluator.check_files(gate_inputs(args))
+    if breach is not None:
+        print(f"Gate failed: {breach.antipattern.name} ({breach.antipattern.severity}) at {breach.file}:{breach.line}, "
+              f"score {breach.score}")
+        return 1
+    print(f"Gate passed: {evaluator.statements} statement(s), score {evaluator.score}")
+    return 0
+
+def shard_main(argv: List[str]) -> int:
+    """
+    Run sharded scan subcommand: shard, scan-shard or merge.
+
+    :param argv: Subcommand and its arguments
+    :return: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="sql_antipattern_scanner", description="Sharded SQL Antipattern Scanner")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    shard_parser = subparsers.add_parser("shard", help="Split SQL files into shards balanced by bytes and write manifest")
+    shard_parser.add_argument("inputs", nargs='+', help="SQL files or directories to shard")
+    shard_parser.add_argument("--shards", type=int, required=True, help="Number of shards")
+    shard_parser.add_argument("--manifest", default="manifest.json", help="Manifest output path (default: manifest.json)")
+    shard_parser.add_argument("--root", default=".", help="Directory to record paths relative to (default: .)")
+    shard_parser.add_argument("--max-unit-bytes", type=int, default=64 * 1024 * 1024, help="Split files larger than this between statements (default: 64 MiB)")
+    scan_parser = subparsers.add_parser("scan-shard", help="Scan one shard of manifest and write compact partial result")
+    scan_parser.add_argument("manifest", help="Manifest written by shard")
+    scan_parser.add_argument("--shard", type=int, required=True, help="Index of shard to scan")
+    scan_parser.add_argument("--output", required=True, help="Partial result output path")
+    scan_parser.add_argument("--root", help="Directory manifest paths are relative to (default: root recorded in manifest)")
+    add_scanner_arguments(scan_parser)
+    scan_parser.set_defaults(watch=None, fields=None, baseline=None)
+    merge_parser = subparsers.add_parser("merge", help="Merge partial results of all shards into one report")
+    merge_parser.add_argument("partials", nargs='+', help="Partial results written by scan-shard")
+    merge_parser.add_argument("--format", choices=["json", "csv", "html", "html-large", "minimal"], default="json", help="Output format (default: json)")
+    merge_parser.add_argument("--output", help="Output file path (directory for html-large, default: report)")
+    merge_parser.add_argument("--fields", help="Comma-separated report fields to include, for json, csv and minimal formats")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "shard":
+            manifest = ShardManifest.build(args.inputs, args.shards, args.root, args.max_unit_bytes)
+            manifest.save(args.manifest)
+            sizes = ', '.join(str(sum(unit.length for unit in shard)) for shard in manifest.shards)
+            print(f"Wrote {len(manifest.shards)} shard(s) to {args.manifest} (bytes: {sizes})")
+        elif args.command == "scan-shard":
+            partial = scan_shard(create_scanner(args), ShardManifest.load(args.manifest), args.shard, args.root)
+            save_partial(partial, args.output)
+            print(f"Scanned shard {args.shard}: {partial['statements']} statement(s), {len(partial['findings'])} finding(s)")
+        else:
+            args.fields = parse_fields(args.fields) if args.fields else (MINIMAL_FIELDS if args.format == "minimal" else None)
+            if args.fields is not None and args.format in ("html", "html-large"):
+                raise ValueError("--fields requires json, csv or minimal format")
+            merged = merge_partials([load_partial(path) for path in args.partials])
+            print(f"Merged {merged.shards} shard(s): {merged.statements} statement(s)", file=sys.stderr)
+            report_data = generate_findings_report_data(SQLAntipatternScanner(), merged.findings, fields=args.fields)
+            report_data["severity_score"] = merged.severity_score
+            report_data["statements"] = merged.statements
+            write_report(report_data, args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+def create_scanner(args: argparse.Namespace, sql: str = "") -> SQLAntipatternScanner:
+    """
+    Create scanner configured from command-line arguments.
+
+    :param args: Parsed command-line arguments
+    :param sql: SQL to be scanned, used to detect dialect when '--dialect auto' is given
+    :return: Configured CompiledScanner instance, safe to share between threads
+    """
+    dialect = args.dialect
+    if dialect == "auto":
+        dialect = detect_directory_dialect(args.watch) if args.watch else detect_dialect(sql)
+    builder = (ScannerBuilder().dialect(dialect)
+               .limits(max_bytes=args.max_bytes, max_tokens=args.max_tokens, max_depth=args.max_depth, timeout=args.timeout)
+               .schema_catalog(SchemaCatalog.load(args.schema) if args.schema else None)
+               # Contexts are skipped when report leaves them out, unless baseline keys findings by them
+               .include_context(args.fields is None or "context" in args.fields or bool(args.baseline))
+               .load_custom_antipatterns())
+    for path in args.rule_pack:
+        builder.add_rule_pack(load_rule_pack(path))
+    if args.discover_rule_packs:
+        for rule_pack in discover_rule_packs():
+            builder.add_rule_pack(rule_pack)
+    return builder.build()
+
+def apply_rewrites(args: argparse.Namespace, sql: str) -> str:
+    """
+    Apply mechanical rewrites requested by --fix or --patch.
+
+    :param args: Parsed command-line arguments
+    :param sql: SQL read from sql_file or --query
+    :return: SQL to scan: rewritten with --fix, unchanged with --patch
+    """
+    engine = RewriteEngine()
+    if args.patch:
+        print(engine.patch(sql, args.sql_file or "query.sql"), end="")
+        return sql
+    result = engine.rewrite(sql)
+    if args.sql_file and not args.query:
+        if result.edits:
+            with open(args.sql_file, 'w') as f:
+                f.write(result.text)
+        print(f"Applied {len(result.edits)} rewrite(s) to {args.sql_file}", file=sys.stderr)
+    else:
+        print(result.text)
+    return result.text
+
+def create_cost_model(args: argparse.Namespace) -> CostModel:
+    """
+    Create cost model, using row counts of schema catalog as table-size hints if given.
+
+    :param args: Parsed command-line arguments
+    :return: CostModel instance
+    """
+    return CostModel.from_catalog(SchemaCatalog.load(args.schema)) if args.schema else CostModel()
+
+def add_finding_costs(report_data: dict, model: CostModel, findings: List[Finding], repo_root: str = ".",
+                      sources: Optional[Dict[str, str]] = None, include_costs: bool = True) -> None:
+    """
+    Add estimated cost of enclosing statement to issues and order them most expensive first.
+
+    :param report_data: Report data built from findings, issues in same order as findings
+    :param model: CostModel instance
+    :param findings: Located findings
+    :param repo_root: Directory finding paths are relative to
+    :param sources: SQL text by file path, for findings of text not read from disk
+    :param include_costs: Whether to add estimated_cost and cost_factors to issues; projected
+                          reports (--fields or minimal format) are only ordered by cost
+    """
+    issues = report_data["issues"]
+    costs = []
+    for issue, estimate in zip(issues, estimate_findings(model, findings, repo_root, sources)):
+        costs.append(estimate.cost if estimate else None)
+        if include_costs:
+            issue["estimated_cost"] = estimate.cost if estimate else None
+            issue["cost_factors"] = estimate.factors if estimate else []
+    order = sorted(range(len(costs)), key=lambda index: -(costs[index] or 0))
+    report_data["issues"] = [issues[index] for index in order]
+
+def filter_baseline(args: argparse.Namespace, findings: List[Finding],
+                    sources: Optional[Dict[str, str]] = None) -> List[Finding]:
+    """
+    Write baseline of findings with --update-baseline, or drop findings accepted by --baseline.
+
+    :param args: Parsed command-line arguments
+    :param findings: Findings of this run
+    :param sources: SQL text by file path, for findings of text not read from disk
+    :return: Findings to report
+    """
+    if not args.baseline:
+        return findings
+    if args.update_baseline:
+        Baseline.from_findings(findings, args.repo_root, sources).save(args.baseline)
+        print(f"Wrote baseline of {len(findings)} finding(s) to {args.baseline}", file=sys.stderr)
+        return findings
+    new = Baseline.load(args.baseline).new_findings(findings, args.repo_root, sources)
+    print(f"Suppressed {new.count(False)} baseline finding(s)", file=sys.stderr)
+    return [finding for finding, is_new in zip(findings, new) if is_new]
+
+def record_history(args: argparse.Namespace, findings: List[Finding]) -> None:
+    """
+    Record findings in history store if one was requested.
+
+    :param args: Parsed command-line arguments
+    :param findings: Findings of this run
+    """
+    if not args.history:
+        return
+    store = FindingsStore(args.history)
+    try:
+        run_id = store.record_run(findings, label=args.history_label)
+    finally:
+        store.close()
+    print(f"Recorded run {run_id} in {args.history}", file=sys.stderr)
+
+def query_history(path: str, query: str) -> List[dict]:
+    """
+    Run named query against history store.
+
+    :param path: Path to history store
+    :param query: Query name ('new', 'fixed', 'top-rules' or 'trend')
+    :return: List of result rows
+    """
+    store = FindingsStore(path)
+    try:
+        if query == "new":
+            return store.new_findings()
+        elif query == "fixed":
+            return store.fixed_findings()
+        elif query == "top-rules":
+            return store.top_rules_by_file()
+        return store.trend()
+    finally:
+        store.close()
+
 def get_sql_input(args: argparse.Namespace) -> str:
     """
     Get SQL input from file or command-line argument.
@@ -51,65 +448,168 @@ def get_sql_input(args: argparse.Namespace) -> str:
     :raises argparse.ArgumentTypeError: If neither sql_file nor query is provided
     """
     if args.sql_file:
-        print(f"Scanning SQL file: {args.sql_file}")
+        print(f"Scanning SQL file: {args.sql_file}", file=sys.stderr)
         with open(args.sql_file, 'r') as f:
             return f.read()
     elif args.query:
-        print("Scanning SQL query")
+        print("Scanning SQL query", file=sys.stderr)
         return args.query
     else:
         raise argparse.ArgumentTypeError("Either sql_file or --query must be specified")
 
-def generate_report_data(scanner: SQLAntipatternScanner, issues: List[Tuple[Any, str, str]], sql: str) -> dict:
+def verify_findings(verifier: PlanVerifier, findings: List[Finding], repo_root: str = ".") -> Tuple[List[Finding], List[Optional[PlanEvidence]]]:
+    """
+    Verify located findings against query plans and order them for triage.
+
+    :param verifier: PlanVerifier instance
+    :param findings: List of located findings
+    :param repo_root: Directory finding paths are relative to
+    :return: Tuple of ranked findings and their plan evidence
+    """
+    by_file: Dict[str, List[int]] = {}
+    for index, finding in enumerate(findings):
+        by_file.setdefault(finding.file, []).append(index)
+    items = []
+    for path, indexes in by_file.items():
+        with open(os.path.join(repo_root, path), 'r') as f:
+            sql = f.read()
+        items.append((sql, [(findings[i].antipattern, findings[i].offending_sql, findings[i].context) for i in indexes]))
+    evidence: List[Optional[PlanEvidence]] = [None] * len(findings)
+    for indexes, file_evidence in zip(by_file.values(), verifier.verify_batch(items)):
+        for index, item in zip(indexes, file_evidence):
+            evidence[index] = item
+    ranked = rank_issues(list(range(len(findings))), evidence, key=lambda index: findings[index].antipattern.severity)
+    return [findings[index] for index, _ in ranked], [item for _, item in ranked]
+
+def generate_report_data(scanner: SQLAntipatternScanner, issues: List[Tuple[Any, str, str]], sql: str,
+                         partial_reasons: Optional[List[str]] = None,
+                         plan_evidence: Optional[List[Optional[PlanEvidence]]] = None,
+                         fields: Optional[Sequence[str]] = None, file: str = "<query>") -> dict:
     """
     Generate report data from scanner results.
 
+    Fields not requested are not computed: original SQL is only reindented for 'original_sql',
+    and issues are only located in SQL for 'file' or 'line'.
+
     :param scanner: SQLAntipatternScanner instance
     :param issues: List of detected issues
     :param sql: Original SQL query
+    :param partial_reasons: Resource limits that made scan partial, if any
+    :param plan_evidence: Query plan evidence of issues, in same order as issues, if plans were verified
+    :param fields: Report fields to include (see REPORT_FIELDS), or None for all but location
+    :param file: File path recorded on issues when location is requested
     :return: Dictionary containing report data
     """
-    return {
+    if fields is not None and ('file' in fields or 'line' in fields):
+        entries = [issue_entry(finding.antipattern, finding.offending_sql, finding.context, fields, file=finding.file, line=finding.line)
+                   for finding in locate_findings(issues, sql, file)]
+    else:
+        entries = [issue_entry(ap, offending_sql, context, fields) for ap, offending_sql, context in issues]
+    report_data = {
         "total_issues": len(issues),
         "severity_score": scanner.get_severity_score(issues),
+        "issues": entries,
+    }
+    if fields is None or 'original_sql' in fields:
+        report_data["original_sql"] = sqlparse.format(sql, reindent=True, keyword_case='upper') if not partial_reasons else sql
+    if partial_reasons:
+        report_data["partial"] = True
+        report_data["partial_reasons"] = partial_reasons
+    if plan_evidence is not None and (fields is None or 'plan_evidence' in fields):
+        for issue, evidence in zip(report_data["issues"], plan_evidence):
+            issue["plan_evidence"] = evidence_dict(evidence)
+    return report_data
+
+def generate_findings_report_data(scanner: SQLAntipatternScanner, findings: List[Finding], original_sql: str = "",
+                                  plan_evidence: Optional[List[Optional[PlanEvidence]]] = None,
+                                  fields: Optional[Sequence[str]] = None) -> dict:
+    """
+    Generate report data from findings located in files.
+
+    :param scanner: SQLAntipatternScanner instance
+    :param findings: List of located findings
+    :param original_sql: SQL to include in report, if any
+    :param plan_evidence: Query plan evidence of findings, in same order as findings, if plans were verified
+    :param fields: Report fields to include (see REPORT_FIELDS), or None for all
+    :return: Dictionary containing report data
+    """
+    issues = [(finding.antipattern, finding.offending_sql, finding.context) for finding in findings]
+    report_data = {
+        "total_issues": len(findings),
+        "severity_score": scanner.get_severity_score(issues),
         "issues": [
-            {
-                "name": ap.name,
-                "severity": ap.severity,
-                "description": ap.description,
-                "suggestion": ap.suggestion,
-                "offending_sql": offending_sql,
-                "context": context,
-                "remediation": ap.remediation
-            }
-            for ap, offending_sql, context in issues
+            issue_entry(finding.antipattern, finding.offending_sql, finding.context, fields, file=finding.file, line=finding.line)
+            for finding in findings
         ],
-        "original_sql": sqlparse.format(sql, reindent=True, keyword_case='upper')
     }
+    if fields is None or 'original_sql' in fields:
+        report_data["original_sql"] = original_sql
+    if plan_evidence is not None and (fields is None or 'plan_evidence' in fields):
+        for issue, evidence in zip(report_data["issues"], plan_evidence):
+            issue["plan_evidence"] = evidence_dict(evidence)
+    return report_data
 
-def generate_report(report_generator: ReportGenerator, report_data: dict, format: str) -> str:
+def generate_report(report_generator: ReportGenerator, report_data: dict, format: str,
+                    fields: Optional[Sequence[str]] = None) -> str:
     """
     Generate report in specified format.
 
     :param report_generator: ReportGenerator instance
     :param report_data: Dictionary containing report data
-    :param format: Desired output format ('json', 'csv', or 'html')
+    :param format: Desired output format ('json', 'csv', 'html' or 'minimal')
+    :param fields: Report fields requested with --fields, which CSV writes as its columns, or None
     :return: Generated report as string
     :raises ValueError: If an unsupported format is specified
     """
     if format == 'json':
         return report_generator.generate_json(report_data)
     elif format == 'csv':
-        return report_generator.generate_csv(report_data)
+        return report_generator.generate_csv(report_data, fields)
     elif format == 'html':
         return report_generator.generate_html(report_data)
+    elif format == 'minimal':
+        return report_generator.generate_minimal(report_data)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
+def add_index_advice(report_data: dict, args: argparse.Namespace, scanner: SQLAntipatternScanner, statements: Iterable[str]) -> None:
+    """
+    Add index recommendations to report data when requested by --advise-indexes.
+
+    :param report_data: Dictionary containing report data
+    :param args: Parsed command-line arguments
+    :param scanner: Scanner whose dialect and schema catalog are used
+    :param statements: Scanned SQL statements, one entry per execution when read from logs
+    """
+    if not args.advise_indexes:
+        return
+    advisor = IndexAdvisor(scanner.schema_checks.catalog if scanner.schema_checks is not None else None, scanner.dialect)
+    for sql in statements:
+        # Trees of statements scanned moments ago come from scanner's parse cache
+        advisor.add(sql, parsed=scanner.parse(sql))
+    report_data["index_recommendations"] = advisor.report(args.advise_limit)
+
+def write_report(report_data: dict, args: argparse.Namespace) -> None:
+    """
+    Render report in requested format and write it to --output or console.
+
+    :param report_data: Dictionary containing report data
+    :param args: Parsed command-line arguments
+    """
+    report_generator = ReportGenerator()
+    if args.format == 'html-large':
+        path = report_generator.write_large_html(report_data, args.output or "report")
+        print(f"Report written to {path}", file=sys.stderr)
+        return
+    report: str = generate_report(report_generator, report_data, args.format, args.fields)
+    output_report(report, args.output, args.format)
+
 def output_report(report: str, output_file: Optional[str], format: str) -> None:
     """
     Output generated report to file or console.
 
+    Only report itself goes to stdout; status messages go to stderr, so output can be piped.
+
     :param report: Generated report as string
     :param output_file: Path to output file (if specified)
     :param format: Report format ('json', 'csv', or 'html')
@@ -118,9 +618,12 @@ def output_report(report: str, output_file: Optional[str], format: str) -> None:
         mode = 'w' if format != 'csv' else 'w'
         with open(output_file, mode, newline='') as f:
             f.write(report)
-        print(f"Report written to {output_file}")
+        print(f"Report written to {output_file}", file=sys.stderr)
+    elif format == 'minimal':
+        # Machine output goes to console as-is, one issue per line
+        print(report, end='')
     else:
-        print("Scan report:")
+        print("Scan report:", file=sys.stderr)
         print(report)
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/compiled_scanner.py
+import re
+import json
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
+from sql_antipattern_scanner.dialects import validate_dialect, dialect_antipatterns
+from sql_antipattern_scanner.rule_packs import CompiledRulePack
+from sql_antipattern_scanner.schema_catalog import SchemaCatalog, SchemaAwareChecks
+from sql_antipattern_scanner.sql_antipattern_scanner import Antipattern, SQLAntipatternScanner, ScanResult
+
+
+class CompiledScanner(SQLAntipatternScanner):
+    """
+    Frozen scanner produced by ScannerBuilder.
+
+    Rules, rule packs and ignored names are held in tuples and frozensets, regexes are
+    compiled once, and scan results are returned as tuples, so instance has no mutable
+    state besides its own thread-safe result cache. It can be shared by any number of
+    threads. Per-tenant variants are cheap: builder() returns ScannerBuilder preloaded
+    with this configuration, which reuses compiled rules rather than copying them.
+    """
+
+    def __init__(self, dialect: Optional[str], patterns: Tuple[Tuple[re.Pattern, Antipattern], ...],
+                 custom_patterns: Tuple[Tuple[re.Pattern, Antipattern], ...], source_rule_packs: Tuple[CompiledRulePack, ...], ignored_patterns: FrozenSet[str],
+                 schema_catalog: Optional[SchemaCatalog], limits: Dict[str, Optional[float]],
+                 literal_run_threshold: Optional[int], cache_size: int, include_context: bool = True):
+        """
+        Initialize CompiledScanner. Use ScannerBuilder.build rather than calling this directly.
+
+        :param dialect: Validated dialect name, or None
+        :param patterns: Regex rules of dialect
+        :param custom_patterns: Custom regex rules, kept apart so derived builders can change dialect
+        :param source_rule_packs: Rule packs as added to builder, before restriction to dialect
+        :param ignored_patterns: Names of rules to skip
+        :param schema_catalog: SchemaCatalog for schema-aware checks, or None; must not be modified afterwards
+        :param limits: Resource limits: max_bytes, max_tokens, max_depth and timeout
+        :param literal_run_threshold: Minimum length of literal runs to collapse, or None
+        :param cache_size: Number of recent scan results and parse trees to cache
+        :param include_context: Whether to cut context around each issue
+        """
+        set_attribute = object.__setattr__
+        set_attribute(self, 'dialect', dialect)
+        set_attribute(self, 'patterns', patterns + custom_patterns)
+        set_attribute(self, 'custom_patterns', custom_patterns)
+        set_attribute(self, 'source_rule_packs', source_rule_packs)
+        set_attribute(self, 'rule_packs', tuple(rule_pack.for_dialect(dialect) for rule_pack in source_rule_packs))
+        set_attribute(self, 'ignored_patterns', ignored_patterns)
+        set_attribute(self, 'schema_catalog', schema_catalog)
+        set_attribute(self, 'schema_checks', SchemaAwareChecks(schema_catalog) if schema_catalog is not None else None)
+        for name in ('max_bytes', 'max_tokens', 'max_depth', 'timeout'):
+            set_attribute(self, name, limits.get(name))
+        set_attribute(self, 'literal_run_threshold', literal_run_threshold)
+        set_attribute(self, 'cache_size', cache_size)
+        set_attribute(self, 'include_context', include_context)
+        set_attribute(self, 'scan', lru_cache(maxsize=cache_size)(self._scan))
+        set_attribute(self, 'parse', lru_cache(maxsize=cache_size)(self._parse))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"CompiledScanner is immutable; use builder() to derive a scanner with '{name}' changed")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("CompiledScanner is immutable")
+
+    def _scan(self, sql: str) -> ScanResult:
+        """
+        Scan SQL query, returning immutable result that can be shared between threads through cache.
+
+        :param sql: SQL query to scan
+        :return: ScanResult with tuples of issues and partial-scan reasons
+        """
+        result = super()._scan(sql)
+        return ScanResult(tuple(result.issues), tuple(result.partial_reasons))
+
+    def scan_sql(self, sql: str) -> List[Tuple[Antipattern, str, str]]:
+        """
+        Scan SQL query for antipatterns.
+
+        :param sql: SQL query to scan
+        :return: New list of tuples containing antipattern, offending SQL, and context
+        """
+        return list(self.scan(sql).issues)
+
+    def _frozen(self, *args) -> None:
+        """
+        Reject configuration changes.
+
+        :raises TypeError: Always
+        """
+        raise TypeError("CompiledScanner is immutable; configure rules with ScannerBuilder")
+
+    load_custom_antipatterns = add_pattern = add_rule_pack = ignore_pattern = _frozen
+
+    def builder(self) -> 'ScannerBuilder':
+        """
+        Create builder preloaded with configuration of this scanner, for deriving variants.
+
+        :return: ScannerBuilder instance
+        """
+        builder = ScannerBuilder()
+        builder._dialect = self.dialect
+        builder._base_patterns = self.patterns[:len(self.patterns) - len(self.custom_patterns)]
+        builder._extra_patterns = list(self.custom_patterns)
+        builder._rule_packs = list(self.source_rule_packs)
+        builder._ignored = set(self.ignored_patterns)
+        builder._schema_catalog = self.schema_catalog
+        builder._limits = {name: getattr(self, name) for name in ('max_bytes', 'max_tokens', 'max_depth', 'timeout')}
+        builder._literal_run_threshold = self.literal_run_threshold
+        builder._cache_size = self.cache_size
+        builder._include_context = self.include_context
+        return builder
+
+
+class ScannerBuilder:
+    """
+    Collect scanner configuration and build frozen CompiledScanner from it.
+
+    Builder methods return builder itself, so calls can be chained:
+
+        scanner = ScannerBuilder().dialect('postgres').ignore('SELECT *').build()
+
+    Builders are not thread-safe; configure in one thread, then share built scanner.
+    """
+
+    def __init__(self):
+        """
+        Initialize builder with default configuration: generic rules, no limits, no custom rules.
+        """
+        self._dialect: Optional[str] = None
+        # Rules of dialect, set by dialect() and reused as-is by clones
+        self._base_patterns: Optional[Tuple[Tuple[re.Pattern, Antipattern], ...]] = None
+        self._extra_patterns: List[Tuple[re.Pattern, Antipattern]] = []
+        self._rule_packs: List[CompiledRulePack] = []
+        self._ignored: set = set()
+        self._schema_catalog: Optional[SchemaCatalog] = None
+        self._limits: Dict[str, Optional[float]] = {}
+        self._literal_run_threshold: Optional[int] = 1024
+        self._cache_size = 100
+        self._include_context = True
+
+    def dialect(self, dialect: Optional[str]) -> 'ScannerBuilder':
+        """
+        Set SQL dialect.
+
+        :param dialect: Dialect name, or None for generic rules only
+        :return: This builder
+        :raises ValueError: If unsupported dialect is specified
+        """
+        dialect = validate_dialect(dialect)
+        if dialect != self._dialect:
+            self._dialect = dialect
+            self._base_patterns = None
+        return self
+
+    def limits(self, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None,
+               max_depth: Optional[int] = None, timeout: Optional[float] = None) -> 'ScannerBuilder':
+        """
+        Set resource limits per statement, as for SQLAntipatternScanner.
+
+        :param max_bytes: Maximum statement size in bytes to parse and scan in full
+        :param max_tokens: Maximum estimated number of tokens to parse
+        :param max_depth: Maximum parenthesis nesting depth to parse
+        :param timeout: Wall time budget per statement in seconds
+        :return: This builder
+        """
+        self._limits = {'max_bytes': max_bytes, 'max_tokens': max_tokens, 'max_depth': max_depth, 'timeout': timeout}
+        return self
+
+    def literal_run_threshold(self, threshold: Optional[int]) -> 'ScannerBuilder':
+        """
+        Set minimum length of literal runs collapsed before scanning.
+
+        :param threshold: Length in characters, or None to disable collapsing
+        :return: This builder
+        """
+        self._literal_run_threshold = threshold
+        return self
+
+    def schema_catalog(self, catalog: Optional[SchemaCatalog]) -> 'ScannerBuilder':
+        """
+        Set schema catalog for schema-aware checks.
+
+        :param catalog: SchemaCatalog instance, or None for syntactic checks only
+        :return: This builder
+        """
+        self._schema_catalog = catalog
+        return self
+
+    def add_pattern(self, pattern: re.Pattern, antipattern: Antipattern) -> 'ScannerBuilder':
+        """
+        Add regex rule.
+
+        :param pattern: Compiled regex pattern to match antipattern
+        :param antipattern: Antipattern namedtuple describing antipattern
+        :return: This builder
+        """
+        self._extra_patterns.append((pattern, antipattern))
+        return self
+
+    def add_rule_pack(self, rule_pack: CompiledRulePack) -> 'ScannerBuilder':
+        """
+        Add compiled rule pack. Rules limited to other dialects are dropped on build.
+
+        :param rule_pack: CompiledRulePack produced by RulePack.compile or load_rule_pack
+        :return: This builder
+        """
+        self._rule_packs.append(rule_pack)
+        return self
+
+    def ignore(self, *names: str) -> 'ScannerBuilder':
+        """
+        Skip rules by name.
+
+        :param names: Names of rules to skip
+        :return: This builder
+        """
+        self._ignored.update(names)
+        return self
+
+    def load_custom_antipatterns(self, path: str = 'config.json') -> 'ScannerBuilder':
+        """
+        Add custom regex rules from config file, as SQLAntipatternScanner does on creation.
+
+        :param path: Path to config file with 'custom_antipatterns' list; missing file is ignored
+        :return: This builder
+        """
+        try:
+            with open(path, 'r') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return self
+        for pattern in config.get('custom_antipatterns', []):
+            self.add_pattern(re.compile(pattern['regex'], re.IGNORECASE), Antipattern(**pattern['antipattern']))
+        return self
+
+    def cache_size(self, size: int) -> 'ScannerBuilder':
+        """
+        Set number of recent scan results cached by built scanner.
+
+        :param size: Cache size
+        :return: This builder
+        """
+        self._cache_size = size
+        return self
+
+    def include_context(self, enabled: bool) -> 'ScannerBuilder':
+        """
+        Set whether built scanner cuts context around each issue.
+
+        Consumers that only need rule and location can disable it, so statements are not
+        re-serialized for context.
+
+        :param enabled: Whether to include context
+        :return: This builder
+        """
+        self._include_context = enabled
+        return self
+
+    def build(self) -> CompiledScanner:
+        """
+        Build frozen scanner from current configuration. Builder can be reused afterwards.
+
+        :return: CompiledScanner instance
+        """
+        if self._base_patterns is None:
+            self._base_patterns = tuple(DEFAULT_ANTIPATTERNS if self._dialect is None else dialect_antipatterns(self._dialect))
+        return CompiledScanner(
+            self._dialect, self._base_patterns, tuple(self._extra_patterns), tuple(self._rule_packs),
+            frozenset(self._ignored), self._schema_catalog, dict(self._limits), self._literal_run_threshold,
+            self._cache_size, self._include_context)
@@ -0,0 +1,283 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/cost_model.py
+import math
+from collections import OrderedDict, namedtuple
+from typing import Dict, List, Optional, Set, Tuple
+from sqlparse import lexer, tokens as T
+from sql_antipattern_scanner.statements import Finding, finding_statements
+
+# Estimated cost of statement in abstract row operations, with human-readable cost factors
+CostEstimate = namedtuple('CostEstimate', ['cost', 'factors'])
+
+_SKIPPED = (T.Whitespace, T.Newline, T.Comment.Single, T.Comment.Multiline)
+_CLAUSES = {'SELECT', 'FROM', 'WHERE', 'GROUP BY', 'HAVING', 'ORDER BY', 'LIMIT', 'ON', 'USING', 'SET', 'VALUES',
+            'UNION', 'UNION ALL', 'INTERSECT', 'EXCEPT', 'OFFSET', 'FETCH', 'RETURNING', 'WINDOW', 'QUALIFY', 'INTO'}
+_TABLE_INTRODUCERS = {'FROM', 'UPDATE', 'INTO'}
+_NAME_TYPES = (T.Name, T.Literal.String.Symbol)
+
+
+class _Scope:
+    """
+    Structure of one SELECT level: tables, joins, filters, sorts and nested subqueries.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty scope.
+        """
+        # Tables as [name, derived scope or None, conditioned], name empty for derived tables
+        self.tables: List[list] = []
+        self.aliases: Set[str] = set()
+        self.qualifiers: Set[str] = set()
+        self.comma_joins = 0
+        self.joins = 0
+        self.has_where = False
+        self.has_limit = False
+        self.limit: Optional[int] = None
+        self.sort = False
+        self.expression_sort = False
+        self.subqueries: List['_Scope'] = []
+
+    def names(self) -> Set[str]:
+        """
+        Get table names and aliases defined by scope.
+        """
+        return {name for name, _, _ in self.tables if name} | self.aliases
+
+
+def _tokens(sql: str) -> List[Tuple[object, str]]:
+    """
+    Lex statement, dropping whitespace and comments.
+
+    :param sql: SQL statement
+    :return: List of (token type, value) pairs
+    """
+    return [(ttype, value) for ttype, value in lexer.tokenize(sql) if ttype not in _SKIPPED]
+
+
+def _name(value: str) -> str:
+    """
+    Normalize identifier: drop quoting, lower-case.
+
+    :param value: Identifier
+    :return: Bare lower-cased name
+    """
+    return value.strip('"`[]').lower()
+
+
+def _parse_scope(tokens: List[Tuple[object, str]], i: int) -> Tuple[_Scope, int]:
+    """
+    Parse tokens of one SELECT level, recursing into parenthesized subqueries.
+
+    :param tokens: Lexed tokens
+    :param i: Index of first token of scope
+    :return: Tuple of scope and index after its closing parenthesis (or end of statement)
+    """
+    scope = _Scope()
+    clause = None
+    depth = 0
+    expect_table = None
+    while i < len(tokens):
+        ttype, value = tokens[i]
+        upper = ' '.join(value.upper().split())
+        following = tokens[i + 1] if i + 1 < len(tokens) else (None, '')
+        if ttype is T.Punctuation and value == '(':
+            if following[0] in (T.Keyword.DML, T.Keyword.CTE) and following[1].upper() in ('SELECT', 'WITH'):
+                child, i = _parse_scope(tokens, i + 1)
+                if expect_table is not None:
+                    scope.tables.append(['', child, expect_table])
+                    expect_table = None
+                else:
+                    scope.subqueries.append(child)
+                continue
+            depth += 1
+            if clause == 'ORDER BY':
+                scope.expression_sort = True
+        elif ttype is T.Punctuation and value == ')':
+            if depth == 0:
+                return scope, i + 1
+            depth -= 1
+        elif ttype is T.Punctuation and value == ';' and depth == 0:
+            break
+        elif depth > 0:
+            pass
+        elif ttype in T.Keyword and upper.endswith('JOIN'):
+            scope.joins += 1
+            # NATURAL joins are conditioned implicitly, CROSS joins never
+            expect_table = upper.startswith('NATURAL')
+            clause = 'JOIN'
+        elif ttype is T.Keyword.DML or ttype in T.Keyword and upper in _CLAUSES:
+            if upper in ('ON', 'USING') and clause == 'JOIN' and scope.tables:
+                scope.tables[-1][2] = True
+            clause = upper
+            expect_table = False if upper in _TABLE_INTRODUCERS else None
+            if upper == 'WHERE':
+                scope.has_where = True
+            elif upper in ('GROUP BY', 'ORDER BY'):
+                scope.sort = True
+            elif upper in ('LIMIT', 'FETCH'):
+                scope.has_limit = True
+        elif ttype in T.Keyword and upper == 'DISTINCT':
+            scope.sort = True
+        elif ttype is T.Name and upper == 'TOP' and clause == 'SELECT':
+            scope.has_limit = True
+        elif ttype in T.Literal.Number.Integer and scope.has_limit and scope.limit is None:
+            scope.limit = int(value)
+        elif ttype is T.Punctuation and value == ',' and clause == 'LIMIT':
+            # MySQL 'LIMIT offset, count': row count is the number after comma
+            scope.limit = None
+        elif ttype is T.Punctuation and value == ',' and clause == 'FROM':
+            scope.comma_joins += 1
+            expect_table = False
+        elif following == (T.Punctuation, '.') and (ttype in _NAME_TYPES or ttype in T.Keyword):
+            # Qualified name: schema.table in FROM/JOIN, alias.column elsewhere
+            if expect_table is None:
+                scope.qualifiers.add(_name(value))
+            i += 2
+            continue
+        elif expect_table is not None and (ttype in _NAME_TYPES or ttype in T.Keyword):
+            scope.tables.append([_name(value), None, expect_table])
+            expect_table = None
+        elif clause in ('FROM', 'JOIN') and ttype in _NAME_TYPES:
+            scope.aliases.add(_name(value))
+        elif clause == 'ORDER BY' and ttype in T.Operator:
+            scope.expression_sort = True
+        i += 1
+    return scope, len(tokens)
+
+
+class CostModel:
+    """
+    Estimate relative cost of statements from their structure.
+
+    Cost counts abstract row operations: rows scanned from each table (reduced by WHERE
+    and LIMIT), join lookups and fan-out, subqueries (multiplied by outer rows when
+    correlated) and n*log(n) sorts, doubled for sorts on expressions. Row counts come
+    from table-size hints, falling back to default_rows. Estimates of the most recently
+    used cache_size statements are cached.
+    """
+
+    def __init__(self, table_rows: Optional[Dict[str, int]] = None, default_rows: int = 10000,
+                 filter_selectivity: float = 0.1, cache_size: int = 1024):
+        """
+        Initialize CostModel.
+
+        :param table_rows: Estimated row counts by table name
+        :param default_rows: Row count assumed for tables without hint
+        :param filter_selectivity: Fraction of rows assumed to pass WHERE clause
+        :param cache_size: Number of statement estimates to cache
+        """
+        self.table_rows = {_name(name.split('.')[-1]): rows for name, rows in (table_rows or {}).items()}
+        self.default_rows = default_rows
+        self.filter_selectivity = filter_selectivity
+        self.cache_size = cache_size
+        self.cache: 'OrderedDict[str, CostEstimate]' = OrderedDict()
+
+    @classmethod
+    def from_catalog(cls, catalog, default_rows: int = 10000) -> 'CostModel':
+        """
+        Create CostModel with row-count estimates of schema catalog as hints.
+
+        :param catalog: SchemaCatalog instance
+        :param default_rows: Row count assumed for tables without estimate
+        :return: CostModel instance
+        """
+        return cls({name: table.row_count for name, table in catalog.tables.items() if table.row_count is not None}, default_rows)
+
+    def rows(self, table: str) -> int:
+        """
+        Get estimated row count of table.
+
+        :param table: Table name
+        :return: Estimated number of rows
+        """
+        return self.table_rows.get(table, self.default_rows)
+
+    def estimate(self, sql: str) -> CostEstimate:
+        """
+        Estimate cost of first statement of SQL text, using cache.
+
+        :param sql: SQL statement
+        :return: CostEstimate with rounded cost and cost factors
+        """
+        if sql in self.cache:
+            self.cache.move_to_end(sql)
+            return self.cache[sql]
+        tokens = _tokens(sql)
+        start = next((i for i, (ttype, _) in enumerate(tokens) if ttype in (T.Keyword.DML, T.Keyword.CTE)), len(tokens))
+        scope, _ = _parse_scope(tokens, start)
+        factors: List[str] = []
+        cost, _ = self._scope_cost(scope, 0, set(), factors)
+        estimate = self.cache[sql] = CostEstimate(round(cost), factors)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return estimate
+
+    def _scope_cost(self, scope: _Scope, depth: int, outer_names: Set[str], factors: List[str]) -> Tuple[float, float]:
+        """
+        Estimate cost and output rows of scope.
+
+        :param scope: Parsed scope
+        :param depth: Subquery nesting depth of scope
+        :param outer_names: Table names and aliases defined by enclosing scopes
+        :param factors: List cost factors are appended to
+        :return: Tuple of estimated cost and output rows
+        """
+        selectivity = self.filter_selectivity if scope.has_where else 1.0
+        cost = 0.0
+        output = 1.0
+        unconditioned = 0
+        for index, (name, derived, conditioned) in enumerate(scope.tables):
+            if derived is not None:
+                derived_cost, rows = self._scope_cost(derived, depth + 1, set(), factors)
+                cost += derived_cost
+            else:
+                rows = self.rows(name)
+                cost += rows
+                if not scope.has_where and not scope.has_limit:
+                    factors.append(f"unbounded scan of {name}")
+            if index == 0:
+                output = rows * selectivity
+            elif conditioned or scope.has_where:
+                # Conditioned joins look up matches per outer row; comma joins are assumed joined in WHERE
+                cost += output * math.log2(rows + 2)
+            else:
+                unconditioned += 1
+                cost += output * rows
+                output *= rows
+        joins = scope.joins + scope.comma_joins
+        if joins:
+            factors.append(f"{joins} join{'s' if joins > 1 else ''}")
+        if unconditioned:
+            factors.append(f"{unconditioned} join{'s' if unconditioned > 1 else ''} without condition")
+        names = scope.names()
+        for child in scope.subqueries:
+            child_cost, _ = self._scope_cost(child, depth + 1, outer_names | names, factors)
+            if (child.qualifiers - child.names()) & (outer_names | names):
+                factors.append(f"correlated subquery at depth {depth + 1}")
+                cost += max(output, 1.0) * child_cost
+            else:
+                factors.append(f"subquery at depth {depth + 1}")
+                cost += child_cost
+        if scope.sort:
+            sort_cost = output * math.log2(output + 2)
+            if scope.expression_sort:
+                factors.append("sort on expression")
+                sort_cost *= 2
+            cost += sort_cost
+        if scope.limit is not None and not scope.sort:
+            output = min(output, scope.limit)
+        return cost + output, output
+
+
+def estimate_findings(model: CostModel, findings: List[Finding], repo_root: str = ".",
+                      sources: Optional[Dict[str, str]] = None) -> List[Optional[CostEstimate]]:
+    """
+    Estimate cost of statements findings are located in.
+
+    :param model: CostModel instance
+    :param findings: List of located findings
+    :param repo_root: Directory finding paths are relative to
+    :param sources: SQL text by file path, for findings of text not read from disk
+    :return: List of CostEstimate (None if file cannot be read), in same order as findings
+    """
+    return [model.estimate(statement.text) if statement else None for statement in finding_statements(findings, repo_root, sources)]
@@ -0,0 +1,204 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/dialects.py
+import re
+import os
+from typing import Dict, List, Optional, Tuple
+from sql_antipattern_scanner.antipatterns import Antipattern, DEFAULT_ANTIPATTERNS, DIALECT_ANTIPATTERNS
+
+SUPPORTED_DIALECTS = ('mysql', 'postgres', 'sqlite', 'tsql', 'snowflake')
+
+# Default antipatterns that only make sense in some dialects
+ANTIPATTERN_DIALECTS: Dict[str, Tuple[str, ...]] = {
+    "ORDER BY RAND()": ('mysql',),
+}
+
+# Functions that wrap columns in WHERE clauses, common ones plus per-dialect additions
+COMMON_WHERE_FUNCTIONS = ('UPPER', 'LOWER', 'CONCAT', 'DATE', 'SUBSTRING', 'TRIM')
+DIALECT_WHERE_FUNCTIONS: Dict[str, Tuple[str, ...]] = {
+    'mysql': ('DATE_FORMAT', 'IFNULL', 'YEAR', 'MONTH', 'LEFT', 'CAST'),
+    'postgres': ('DATE_TRUNC', 'TO_CHAR', 'COALESCE', 'EXTRACT', 'CAST'),
+    'sqlite': ('STRFTIME', 'IFNULL', 'SUBSTR', 'CAST'),
+    'tsql': ('CONVERT', 'CAST', 'ISNULL', 'DATEPART', 'YEAR', 'LEFT'),
+    'snowflake': ('DATE_TRUNC', 'TO_DATE', 'TO_CHAR', 'IFF', 'COALESCE', 'CAST'),
+}
+
+# Keyword and syntax markers used for dialect detection, weighted by how distinctive they are
+DIALECT_MARKERS: Dict[str, List[Tuple[re.Pattern, int]]] = {
+    'mysql': [
+        (re.compile(r'`\w+`'), 3),
+        (re.compile(r'\bAUTO_INCREMENT\b', re.IGNORECASE), 3),
+        (re.compile(r'\bENGINE\s*=', re.IGNORECASE), 3),
+        (re.compile(r'\bON\s+DUPLICATE\s+KEY\b', re.IGNORECASE), 3),
+        (re.compile(r'\bSQL_CALC_FOUND_ROWS\b', re.IGNORECASE), 3),
+        (re.compile(r'\bLIMIT\s+\d+\s*,\s*\d+', re.IGNORECASE), 2),
+        (re.compile(r'\bRAND\s*\(\)', re.IGNORECASE), 2),
+        (re.compile(r'\bDATE_FORMAT\s*\(', re.IGNORECASE), 2),
+        (re.compile(r'\bIFNULL\s*\(', re.IGNORECASE), 1),
+    ],
+    'postgres': [
+        (re.compile(r'\bSERIAL\b|\bBIGSERIAL\b', re.IGNORECASE), 3),
+        (re.compile(r'\bJSONB\b', re.IGNORECASE), 3),
+        (re.compile(r'\bDISTINCT\s+ON\b', re.IGNORECASE), 3),
+        (re.compile(r'\bCONCURRENTLY\b', re.IGNORECASE), 3),
+        (re.compile(r'\$\d+'), 2),
+        (re.compile(r'::\w+'), 1),
+        (re.compile(r'\bILIKE\b', re.IGNORECASE), 1),
+        (re.compile(r'\bRETURNING\b', re.IGNORECASE), 1),
+        (re.compile(r'\bON\s+CONFLICT\b', re.IGNORECASE), 1),
+    ],
+    'sqlite': [
+        (re.compile(r'\bAUTOINCREMENT\b', re.IGNORECASE), 3),
+        (re.compile(r'\bPRAGMA\b', re.IGNORECASE), 3),
+        (re.compile(r'\bWITHOUT\s+ROWID\b', re.IGNORECASE), 3),
+        (re.compile(r'\bINSERT\s+OR\s+(?:REPLACE|IGNORE)\b', re.IGNORECASE), 3),
+        (re.compile(r'\bSTRFTIME\s*\(', re.IGNORECASE), 2),
+        (re.compile(r'\bGLOB\b', re.IGNORECASE), 2),
+        (re.compile(r'\bON\s+CONFLICT\b', re.IGNORECASE), 1),
+    ],
+    'tsql': [
+        (re.compile(r'\bTOP\s*\(?\s*\d+', re.IGNORECASE), 3),
+        (re.compile(r'\bNOLOCK\b', re.IGNORECASE), 3),
+        (re.compile(r'\bGETDATE\s*\(\)', re.IGNORECASE), 3),
+        (re.compile(r'\bNEWID\s*\(\)', re.IGNORECASE), 3),
+        (re.compile(r'^\s*GO\s*$', re.IGNORECASE | re.MULTILINE), 3),
+        (re.compile(r'@@\w+'), 3),
+        (re.compile(r'\[\w+\]'), 2),
+        (re.compile(r'\bNVARCHAR\b', re.IGNORECASE), 1),
+        (re.compile(r'\bISNULL\s*\(', re.IGNORECASE), 1),
+    ],
+    'snowflake': [
+        (re.compile(r'\bQUALIFY\b', re.IGNORECASE), 3),
+        (re.compile(r'\bVARIANT\b', re.IGNORECASE), 3),
+        (re.compile(r'\bLATERAL\s+FLATTEN\b|\bFLATTEN\s*\(', re.IGNORECASE), 3),
+        (re.compile(r'\bCOPY\s+INTO\b', re.IGNORECASE), 3),
+        (re.compile(r'\bCREATE\s+(?:OR\s+REPLACE\s+)?TRANSIENT\b', re.IGNORECASE), 3),
+        (re.compile(r'\bIFF\s*\(', re.IGNORECASE), 2),
+        (re.compile(r'::\w+'), 1),
+        (re.compile(r'\bILIKE\b', re.IGNORECASE), 1),
+    ],
+}
+
+
+def validate_dialect(dialect: Optional[str]) -> Optional[str]:
+    """
+    Normalize and validate dialect name.
+
+    :param dialect: Dialect name or None for generic SQL
+    :return: Lower-cased dialect name or None
+    :raises ValueError: If dialect is not supported
+    """
+    if dialect is None:
+        return None
+    normalized = dialect.lower()
+    if normalized not in SUPPORTED_DIALECTS:
+        raise ValueError(f"Unsupported dialect: {dialect}")
+    return normalized
+
+
+def applies_to_dialect(antipattern_name: str, dialect: Optional[str]) -> bool:
+    """
+    Check whether default antipattern applies to dialect.
+
+    :param antipattern_name: Name of antipattern
+    :param dialect: Dialect name or None for generic SQL
+    :return: True if antipattern should be evaluated
+    """
+    dialects = ANTIPATTERN_DIALECTS.get(antipattern_name)
+    return dialect is None or dialects is None or dialect in dialects
+
+
+def function_in_where_regex(dialect: str) -> re.Pattern:
+    """
+    Build 'Function in WHERE' regex from dialect function table.
+
+    :param dialect: Dialect name
+    :return: Compiled regex
+    """
+    functions = COMMON_WHERE_FUNCTIONS + DIALECT_WHERE_FUNCTIONS.get(dialect, ())
+    return re.compile(r'\b(?:WHERE|AND)\s+(?:.*?\b(?:' + '|'.join(functions) + r')\s*\([^)]*\).*?)+', re.IGNORECASE)
+
+
+def dialect_antipatterns(dialect: str) -> List[Tuple[re.Pattern, Antipattern]]:
+    """
+    Select regex antipatterns relevant to dialect.
+
+    Default antipatterns restricted to other dialects are dropped, dialect keyword
+    tables are substituted into generic rules, and dialect-only antipatterns are added.
+
+    :param dialect: Dialect name
+    :return: List of tuples containing compiled regex and antipattern
+    """
+    patterns = []
+    for pattern, antipattern in DEFAULT_ANTIPATTERNS:
+        if not applies_to_dialect(antipattern.name, dialect):
+            continue
+        if antipattern.name == "Function in WHERE":
+            pattern = function_in_where_regex(dialect)
+        patterns.append((pattern, antipattern))
+    for pattern, antipattern, dialects in DIALECT_ANTIPATTERNS:
+        if dialect in dialects:
+            patterns.append((pattern, antipattern))
+    return patterns
+
+
+def dialect_scores(sql: str) -> Dict[str, int]:
+    """
+    Score SQL text against dialect markers.
+
+    :param sql: SQL text
+    :return: Dictionary mapping dialect name to marker score
+    """
+    scores = {}
+    for dialect, markers in DIALECT_MARKERS.items():
+        scores[dialect] = sum(weight for marker, weight in markers if marker.search(sql))
+    return scores
+
+
+def best_dialect(scores: Dict[str, int]) -> Optional[str]:
+    """
+    Pick dialect with highest score.
+
+    :param scores: Dictionary mapping dialect name to score
+    :return: Dialect name, or None if no markers matched or top score is tied
+    """
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if not ranked or ranked[0][1] == 0 or (len(ranked) > 1 and ranked[0][1] == ranked[1][1]):
+        return None
+    return ranked[0][0]
+
+
+def detect_dialect(sql: str) -> Optional[str]:
+    """
+    Guess dialect of SQL text.
+
+    :param sql: SQL text
+    :return: Dialect name or None if undecided
+    """
+    return best_dialect(dialect_scores(sql))
+
+
+def detect_directory_dialect(root: str, extensions: Tuple[str, ...] = ('.sql',), max_bytes: int = 65536) -> Optional[str]:
+    """
+    Guess dominant dialect of SQL files under directory.
+
+    Each file votes for its own best dialect, so a few large files with many markers
+    cannot outweigh the rest of the tree. Only first max_bytes of each file are read.
+
+    :param root: Directory to search
+    :param extensions: File extensions to consider
+    :param max_bytes: Maximum number of bytes to read per file
+    :return: Dialect name or None if undecided
+    """
+    votes = {dialect: 0 for dialect in SUPPORTED_DIALECTS}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.lower().endswith(extensions):
+                continue
+            try:
+                with open(os.path.join(dirpath, filename), 'r', errors='replace') as f:
+                    sql = f.read(max_bytes)
+            except OSError:
+                continue
+            dialect = detect_dialect(sql)
+            if dialect:
+                votes[dialect] += 1
+    return best_dialect(votes)
@@ -0,0 +1,153 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/diff_scan.py
+import re
+import os
+import subprocess
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import Finding, StatementSpan, split_statements, locate
+
+# Path ends at tab, after which diff -u and patch files put timestamp
+_FILE_HEADER_RE = re.compile(r'^\+\+\+ (?:b/)?([^\t]+?)\s*(?:\t.*)?$')
+_HUNK_HEADER_RE = re.compile(r'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+def parse_unified_diff(diff_text: str) -> Dict[str, Set[int]]:
+    """
+    Extract added or modified lines per file from unified diff.
+
+    Lines deleted without replacement have no new-side line of their own, so lines on both
+    sides of deletion are recorded, and statement that lost e.g. its WHERE line is rescanned.
+
+    :param diff_text: Unified diff, e.g. output of 'git diff' or patch file
+    :return: Dictionary mapping new file path to set of changed 1-based line numbers
+    """
+    changed: Dict[str, Set[int]] = {}
+    current: Optional[Set[int]] = None
+    line_number = 0
+    old_remaining = new_remaining = 0
+    deleted_at: Optional[int] = None
+    for line in diff_text.splitlines():
+        if old_remaining > 0 or new_remaining > 0:
+            # Inside hunk body, so '+++' or '---' prefixes are content rather than headers
+            if line.startswith('+'):
+                if current is not None:
+                    current.add(line_number)
+                line_number += 1
+                new_remaining -= 1
+                deleted_at = None
+            elif line.startswith('-'):
+                old_remaining -= 1
+                deleted_at = line_number
+            elif line.startswith(' ') or line == '':
+                line_number += 1
+                old_remaining -= 1
+                new_remaining -= 1
+            # Deletion not followed by additions ends at context line or end of hunk
+            if deleted_at is not None and (not line.startswith('-') or old_remaining <= 0 and new_remaining <= 0):
+                if current is not None:
+                    current.update(number for number in (deleted_at - 1, deleted_at) if number >= 1)
+                deleted_at = None
+            continue
+        if line.startswith('+++ '):
+            match = _FILE_HEADER_RE.match(line)
+            path = match.group(1) if match else None
+            current = None if path is None or path == '/dev/null' else changed.setdefault(path, set())
+            continue
+        hunk = _HUNK_HEADER_RE.match(line)
+        if hunk:
+            old_remaining = int(hunk.group(1)) if hunk.group(1) is not None else 1
+            new_remaining = int(hunk.group(3)) if hunk.group(3) is not None else 1
+            # Empty new side '+N,0' starts after line N
+            line_number = int(hunk.group(2)) + (1 if new_remaining == 0 else 0)
+    return {path: lines for path, lines in changed.items() if lines}
+
+
+def git_diff(rev_range: str, repo_root: str = '.', paths: Tuple[str, ...] = ()) -> str:
+    """
+    Run local git binary to produce diff for revision range.
+
+    Diff is limited to repo_root, with paths relative to it, so repo_root may be
+    subdirectory of repository.
+
+    :param rev_range: Revision or range understood by 'git diff', e.g. 'origin/main...HEAD'
+    :param repo_root: Repository working directory
+    :param paths: Optional pathspecs limiting diff
+    :return: Unified diff with zero context lines
+    :raises RuntimeError: If git fails
+    """
+    command = ['git', 'diff', '--unified=0', '--no-color', '--no-ext-diff', '--relative', rev_range]
+    if paths:
+        command += ['--'] + list(paths)
+    result = subprocess.run(command, cwd=repo_root, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git diff failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def changed_statements(statements: List[StatementSpan], changed_lines: Set[int]) -> List[StatementSpan]:
+    """
+    Select statements overlapping changed lines.
+
+    :param statements: Statement spans of file
+    :param changed_lines: Changed 1-based line numbers
+    :return: Statements containing at least one changed line
+    """
+    ordered = sorted(changed_lines)
+    selected = []
+    for statement in statements:
+        index = bisect_left(ordered, statement.start_line)
+        if index < len(ordered) and ordered[index] <= statement.end_line:
+            selected.append(statement)
+    return selected
+
+
+def scan_changed_lines(scanner: SQLAntipatternScanner, sql: str, changed_lines: Set[int], file: str = '') -> List[Finding]:
+    """
+    Scan only statements touched by changed lines and report their findings.
+
+    Findings are reported on line of their offending SQL when that line changed. Findings
+    on unchanged lines, such as unbatched write whose WHERE line was edited, and findings
+    that cannot be located are attributed to first changed line of statement.
+
+    :param scanner: SQLAntipatternScanner instance
+    :param sql: Full contents of file
+    :param changed_lines: Changed 1-based line numbers
+    :param file: File path recorded on findings
+    :return: List of findings
+    """
+    findings = []
+    for statement in changed_statements(split_statements(sql), changed_lines):
+        first_changed = min(line for line in changed_lines if statement.start_line <= line <= statement.end_line)
+        for antipattern, offending_sql, context in scanner.scan_sql(statement.text):
+            position = locate(statement.text, offending_sql)
+            line = statement.start_line + statement.text.count('\n', 0, position) if position is not None else first_changed
+            if line not in changed_lines:
+                line = first_changed
+            findings.append(Finding(file, line, antipattern, offending_sql, context))
+    return findings
+
+
+def scan_diff(scanner: SQLAntipatternScanner, diff_text: str, repo_root: str = '.', extensions: Tuple[str, ...] = ('.sql',)) -> Tuple[List[Finding], List[str]]:
+    """
+    Scan changed statements of every SQL file in diff.
+
+    Files are read from working tree, so diff must describe current contents.
+
+    :param scanner: SQLAntipatternScanner instance
+    :param diff_text: Unified diff
+    :param repo_root: Directory diff paths are relative to
+    :param extensions: File extensions to scan
+    :return: Tuple of findings and list of scanned file paths
+    """
+    findings = []
+    scanned = []
+    for path, lines in sorted(parse_unified_diff(diff_text).items()):
+        full_path = os.path.join(repo_root, path)
+        if not path.lower().endswith(extensions) or not os.path.isfile(full_path):
+            continue
+        with open(full_path, 'r') as f:
+            sql = f.read()
+        findings.extend(scan_changed_lines(scanner, sql, lines, path))
+        scanned.append(path)
+    return findings, scanned
@@ -0,0 +1,388 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/embedded_sql.py
+import io
+import os
+import re
+import ast
+import string
+import tokenize
+from bisect import bisect_right
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import Finding, locate
+
+# SQL string found in host source file, line is 1-based line of string literal, and lines is sorted
+# tuple of (offset in sql, 1-based line) entries, one per joined literal part and per line it spans
+EmbeddedSQL = namedtuple('EmbeddedSQL', ['file', 'line', 'sql', 'lines'])
+
+# Interpolated values in templates are replaced by parameter marker, so they parse as single operand
+PLACEHOLDER = '?'
+
+# Statement openings with shape of real SQL, so prose such as "Select an option from the menu" is skipped
+_SQL_RE = re.compile(
+    r'\s*\(?\s*(?:'
+    r"SELECT\s+(?:DISTINCT\s+|ALL\s+|TOP\s+\d+\s+)?(?:\*|\?|CASE\b|\d|'|[\w.\"`\[\]]+\s*(?:\(|,|\*|[-+/|]|\bFROM\b|\bAS\b))"
+    r'|INSERT\s+INTO\b|(?:MERGE|REPLACE|UPSERT)\s+INTO\b|DELETE\s+FROM\b|UPDATE\s+\S+\s+SET\b'
+    r'|WITH\s+(?:RECURSIVE\s+)?\w+\s*(?:\([^)]*\)\s*)?AS\s*\('
+    r')', re.IGNORECASE)
+_PERCENT_FORMAT_RE = re.compile(r'%(?:\([^)]*\))?[-#0 +]*\d*(?:\.\d+)?[sdifrqvxXeEgG]')
+_JAVA_TOKEN_RE = re.compile(r'"""(.*?)"""|"((?:[^"\\\n]|\\.)*)"|//[^\n]*|/\*.*?\*/|\'(?:[^\'\\\n]|\\.)*\'', re.DOTALL)
+_GO_TOKEN_RE = re.compile(r'`([^`]*)`|"((?:[^"\\\n]|\\.)*)"|//[^\n]*|/\*.*?\*/|\'(?:[^\'\\\n]|\\.)*\'', re.DOTALL)
+_CONCAT_GAP_RE = re.compile(r'^\s*\+\s*$')
+_CONCAT_VALUE_GAP_RE = re.compile(r'^\s*\+\s*[\w.]+(?:\([^()"`]*\))?\s*\+\s*$')
+_FORMAT_CALL_RE = re.compile(r'(?:Sprintf|Printf|Errorf|Fprintf|format|formatted)\s*\(\s*$')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', "'": "'", '\\': '\\'}
+
+
+def looks_like_sql(text: str) -> bool:
+    """
+    Check whether string is probably SQL statement rather than prose.
+
+    :param text: String literal contents
+    :return: True if text opens like SELECT, INSERT, UPDATE, DELETE, MERGE or WITH statement
+    """
+    return bool(_SQL_RE.match(text))
+
+
+def _format_template(template: str) -> Optional[str]:
+    """
+    Replace str.format fields with placeholder.
+
+    :param template: Format string
+    :return: Template with fields replaced, or None if template is malformed
+    """
+    try:
+        return ''.join(literal + (PLACEHOLDER if field is not None else '')
+                       for literal, field, _, _ in string.Formatter().parse(template))
+    except ValueError:
+        return None
+
+
+def _python_string(node: ast.AST) -> Optional[str]:
+    """
+    Resolve expression to SQL text: string constants, f-strings, concatenation, str.format and %-formatting.
+
+    :param node: Python expression node
+    :return: String with interpolated values replaced by placeholder, or None if node is not string expression
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return ''.join(value.value if isinstance(value, ast.Constant) else PLACEHOLDER for value in node.values)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _python_string(node.left), _python_string(node.right)
+        if left is None and right is None:
+            return None
+        return (left if left is not None else PLACEHOLDER) + (right if right is not None else PLACEHOLDER)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mod):
+        left = _python_string(node.left)
+        return _PERCENT_FORMAT_RE.sub(PLACEHOLDER, left) if left is not None else None
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'format'):
+        template = _python_string(node.func.value)
+        return _format_template(template) if template is not None else None
+    return None
+
+
+def _line_entries(parts: List[Tuple[str, Optional[int], int]]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Map offsets of joined literal parts to host source lines.
+
+    Newlines inside part start new source lines only if part spans as many lines, e.g. in
+    triple-quoted string. Newlines from escapes such as '\\n' stay on line of part.
+
+    :param parts: List of (text, 1-based line or None for placeholder, number of newlines spanned in source)
+    :return: Sorted tuple of (offset, line) entries
+    """
+    entries = []
+    offset = 0
+    for text, line, spanned in parts:
+        if line is not None:
+            entries.append((offset, line))
+            if text.count('\n') != spanned:
+                entries.extend((offset + match.end(), line) for match in re.finditer('\n', text))
+        offset += len(text)
+    return tuple(entries)
+
+
+def _python_literals(node: ast.AST, source: str) -> List[Tuple[str, Optional[int], int]]:
+    """
+    Split string constant or f-string into its implicitly concatenated literals.
+
+    :param node: Constant or JoinedStr node
+    :param source: Python source code
+    :return: List of (text, 1-based line, number of newlines spanned) per literal, or single entry
+             for whole node if its literals cannot be recovered
+    """
+    text = _python_string(node)
+    whole = [(text, node.lineno, (node.end_lineno or node.lineno) - node.lineno)]
+    segment = ast.get_source_segment(source, node)
+    if segment is None:
+        return whole
+    # Parentheses let literals on continuation lines tokenize without indentation errors
+    segment = '(' + segment + ')'
+    line_starts = [0] + [match.end() for match in re.finditer('\n', segment)]
+    literals = []
+    depth = 0
+    start = (0, 0)
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(segment).readline):
+            name = tokenize.tok_name[token.type]
+            if name == 'FSTRING_START':
+                depth += 1
+                if depth == 1:
+                    start = token.start
+                continue
+            if name == 'FSTRING_END':
+                depth -= 1
+                if depth > 0:
+                    continue
+            elif token.type != tokenize.STRING or depth > 0:
+                continue
+            else:
+                start = token.start
+            literal = segment[line_starts[start[0] - 1] + start[1]:line_starts[token.end[0] - 1] + token.end[1]]
+            literals.append((_python_string(ast.parse(literal, mode='eval').body),
+                             node.lineno + start[0] - 1, token.end[0] - start[0]))
+    except (tokenize.TokenError, SyntaxError):
+        return whole
+    if not literals or any(part is None for part, _, _ in literals) or ''.join(part for part, _, _ in literals) != text:
+        return whole
+    return literals
+
+
+def _python_parts(node: ast.AST, source: str) -> Optional[List[Tuple[str, Optional[int], int]]]:
+    """
+    Resolve expression to SQL text split into literal parts, so offsets can be mapped to source lines.
+
+    :param node: Python expression node
+    :param source: Python source code
+    :return: List of (text, 1-based line or None for placeholder, number of newlines spanned in source),
+             or None if node is not string expression
+    """
+    if (isinstance(node, ast.Constant) and isinstance(node.value, str)) or isinstance(node, ast.JoinedStr):
+        return _python_literals(node, source)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _python_parts(node.left, source), _python_parts(node.right, source)
+        if left is None and right is None:
+            return None
+        return (left if left is not None else [(PLACEHOLDER, None, 0)]) + (right if right is not None else [(PLACEHOLDER, None, 0)])
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mod):
+        left = _python_parts(node.left, source)
+        return [(_PERCENT_FORMAT_RE.sub(PLACEHOLDER, text), line, spanned) for text, line, spanned in left] if left is not None else None
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'format'):
+        template = _python_parts(node.func.value, source)
+        if template is None:
+            return None
+        parts = [(_format_template(text), line, spanned) for text, line, spanned in template]
+        if all(text is not None for text, _, _ in parts):
+            return parts
+        # Field split across literals, so format whole template from its first line
+        text = _format_template(''.join(text for text, _, _ in template))
+        return [(text, node.lineno, 0)] if text is not None else None
+    return None
+
+
+def extract_python(path: str, source: str) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from Python source using ast.
+
+    Outermost string expressions are resolved, so concatenated or formatted query is
+    reported once. Docstrings are skipped.
+
+    :param path: Path of source file
+    :param source: Python source code
+    :return: List of embedded SQL strings
+    """
+    try:
+        tree = ast.parse(source, filename=path)
+    except (SyntaxError, ValueError):
+        return []
+    found = []
+    stack: List[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue
+        if isinstance(node, ast.expr):
+            parts = _python_parts(node, source)
+            if parts is not None:
+                text = ''.join(text for text, _, _ in parts)
+                if looks_like_sql(text):
+                    found.append(EmbeddedSQL(path, node.lineno, text, _line_entries(parts)))
+                continue
+        stack.extend(ast.iter_child_nodes(node))
+    return sorted(found, key=lambda embedded: embedded.line)
+
+
+def _unescape(text: str) -> str:
+    """
+    Resolve backslash escapes of Java and Go string literals.
+    """
+    return re.sub(r'\\(.)', lambda match: _ESCAPES.get(match.group(1), match.group(0)), text)
+
+
+def _extract_c_like(path: str, source: str, token_re: re.Pattern) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from Java- or Go-like source with lightweight lexer.
+
+    Literals joined by '+', possibly around single value, are concatenated. printf-style
+    verbs of literals passed to format functions become placeholders.
+
+    :param path: Path of source file
+    :param source: Source code
+    :param token_re: Regex matching raw literals (group 1), escaped literals (group 2), comments and characters
+    :return: List of embedded SQL strings
+    """
+    literals: List[Tuple[int, int, str, bool]] = []
+    for match in token_re.finditer(source):
+        if match.group(1) is not None:
+            text = match.group(1)
+        elif match.group(2) is not None:
+            text = _unescape(match.group(2))
+        else:
+            continue
+        formatted = bool(_FORMAT_CALL_RE.search(source, max(0, match.start() - 20), match.start()))
+        literals.append((match.start(), match.end(), text, formatted))
+
+    def part(index: int) -> Tuple[str, Optional[int], int]:
+        start, end, text, _ = literals[index]
+        return text, source.count('\n', 0, start) + 1, source.count('\n', start, end)
+
+    found = []
+    index = 0
+    while index < len(literals):
+        start, end, _, formatted = literals[index]
+        parts = [part(index)]
+        while index + 1 < len(literals):
+            gap = source[end:literals[index + 1][0]]
+            if _CONCAT_GAP_RE.match(gap):
+                parts.append(part(index + 1))
+            elif _CONCAT_VALUE_GAP_RE.match(gap):
+                parts.extend([(PLACEHOLDER, None, 0), part(index + 1)])
+            else:
+                break
+            index += 1
+            end = literals[index][1]
+        if formatted:
+            parts = [(_PERCENT_FORMAT_RE.sub(PLACEHOLDER, text), line, spanned) for text, line, spanned in parts]
+        sql = ''.join(text for text, _, _ in parts)
+        if looks_like_sql(sql):
+            found.append(EmbeddedSQL(path, parts[0][1], sql, _line_entries(parts)))
+        index += 1
+    return found
+
+
+def extract_java(path: str, source: str) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from Java or Kotlin source, including text blocks.
+
+    :param path: Path of source file
+    :param source: Source code
+    :return: List of embedded SQL strings
+    """
+    return _extract_c_like(path, source, _JAVA_TOKEN_RE)
+
+
+def extract_go(path: str, source: str) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from Go source, including raw string literals.
+
+    :param path: Path of source file
+    :param source: Source code
+    :return: List of embedded SQL strings
+    """
+    return _extract_c_like(path, source, _GO_TOKEN_RE)
+
+
+EXTRACTORS: Dict[str, Callable[[str, str], List[EmbeddedSQL]]] = {
+    '.py': extract_python,
+    '.java': extract_java,
+    '.kt': extract_java,
+    '.go': extract_go,
+}
+
+
+def extract_file(path: str) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from source file, choosing extractor by extension.
+
+    :param path: Path of source file
+    :return: List of embedded SQL strings (empty for unsupported or unreadable files)
+    """
+    extractor = EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    if extractor is None:
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError):
+        return []
+    return extractor(path, source)
+
+
+def source_files(root: str, extensions: Tuple[str, ...] = tuple(EXTRACTORS)) -> List[str]:
+    """
+    List source files under directory, skipping hidden and vendored directories.
+
+    :param root: Directory to search (or single file)
+    :param extensions: File extensions to include
+    :return: Sorted list of file paths
+    """
+    if os.path.isfile(root):
+        return [root]
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in ('node_modules', 'vendor', '__pycache__')]
+        paths.extend(os.path.join(dirpath, filename) for filename in filenames if filename.lower().endswith(extensions))
+    return sorted(paths)
+
+
+def extract_tree(root: str, workers: Optional[int] = None) -> List[EmbeddedSQL]:
+    """
+    Extract SQL strings from all supported source files under directory.
+
+    Files are parsed in worker processes, since ast parsing and lexing are CPU-bound.
+
+    :param root: Directory to search
+    :param workers: Number of worker processes (None for CPU count, 1 to extract in-process)
+    :return: List of embedded SQL strings, ordered by file and line
+    """
+    paths = source_files(root)
+    if workers == 1 or len(paths) < 2:
+        results = map(extract_file, paths)
+        return [embedded for result in results for embedded in result]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(extract_file, paths, chunksize=max(1, len(paths) // (4 * (workers or os.cpu_count() or 1))))
+        return [embedded for result in results for embedded in result]
+
+
+def host_line(item: EmbeddedSQL, position: Optional[int]) -> int:
+    """
+    Map position in embedded SQL string to line of host source file.
+
+    :param item: Embedded SQL string
+    :param position: Offset in item.sql, or None if offending SQL could not be located
+    :return: 1-based line in host source file
+    """
+    if position is None:
+        return item.line
+    index = bisect_right(item.lines, (position, float('inf'))) - 1
+    offset, line = item.lines[index] if index >= 0 else (0, item.line)
+    return line + item.sql.count('\n', offset, position)
+
+
+def scan_embedded(scanner: SQLAntipatternScanner, embedded: List[EmbeddedSQL]) -> List[Finding]:
+    """
+    Scan embedded SQL strings and map findings to lines of host source files.
+
+    :param scanner: SQLAntipatternScanner instance
+    :param embedded: Embedded SQL strings
+    :return: List of findings
+    """
+    findings = []
+    for item in embedded:
+        for antipattern, offending_sql, context in scanner.scan_sql(item.sql):
+            line = host_line(item, locate(item.sql, offending_sql))
+            findings.append(Finding(item.file, line, antipattern, offending_sql, context))
+    return findings
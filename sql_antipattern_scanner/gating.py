@@ -0,0 +1,239 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/gating.py
+import re
+from collections import namedtuple
+from typing import Iterable, List, Optional, Tuple
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.migrations import MIGRATION_ANTIPATTERNS
+from sql_antipattern_scanner.literals import collapse_literals
+from sql_antipattern_scanner.statements import Finding, StatementSpan, locate, split_statements
+from sql_antipattern_scanner.suppression import ALL_RULES, Baseline, inline_suppressions
+
+SEVERITY_WEIGHTS = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
+
+# Necessary conditions of structural checks on raw text: statement failing its prefilter cannot be reported by check
+_STRUCTURAL_PREFILTERS = {
+    "SELECT *": re.compile(r'\*'),
+    "Subquery in IN clause": re.compile(r'\bIN\b.*\bSELECT\b', re.IGNORECASE | re.DOTALL),
+    "ANSI-89 Join": re.compile(r'\bFROM\b.*,', re.IGNORECASE | re.DOTALL),
+    "Function in WHERE": re.compile(r'\bWHERE\b.*\(', re.IGNORECASE | re.DOTALL),
+    "Numeric GROUP BY": re.compile(r'\bGROUP\s+BY\b.*\d', re.IGNORECASE | re.DOTALL),
+    "NULL Comparison": re.compile(r'\bWHERE\b.*\bNULL\b', re.IGNORECASE | re.DOTALL),
+}
+# Migration checks only report CREATE INDEX, ALTER TABLE, UPDATE and DELETE statements
+_MIGRATION_PREFILTER = re.compile(r'\b(?:CREATE|ALTER|UPDATE|DELETE)\b', re.IGNORECASE)
+
+# First finding that breached gate, with severity score accumulated up to and including it
+GateBreach = namedtuple('GateBreach', ['file', 'line', 'antipattern', 'offending_sql', 'score'])
+
+
+class Gate:
+    """
+    Pass/fail condition on scan results: any finding at or above severity, or severity score above limit.
+    """
+
+    def __init__(self, fail_on: Optional[str] = None, max_score: Optional[int] = None):
+        """
+        Initialize Gate.
+
+        :param fail_on: Lowest severity that fails gate ('Critical', 'High', 'Medium' or 'Low'), or None
+        :param max_score: Highest severity score that passes gate, or None
+        :raises ValueError: If severity is unknown
+        """
+        if fail_on is not None and fail_on not in SEVERITY_WEIGHTS:
+            raise ValueError(f"Unknown severity: {fail_on}")
+        self.fail_on = fail_on
+        self.max_score = max_score
+
+    def fails_on(self, severity: str) -> bool:
+        """
+        Check whether single finding of severity fails gate.
+
+        :param severity: Severity of finding
+        :return: True if finding fails gate on its own
+        """
+        return self.fail_on is not None and SEVERITY_WEIGHTS[severity] >= SEVERITY_WEIGHTS[self.fail_on]
+
+    def over_score(self, score: int) -> bool:
+        """
+        Check whether severity score fails gate.
+
+        :param score: Accumulated severity score
+        :return: True if score exceeds limit
+        """
+        return self.max_score is not None and score > self.max_score
+
+
+class GateEvaluator:
+    """
+    Evaluate gate over statements with early exit at first breach.
+
+    Each statement first gets cheap stage: regex rules and rule-pack rules run on raw
+    text, most severe first, without parsing. Any match of such rule is certain to be
+    reported by full scan, so single match can prove breach. Full scan (parse, structural
+    and schema-aware checks) runs only when cheap stage cannot decide: when score is
+    gated, when schema-aware checks are enabled, or when structural check that could
+    fail gate passes its raw-text prefilter.
+    """
+
+    def __init__(self, scanner: SQLAntipatternScanner, gate: Gate, baseline: Optional[Baseline] = None):
+        """
+        Initialize GateEvaluator.
+
+        :param scanner: SQLAntipatternScanner instance
+        :param gate: Gate to evaluate
+        :param baseline: Baseline of accepted findings that cannot fail gate, or None
+        """
+        self.scanner = scanner
+        self.gate = gate
+        self.baseline = baseline
+        self.score = 0
+        self.statements = 0
+        pattern_names = {antipattern.name for _, antipattern in scanner.patterns}
+        relevant = (lambda severity: True) if gate.max_score is not None else gate.fails_on
+        self.cheap_patterns = sorted(
+            ((pattern, antipattern) for pattern, antipattern in scanner.patterns if relevant(antipattern.severity)),
+            key=lambda rule: -SEVERITY_WEIGHTS[rule[1].severity])
+        # Rule-pack rules named like regex rules are only reported when regex rule does not match, so they are left to full scan
+        self.cheap_skipped = pattern_names
+        self.always_full_scan = (
+            gate.max_score is not None or scanner.schema_checks is not None
+            or any(gate.fails_on(antipattern.severity) for rule_pack in scanner.rule_packs
+                   for _, antipattern, _ in rule_pack.matchers if antipattern.name in pattern_names)
+        )
+        # Structural checks that could fail gate, with prefilter (None if check has none)
+        self.structural = [
+            (name, _STRUCTURAL_PREFILTERS.get(name)) for name, _ in scanner.STRUCTURAL_CHECKS
+            if any(antipattern.name == name and gate.fails_on(antipattern.severity) for _, antipattern in scanner.patterns)
+        ] + [
+            (name, _MIGRATION_PREFILTER) for name, antipattern in MIGRATION_ANTIPATTERNS.items() if gate.fails_on(antipattern.severity)
+        ]
+
+    def _cheap_stage(self, sql: str, suppressed: set) -> Optional[Tuple[object, str, int]]:
+        """
+        Run regex and rule-pack rules without parsing.
+
+        :param sql: SQL statement
+        :param suppressed: Rules suppressed by inline comments
+        :return: Tuple of antipattern, offending SQL and lower bound of statement score if gate is breached, else None
+        """
+        scanner = self.scanner
+        text = collapse_literals(sql, scanner.literal_run_threshold).text if scanner.literal_run_threshold is not None else sql
+        if scanner.check_limits(text):
+            # Over-limit statements are truncated by scan, so matches on full text could be false breaches
+            return None
+        ignored = scanner.ignored_patterns
+        lower_bound = 0
+        for pattern, antipattern in self.cheap_patterns:
+            if antipattern.name in ignored or antipattern.name.lower() in suppressed:
+                continue
+            match = pattern.search(text)
+            if match:
+                lower_bound += SEVERITY_WEIGHTS[antipattern.severity]
+                if self.gate.fails_on(antipattern.severity) or self.gate.over_score(self.score + lower_bound):
+                    return antipattern, match.group(0), lower_bound
+        for rule_pack in scanner.rule_packs:
+            matches = {}
+            for antipattern, offending_sql, _ in rule_pack.match(text, ignored | self.cheap_skipped):
+                if antipattern.name.lower() not in suppressed:
+                    matches.setdefault(antipattern.name, (antipattern, offending_sql))
+            for antipattern, offending_sql in sorted(matches.values(), key=lambda item: -SEVERITY_WEIGHTS[item[0].severity]):
+                lower_bound += SEVERITY_WEIGHTS[antipattern.severity]
+                if self.gate.fails_on(antipattern.severity) or self.gate.over_score(self.score + lower_bound):
+                    return antipattern, offending_sql, lower_bound
+        return None
+
+    def check(self, sql: str, file: str = '', line: int = 1) -> Optional[GateBreach]:
+        """
+        Evaluate gate on statement, adding its findings to accumulated score.
+
+        :param sql: SQL statement
+        :param file: File path reported on breach
+        :param line: Line of statement in file
+        :return: GateBreach if statement breaches gate, else None
+        """
+        self.statements += 1
+        suppressed = inline_suppressions(sql)
+        if ALL_RULES in suppressed:
+            return None
+        if self.baseline is None and self.scanner.schema_checks is None:
+            # Schema-aware checks may change severity of regex findings, so cheap stage cannot decide with them
+            cheap = self._cheap_stage(sql, suppressed)
+            if cheap is not None:
+                antipattern, offending_sql, lower_bound = cheap
+                return self._breach(file, line, sql, antipattern, offending_sql, self.score + lower_bound)
+            if not self.always_full_scan and not any(
+                    name not in self.scanner.ignored_patterns and name.lower() not in suppressed
+                    and (prefilter is None or prefilter.search(sql)) for name, prefilter in self.structural):
+                return None
+        return self.check_issues(self.scanner.scan(sql).issues, file, line, sql)
+
+    def check_issues(self, issues: List[tuple], file: str = '', line: int = 1, sql: str = '') -> Optional[GateBreach]:
+        """
+        Evaluate gate on issues of fully scanned statement, adding them to accumulated score.
+
+        :param issues: List of tuples containing antipattern, offending SQL, and context
+        :param file: File path reported on breach
+        :param line: Line of statement in file
+        :param sql: Statement text, used to locate offending SQL
+        :return: GateBreach if issues breach gate, else None
+        """
+        ordered = sorted(issues, key=lambda issue: -SEVERITY_WEIGHTS[issue[0].severity])
+        for antipattern, offending_sql, _ in ordered:
+            self.score += SEVERITY_WEIGHTS[antipattern.severity]
+            if self.gate.fails_on(antipattern.severity) or self.gate.over_score(self.score):
+                return self._breach(file, line, sql, antipattern, offending_sql, self.score)
+        return None
+
+    def check_file(self, file: str, sql: str, statements: Optional[List[StatementSpan]] = None) -> Optional[GateBreach]:
+        """
+        Evaluate gate on statements of file, stopping at first breach.
+
+        With baseline, every statement of file is scanned in full, so findings can be
+        fingerprinted, and accepted findings are skipped.
+
+        :param file: File path
+        :param sql: Contents of file
+        :param statements: Statements to evaluate (all statements of file if omitted)
+        :return: GateBreach if file breaches gate, else None
+        """
+        statements = split_statements(sql) if statements is None else statements
+        if self.baseline is None:
+            for statement in statements:
+                breach = self.check(statement.text, file, statement.start_line)
+                if breach is not None:
+                    return breach
+            return None
+        findings = []
+        for statement in statements:
+            self.statements += 1
+            for antipattern, offending_sql, context in self.scanner.scan(statement.text).issues:
+                position = locate(statement.text, offending_sql)
+                line = statement.start_line + (statement.text.count('\n', 0, position) if position is not None else 0)
+                findings.append(Finding(file, line, antipattern, offending_sql, context))
+        new = self.baseline.new_findings(findings, sources={file: sql})
+        for finding, is_new in zip(findings, new):
+            if is_new:
+                breach = self.check_issues([(finding.antipattern, finding.offending_sql, finding.context)], file, finding.line)
+                if breach is not None:
+                    return breach
+        return None
+
+    def check_files(self, files: Iterable[Tuple[str, str, Optional[List[StatementSpan]]]]) -> Optional[GateBreach]:
+        """
+        Evaluate gate on files, stopping at first file that breaches it.
+
+        :param files: Iterable of (file path, contents, statements or None for all), read lazily
+        :return: First GateBreach, or None if gate passes
+        """
+        for file, sql, statements in files:
+            breach = self.check_file(file, sql, statements)
+            if breach is not None:
+                return breach
+        return None
+
+    def _breach(self, file: str, line: int, sql: str, antipattern, offending_sql: str, score: int) -> GateBreach:
+        """
+        Build breach, locating offending SQL within statement.
+        """
+        position = locate(sql, offending_sql) if sql else None
+        return GateBreach(file, line + (sql.count('\n', 0, position) if position is not None else 0), antipattern, offending_sql, score)
@@ -0,0 +1,180 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/history.py
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from sql_antipattern_scanner.statements import Finding, fingerprint_findings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    file TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_findings_run_fingerprint ON findings (run_id, fingerprint);
+CREATE INDEX IF NOT EXISTS idx_findings_run_file_rule ON findings (run_id, file, rule);
+CREATE INDEX IF NOT EXISTS idx_findings_rule_run ON findings (rule, run_id);
+"""
+
+FINDING_COLUMNS = ('run_id', 'file', 'rule', 'severity', 'fingerprint', 'line')
+
+
+class FindingsStore:
+    """
+    Append-only SQLite store of findings across scan runs.
+
+    Each run is recorded once with all of its findings. Indexes on (run, fingerprint),
+    (run, file, rule) and (rule, run) keep run-to-run diffs and trend queries fast
+    without reading old reports.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open store, creating schema if needed.
+
+        :param path: Path to SQLite database file (':memory:' for temporary store)
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close underlying database connection.
+        """
+        self.connection.close()
+
+    def record_run(self, findings: List[Finding], label: Optional[str] = None, started_at: Optional[str] = None) -> int:
+        """
+        Record scan run and its findings.
+
+        :param findings: Findings of run
+        :param label: Optional run label, e.g. commit hash
+        :param started_at: ISO timestamp of run (defaults to now, UTC)
+        :return: Id of recorded run
+        """
+        started_at = started_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.connection:
+            run_id = self.connection.execute('INSERT INTO runs (started_at, label) VALUES (?, ?)', (started_at, label)).lastrowid
+            self.connection.executemany(
+                'INSERT INTO findings (run_id, file, rule, severity, fingerprint, line) VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (run_id, finding.file, finding.antipattern.name, finding.antipattern.severity, fingerprint, finding.line)
+                    for finding, fingerprint in zip(findings, fingerprint_findings(findings))
+                ]
+            )
+        return run_id
+
+    def runs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List recorded runs, newest first.
+
+        :param limit: Maximum number of runs to return
+        :return: List of run dictionaries
+        """
+        query = 'SELECT id, started_at, label FROM runs ORDER BY id DESC'
+        params: tuple = ()
+        if limit is not None:
+            query += ' LIMIT ?'
+            params = (limit,)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def _run_pair(self, run_id: Optional[int], previous_run_id: Optional[int]) -> Optional[tuple]:
+        """
+        Resolve run and run to compare it against, defaulting to two latest runs.
+
+        :param run_id: Run id, or None for latest run
+        :param previous_run_id: Run id to compare against, or None for run preceding run_id
+        :return: Tuple of (run_id, previous_run_id), or None if there is nothing to compare
+        """
+        if run_id is None:
+            row = self.connection.execute('SELECT MAX(id) FROM runs').fetchone()
+            run_id = row[0]
+        if run_id is None:
+            return None
+        if previous_run_id is None:
+            row = self.connection.execute('SELECT MAX(id) FROM runs WHERE id < ?', (run_id,)).fetchone()
+            previous_run_id = row[0] if row[0] is not None else -1
+        return run_id, previous_run_id
+
+    def _difference(self, left: int, right: int) -> List[Dict[str, Any]]:
+        """
+        Get findings of one run whose fingerprints are absent from another run.
+
+        :param left: Run to take findings from
+        :param right: Run whose fingerprints are excluded
+        :return: List of finding dictionaries
+        """
+        query = (
+            'SELECT f.run_id, f.file, f.rule, f.severity, f.fingerprint, f.line FROM findings f '
+            'WHERE f.run_id = ? AND NOT EXISTS '
+            '(SELECT 1 FROM findings p WHERE p.run_id = ? AND p.fingerprint = f.fingerprint) '
+            'ORDER BY f.file, f.line'
+        )
+        return [dict(row) for row in self.connection.execute(query, (left, right))]
+
+    def new_findings(self, run_id: Optional[int] = None, previous_run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get findings that are new since previous run.
+
+        :param run_id: Run id, or None for latest run
+        :param previous_run_id: Run to compare against, or None for run preceding run_id
+        :return: List of finding dictionaries
+        """
+        pair = self._run_pair(run_id, previous_run_id)
+        return self._difference(pair[0], pair[1]) if pair else []
+
+    def fixed_findings(self, run_id: Optional[int] = None, previous_run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get findings of previous run that no longer occur.
+
+        :param run_id: Run id, or None for latest run
+        :param previous_run_id: Run to compare against, or None for run preceding run_id
+        :return: List of finding dictionaries from previous run
+        """
+        pair = self._run_pair(run_id, previous_run_id)
+        return self._difference(pair[1], pair[0]) if pair else []
+
+    def top_rules_by_file(self, limit: int = 10, since_run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get most frequent (file, rule) combinations.
+
+        :param limit: Maximum number of rows
+        :param since_run_id: Only count runs with id greater than or equal to this
+        :return: List of dictionaries with file, rule, count and number of runs
+        """
+        query = (
+            'SELECT file, rule, COUNT(*) AS count, COUNT(DISTINCT run_id) AS runs FROM findings '
+            'WHERE run_id >= ? GROUP BY file, rule ORDER BY count DESC, file, rule LIMIT ?'
+        )
+        return [dict(row) for row in self.connection.execute(query, (since_run_id or 0, limit))]
+
+    def trend(self, rule: Optional[str] = None, file: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get finding counts per run, optionally for single rule and/or file.
+
+        :param rule: Rule name to restrict to
+        :param file: File path to restrict to
+        :return: List of dictionaries with run id, start time and count, oldest first
+        """
+        conditions = []
+        params = []
+        if rule is not None:
+            conditions.append('f.rule = ?')
+            params.append(rule)
+        if file is not None:
+            conditions.append('f.file = ?')
+            params.append(file)
+        where = ('AND ' + ' AND '.join(conditions)) if conditions else ''
+        query = (
+            'SELECT r.id AS run_id, r.started_at, r.label, COUNT(f.run_id) AS count FROM runs r '
+            f'LEFT JOIN findings f ON f.run_id = r.id {where} GROUP BY r.id ORDER BY r.id'
+        )
+        return [dict(row) for row in self.connection.execute(query, params)]
@@ -0,0 +1,370 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/index_advisor.py
+import re
+import sqlparse
+from sqlparse.exceptions import SQLParseError
+from sqlparse.sql import Parenthesis, Statement
+from collections import namedtuple, defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from sql_antipattern_scanner.rule_packs import clause_spans, clause_at
+from sql_antipattern_scanner.schema_catalog import SchemaCatalog, SchemaAwareChecks, table_references, join_predicates
+from sql_antipattern_scanner.statements import split_statements
+
+# Recommended index: columns in key order with role of each ('equality', 'sort' or 'range'),
+# summed weight of statements it serves and number of those statements
+IndexRecommendation = namedtuple('IndexRecommendation', ['table', 'columns', 'roles', 'score', 'statements'])
+
+# Column usage of one table in one statement
+_Usage = namedtuple('_Usage', ['equality', 'sort', 'range'])
+
+_STRING_RE = re.compile(r"'[^']*(?:''[^']*)*'")
+_PREDICATE_RE = re.compile(r'(?<![\w.])((?:\w+\.)?\w+)\s*(=|<=|>=|<>|!=|<|>|\bNOT\s+IN\b|\bIN\b|\bBETWEEN\b|\bNOT\s+LIKE\b|\bLIKE\b)\s*(\S?)', re.IGNORECASE)
+_ORDER_BY_RE = re.compile(r'\bORDER\s+BY\s+(.+?)(?=\bLIMIT\b|\bOFFSET\b|\bFETCH\b|\)|;|$)', re.IGNORECASE | re.DOTALL)
+_OR_RE = re.compile(r'\bOR\b', re.IGNORECASE)
+_SORT_ITEM_RE = re.compile(r'^((?:\w+\.)?\w+)(?:\s+(?:ASC|DESC))?(?:\s+NULLS\s+(?:FIRST|LAST))?$', re.IGNORECASE)
+_NOT_COLUMNS = {'AND', 'OR', 'NOT', 'WHERE', 'ON', 'IS', 'NULL', 'TRUE', 'FALSE'}
+_RANGE_OPERATORS = {'<', '>', '<=', '>=', 'BETWEEN', 'LIKE'}
+# Column presumed to be primary key when no catalog says otherwise
+_PRIMARY_KEY = 'id'
+
+
+class IndexAdvisor:
+    """
+    Recommend composite indexes from predicate and sort columns of workload.
+
+    Each SELECT scope of statement, i.e. statement itself and each parenthesised subquery,
+    contributes, per table, its equality and join columns, its ORDER BY columns and its
+    first range column, with columns resolved against tables of that scope only. Scopes
+    come from sqlparse tree, preferably one scanner already built. Predicates joined by
+    OR are skipped, since no single composite index serves either branch. Candidate
+    indexes follow equality-sort-range order, with equality columns ordered by how often
+    workload filters on them so that candidates share prefixes. Candidates that are prefixes of other candidates are
+    folded into them, as one index serves both, and recommendations are ranked by
+    summed statement weights (frequencies from logs where available).
+
+    With schema catalog, columns are resolved through it, small tables are skipped and
+    candidates already covered by existing index are dropped. Without catalog, column
+    named id is presumed primary key, so usages filtering or joining table on it add no
+    candidate, as primary key index already serves them.
+    """
+
+    def __init__(self, catalog: Optional[SchemaCatalog] = None, dialect: Optional[str] = None,
+                 max_columns: int = 4, small_table_rows: int = 1000):
+        """
+        Initialize IndexAdvisor.
+
+        :param catalog: SchemaCatalog used to resolve columns and skip existing indexes, or None
+        :param dialect: Dialect used to write index DDL, or None for generic SQL
+        :param max_columns: Maximum number of columns per recommended index
+        :param small_table_rows: Row count below which tables are not worth indexing (with catalog)
+        """
+        self.catalog = catalog
+        self.schema_checks = SchemaAwareChecks(catalog, small_table_rows=small_table_rows) if catalog is not None else None
+        self.dialect = dialect
+        self.max_columns = max_columns
+        # (table, usage) -> [summed weight, statement count]
+        self.usages: Dict[Tuple[str, _Usage], List[float]] = {}
+
+    def add(self, sql: str, weight: float = 1.0, parsed: Optional[Statement] = None) -> None:
+        """
+        Record column usage of every SELECT scope of statement.
+
+        :param sql: SQL statement
+        :param weight: Frequency of statement, e.g. call count from query log
+        :param parsed: Parse tree of statement, e.g. ScanResult.parsed, or None to parse sql
+        """
+        for usages in self._scope_usages(sql, parsed):
+            for table, usage in usages.items():
+                entry = self.usages.setdefault((table, usage), [0.0, 0])
+                entry[0] += weight
+                entry[1] += 1
+
+    def add_script(self, sql: str) -> None:
+        """
+        Record column usage of every statement of SQL script, each with weight 1.
+
+        :param sql: SQL script
+        """
+        for statement in split_statements(sql):
+            self.add(statement.text)
+
+    def extract(self, sql: str, parsed: Optional[Statement] = None) -> Dict[str, _Usage]:
+        """
+        Extract indexable column usage of statement per table.
+
+        Table used in several SELECT scopes keeps usage of outermost one.
+
+        :param sql: SQL statement
+        :param parsed: Parse tree of statement, e.g. ScanResult.parsed, or None to parse sql
+        :return: Dictionary mapping table name to its usage
+        """
+        merged: Dict[str, _Usage] = {}
+        for usages in self._scope_usages(sql, parsed):
+            for table, usage in usages.items():
+                merged.setdefault(table, usage)
+        return merged
+
+    def _scope_usages(self, sql: str, parsed: Optional[Statement]) -> Iterator[Dict[str, _Usage]]:
+        """
+        Extract column usage per table of each SELECT scope, outermost first.
+        """
+        if parsed is None:
+            try:
+                parsed = sqlparse.parse(sql)[0]
+            except (SQLParseError, RecursionError, IndexError):
+                yield self._usages(sql)
+                return
+        text = str(parsed)
+        subqueries = _subqueries(parsed)
+        for start, end in [(0, len(text))] + subqueries:
+            # Nested subqueries are blanked, so their columns resolve only in their own scope
+            parts, position = [], start
+            for inner_start, inner_end in subqueries:
+                if start < inner_start and inner_end <= end and inner_start >= position:
+                    parts.extend((text[position:inner_start], ' ' * (inner_end - inner_start)))
+                    position = inner_end
+            parts.append(text[position:end])
+            yield self._usages(''.join(parts))
+
+    def _usages(self, sql: str) -> Dict[str, _Usage]:
+        """
+        Extract column usage per table of single scope.
+        """
+        masked = _STRING_RE.sub(lambda m: "'" + ' ' * (len(m.group(0)) - 2) + "'", sql)
+        tables = self._tables(masked)
+        if not tables:
+            return {}
+        spans = clause_spans(masked)
+        disjunctions = _disjunctions(masked, spans)
+        equality, ranges, sort = defaultdict(list), defaultdict(list), defaultdict(list)
+        joined = set()
+        for match in join_predicates(masked):
+            if clause_at(spans, match.start()) not in ('ON', 'WHERE') or _inside(disjunctions, match.start()):
+                continue
+            joined.update((match.start(1), match.start(2)))
+            for column_ref in match.groups():
+                resolved = self._resolve(column_ref, tables)
+                if resolved is not None:
+                    equality[resolved[0]].append(resolved[1])
+        for match in _PREDICATE_RE.finditer(masked):
+            column_ref, operator = match.group(1), ' '.join(match.group(2).upper().split())
+            if match.start(1) in joined or clause_at(spans, match.start()) not in ('ON', 'WHERE') or _inside(disjunctions, match.start()):
+                continue
+            if column_ref.upper() in _NOT_COLUMNS or column_ref[0].isdigit():
+                continue
+            # Negations and leading wildcards cannot use index
+            if operator in ('<>', '!=', 'NOT IN', 'NOT LIKE') or (operator == 'LIKE' and sql[match.end(3):match.end(3) + 1] == '%'):
+                continue
+            resolved = self._resolve(column_ref, tables)
+            if resolved is None:
+                continue
+            (ranges if operator in _RANGE_OPERATORS else equality)[resolved[0]].append(resolved[1])
+        for match in _ORDER_BY_RE.finditer(masked):
+            columns = []
+            for item in match.group(1).split(','):
+                item_match = _SORT_ITEM_RE.match(item.strip())
+                resolved = self._resolve(item_match.group(1), tables) if item_match else None
+                if resolved is None or (columns and resolved[0] != columns[0][0]):
+                    # Index can only serve sort on leading plain columns of one table
+                    break
+                columns.append(resolved)
+            for table, column in columns:
+                sort[table].append(column)
+        usages = {}
+        for table in set(equality) | set(ranges) | set(sort):
+            eq = tuple(sorted(set(equality[table])))
+            order = tuple(column for column in dict.fromkeys(sort[table]) if column not in eq)
+            first_range = next((column for column in ranges[table] if column not in eq and column not in order), None)
+            usages[table] = _Usage(eq, order, (first_range,) if first_range else ())
+        return usages
+
+    def _tables(self, sql: str) -> Dict[str, str]:
+        """
+        Map table names and aliases referenced by statement to table names.
+        """
+        if self.schema_checks is not None:
+            return self.schema_checks.statement_tables(sql)
+        tables = {}
+        for keyword, table, alias in table_references(sql):
+            if keyword == 'INTO':
+                continue
+            tables[table] = table
+            if alias:
+                tables[alias] = table
+        return tables
+
+    def _resolve(self, column_ref: str, tables: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """
+        Resolve column reference to (table, column); unqualified columns need catalog or single table.
+        """
+        if self.schema_checks is not None:
+            resolved = self.schema_checks.resolve(column_ref, tables)
+            if resolved is None or resolved[1] not in self.catalog.table(resolved[0]).columns:
+                return None
+            return resolved
+        if '.' in column_ref:
+            qualifier, column = column_ref.lower().split('.', 1)
+            table = tables.get(qualifier)
+            return (table, column) if table else None
+        names = set(tables.values())
+        return (names.pop(), column_ref.lower()) if len(names) == 1 else None
+
+    def recommend(self, limit: Optional[int] = None) -> List[IndexRecommendation]:
+        """
+        Rank composite index recommendations for recorded workload.
+
+        :param limit: Maximum number of recommendations, or None for all
+        :return: List of IndexRecommendation, highest score first
+        """
+        frequency: Dict[Tuple[str, str], float] = defaultdict(float)
+        for (table, usage), (weight, _) in self.usages.items():
+            for column in usage.equality:
+                frequency[table, column] += weight
+        candidates: Dict[Tuple[str, Tuple[str, ...]], List[Any]] = {}
+        for (table, usage), (weight, count) in self.usages.items():
+            if self.schema_checks is not None and not self.schema_checks.is_large(table):
+                continue
+            if self.catalog is None and _PRIMARY_KEY in usage.equality:
+                continue
+            equality = sorted(usage.equality, key=lambda column: (-frequency[table, column], column))
+            keyed = [(column, 'equality') for column in equality] + [(column, 'sort') for column in usage.sort]
+            keyed += [(column, 'range') for column in usage.range]
+            keyed = keyed[:self.max_columns]
+            key = (table, tuple(column for column, _ in keyed))
+            entry = candidates.setdefault(key, [tuple(role for _, role in keyed), 0.0, 0])
+            entry[1] += weight
+            entry[2] += count
+        # Fold candidates into longer candidates of same table that they are prefix of
+        kept: Dict[Tuple[str, Tuple[str, ...]], List[Any]] = {}
+        for key in sorted(candidates, key=lambda key: (-len(key[1]), -candidates[key][1], key)):
+            table, columns = key
+            covering = [other for other in kept if other[0] == table and other[1][:len(columns)] == columns]
+            if covering:
+                target = max(covering, key=lambda other: (kept[other][1], other))
+                kept[target][1] += candidates[key][1]
+                kept[target][2] += candidates[key][2]
+            else:
+                kept[key] = list(candidates[key])
+        recommendations = [
+            IndexRecommendation(table, columns, roles, round(score, 2), statements)
+            for (table, columns), (roles, score, statements) in kept.items()
+            if not self._covered(table, columns)
+        ]
+        recommendations.sort(key=lambda recommendation: (-recommendation.score, recommendation.table, recommendation.columns))
+        return recommendations[:limit] if limit is not None else recommendations
+
+    def _covered(self, table: str, columns: Tuple[str, ...]) -> bool:
+        """
+        Check whether existing index of catalog starts with columns.
+        """
+        if self.catalog is None:
+            return False
+        info = self.catalog.table(table)
+        return info is not None and any(tuple(index[:len(columns)]) == columns for index in info.indexes)
+
+    def ddl(self, recommendation: IndexRecommendation) -> str:
+        """
+        Write CREATE INDEX statement for recommendation, building online where dialect allows.
+
+        :param recommendation: IndexRecommendation instance
+        :return: CREATE INDEX statement
+        """
+        name = '_'.join(('idx', recommendation.table) + recommendation.columns)
+        columns = ', '.join(recommendation.columns)
+        if self.dialect == 'postgres':
+            return f"CREATE INDEX CONCURRENTLY {name} ON {recommendation.table} ({columns})"
+        if self.dialect == 'tsql':
+            return f"CREATE INDEX {name} ON {recommendation.table} ({columns}) WITH (ONLINE = ON)"
+        return f"CREATE INDEX {name} ON {recommendation.table} ({columns})"
+
+    def report(self, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """
+        Convert recommendations to JSON-serializable report entries.
+
+        :param limit: Maximum number of recommendations, or None for all
+        :return: List of dictionaries with table, columns, roles, score, statements and ddl
+        """
+        return [
+            dict(recommendation._asdict(), columns=list(recommendation.columns), roles=list(recommendation.roles),
+                 ddl=self.ddl(recommendation))
+            for recommendation in self.recommend(limit)
+        ]
+
+
+def _subqueries(parsed: Statement) -> List[Tuple[int, int]]:
+    """
+    Find text of parenthesised SELECT subqueries in parse tree.
+
+    :param parsed: sqlparse statement
+    :return: List of (start, end) offsets inside parentheses, sorted by start so enclosing subqueries come first
+    """
+    spans = []
+    stack = [(parsed, 0)]
+    while stack:
+        group, offset = stack.pop()
+        for token in group.tokens:
+            if token.is_group:
+                if isinstance(token, Parenthesis):
+                    _, first = token.token_next(0)
+                    if first is not None and first.ttype in sqlparse.tokens.DML and first.normalized == 'SELECT':
+                        spans.append((offset + 1, offset + len(token.value) - 1))
+                stack.append((token, offset))
+            offset += len(token.value)
+    return sorted(spans)
+
+
+def _disjunctions(sql: str, spans) -> List[Tuple[int, int]]:
+    """
+    Find ranges of WHERE and ON conditions holding OR: innermost parenthesized group, or clause at its level.
+
+    Walks clause segments once; each segment starts after parenthesis or clause keyword.
+
+    :param sql: SQL text with strings masked
+    :param spans: Clause spans of sql from clause_spans
+    :return: List of (start, end) offset pairs
+    """
+    starts, clauses = spans
+    ranges = []
+    # Per open parenthesis level: [start of current clause region, whether region holds OR]
+    levels = [[0, False]]
+    for index, (start, clause) in enumerate(zip(starts, clauses)):
+        boundary = sql[start - 1] if start else ''
+        if boundary == '(':
+            levels.append([start, False])
+        elif boundary == ')' and len(levels) > 1:
+            region_start, has_or = levels.pop()
+            if has_or:
+                ranges.append((region_start, start))
+        elif start:
+            # Clause keyword starts new region at its level
+            if levels[-1][1]:
+                ranges.append((levels[-1][0], start))
+            levels[-1] = [start, False]
+        end = starts[index + 1] if index + 1 < len(starts) else len(sql)
+        if clause in ('ON', 'WHERE') and _OR_RE.search(sql, start, end):
+            levels[-1][1] = True
+    ranges.extend((region_start, len(sql)) for region_start, has_or in levels if has_or)
+    return ranges
+
+
+def _inside(ranges: List[Tuple[int, int]], position: int) -> bool:
+    """
+    Check whether position lies in any of ranges.
+    """
+    return any(start <= position < end for start, end in ranges)
+
+
+def advise_indexes(statements: Iterable[str], catalog: Optional[SchemaCatalog] = None, dialect: Optional[str] = None,
+                   limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+    """
+    Recommend indexes for statements, each occurrence counting once.
+
+    :param statements: Iterable of SQL statements, e.g. from query log
+    :param catalog: SchemaCatalog used to resolve columns and skip existing indexes, or None
+    :param dialect: Dialect used to write index DDL, or None
+    :param limit: Maximum number of recommendations, or None for all
+    :return: List of report entries as produced by IndexAdvisor.report
+    """
+    advisor = IndexAdvisor(catalog, dialect)
+    for sql in statements:
+        advisor.add(sql)
+    return advisor.report(limit)
@@ -0,0 +1,147 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/literals.py
+import re
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+PLACEHOLDER = '(?)'
+
+_RUN_START_RE = re.compile(r'\b(VALUES|IN)\s*(?=\()', re.IGNORECASE)
+# Characters of numbers and separators; exponent markers are handled separately so columns named e are not literals
+_LITERAL_CHARS = frozenset('0123456789 \t\r\n,.+-')
+_LITERAL_WORDS = ('NULL', 'TRUE', 'FALSE')
+
+
+class CollapsedSQL:
+    """
+    SQL text with long literal runs replaced by placeholder, plus offset map back to original.
+    """
+
+    def __init__(self, text: str, segments: List[Tuple[int, int, int, int]]):
+        """
+        Initialize CollapsedSQL.
+
+        :param text: Collapsed SQL text
+        :param segments: Sorted list of (collapsed start, collapsed end, original start, original end)
+                         tuples, one per collapsed run
+        """
+        self.text = text
+        self.segments = segments
+        self._starts = [segment[0] for segment in segments]
+
+    @property
+    def collapsed(self) -> bool:
+        """
+        Whether any literal run was collapsed.
+
+        :return: True if text differs from original
+        """
+        return bool(self.segments)
+
+    def to_original(self, position: int) -> int:
+        """
+        Map offset in collapsed text to offset in original SQL.
+
+        Offsets inside placeholder map to start of collapsed run.
+
+        :param position: Offset in collapsed text
+        :return: Offset in original SQL
+        """
+        index = bisect_right(self._starts, position) - 1
+        if index < 0:
+            return position
+        collapsed_start, collapsed_end, original_start, original_end = self.segments[index]
+        if position < collapsed_end:
+            return original_start
+        return position + original_end - collapsed_end
+
+
+def collapse_literals(sql: str, min_length: int = 1024) -> CollapsedSQL:
+    """
+    Collapse long literal runs into single placeholder token.
+
+    Detects 'VALUES (...), (...), ...' rows and 'IN (...)' lists made only of numbers,
+    strings, NULL and booleans, and replaces runs longer than min_length characters
+    with '(?)'. Structural checks and regexes then see tiny statement instead of
+    hundreds of thousands of literal tokens.
+
+    :param sql: SQL text
+    :param min_length: Minimum run length in characters to collapse
+    :return: CollapsedSQL with collapsed text and offset map
+    """
+    if len(sql) < min_length:
+        return CollapsedSQL(sql, [])
+    parts = []
+    segments = []
+    last = 0
+    shift = 0
+    start = _RUN_START_RE.search(sql)
+    while start:
+        run_start = start.end()
+        run_end = _literal_run_end(sql, run_start, rows=start.group(1).upper() == 'VALUES')
+        if run_end is None or run_end - run_start < min_length:
+            start = _RUN_START_RE.search(sql, start.end())
+            continue
+        parts.append(sql[last:run_start])
+        collapsed_start = run_start - shift
+        parts.append(PLACEHOLDER)
+        segments.append((collapsed_start, collapsed_start + len(PLACEHOLDER), run_start, run_end))
+        shift += run_end - run_start - len(PLACEHOLDER)
+        last = run_end
+        start = _RUN_START_RE.search(sql, run_end)
+    if not segments:
+        return CollapsedSQL(sql, [])
+    parts.append(sql[last:])
+    return CollapsedSQL(''.join(parts), segments)
+
+
+def _literal_run_end(sql: str, start: int, rows: bool) -> Optional[int]:
+    """
+    Find end of literal-only run starting at opening parenthesis, in one pass over run.
+
+    Runs hold numbers, strings, NULL and booleans. IN lists end at their closing
+    parenthesis and are rejected if anything else occurs before it. VALUES runs are
+    sequences of parenthesized rows and end after last row closed before first
+    non-literal character.
+
+    :param sql: SQL text
+    :param start: Offset of opening parenthesis
+    :param rows: Whether run is VALUES rows rather than IN list
+    :return: End offset of run, or None if there is no literal-only run
+    """
+    depth, end, position, length = 0, None, start, len(sql)
+    while position < length:
+        char = sql[position]
+        if char == '(':
+            if depth and not rows:
+                return None
+            depth += 1
+        elif char == ')':
+            if depth == 0:
+                break
+            depth -= 1
+            if depth == 0:
+                if not rows:
+                    return position + 1
+                end = position + 1
+        elif depth == 0 and char not in ' \t\r\n,':
+            # Between rows only separators may occur
+            break
+        elif char == "'":
+            # Doubled quotes continue string
+            position = sql.find("'", position + 1)
+            while position != -1 and sql.startswith("''", position):
+                position = sql.find("'", position + 2)
+            if position == -1:
+                break
+        elif char in 'eE' and sql[position - 1] in '0123456789.' and sql[position + 1:position + 2] in tuple('0123456789+-'):
+            pass
+        elif char.isalpha():
+            word = next((word for word in _LITERAL_WORDS if sql[position:position + len(word)].upper() == word), None)
+            following = sql[position + len(word):position + len(word) + 1] if word else ''
+            if word is None or following.isalnum() or following == '_':
+                break
+            position += len(word) - 1
+        elif char not in _LITERAL_CHARS:
+            break
+        position += 1
+    return end if rows else None
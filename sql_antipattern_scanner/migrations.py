@@ -0,0 +1,224 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/migrations.py
+import sqlparse
+from sqlparse import tokens as T
+from collections import namedtuple
+from typing import List, Optional, Tuple
+from sql_antipattern_scanner.antipatterns import Antipattern
+
+MIGRATION_ANTIPATTERNS = {
+    "Blocking Index Creation": Antipattern(
+        "Blocking Index Creation", "Building an index without an online option blocks writes to the table until the whole index is built.",
+        "High", "Build the index online: CREATE INDEX CONCURRENTLY on PostgreSQL, WITH (ONLINE = ON) on SQL Server.",
+        "CREATE INDEX CONCURRENTLY idx_table_column ON table (column)"),
+    "Column Default Rewrite": Antipattern(
+        "Column Default Rewrite", "Adding a column with a default that cannot be stored in the catalog rewrites every row of the table under an exclusive lock.",
+        "High", "Add the column without a default, backfill it in batches, then set the default.",
+        "ALTER TABLE table ADD COLUMN column type; ALTER TABLE table ALTER COLUMN column SET DEFAULT value"),
+    "Column Type Change": Antipattern(
+        "Column Type Change", "Changing a column type rewrites the table and rebuilds its indexes under an exclusive lock.",
+        "High", "Add a column of the new type, backfill it in batches and switch readers over, or use an online schema change tool.",
+        "ALTER TABLE table ADD COLUMN column_new new_type"),
+    "NOT NULL Addition": Antipattern(
+        "NOT NULL Addition", "Adding NOT NULL checks every existing row under an exclusive lock, and a new NOT NULL column without default fails on non-empty tables.",
+        "High", "Add CHECK (column IS NOT NULL) NOT VALID, validate it separately, then set NOT NULL, which then skips the scan.",
+        "ALTER TABLE table ADD CONSTRAINT column_not_null CHECK (column IS NOT NULL) NOT VALID; ALTER TABLE table VALIDATE CONSTRAINT column_not_null"),
+    "Blocking Constraint Validation": Antipattern(
+        "Blocking Constraint Validation", "Adding a CHECK or FOREIGN KEY constraint validates every existing row while blocking writes to the table.",
+        "Medium", "Add the constraint without validating existing rows, then validate it in a separate statement.",
+        "ALTER TABLE table ADD CONSTRAINT name FOREIGN KEY (column) REFERENCES other (id) NOT VALID; ALTER TABLE table VALIDATE CONSTRAINT name"),
+    "Unbatched Write": Antipattern(
+        "Unbatched Write", "UPDATE or DELETE without WHERE or LIMIT changes every row in one transaction, holding row locks and growing logs until it commits.",
+        "High", "Process rows in batches by key range or with LIMIT, committing between batches.",
+        "DELETE FROM table WHERE id IN (SELECT id FROM table WHERE condition LIMIT 10000)"),
+}
+
+# Significant token of statement: upper-cased value, character offsets in statement and parenthesis depth
+_Token = namedtuple('_Token', ['value', 'start', 'end', 'depth'])
+
+# Dialects that build secondary indexes without blocking writes by default, or have no secondary indexes to build
+_ONLINE_INDEX_DIALECTS = ('mysql', 'sqlite', 'snowflake')
+# Functions evaluated per row, so column defaults calling them are never stored in catalog
+_VOLATILE_FUNCTIONS = {'RANDOM', 'RAND', 'CLOCK_TIMESTAMP', 'TIMEOFDAY', 'GEN_RANDOM_UUID', 'UUID_GENERATE_V4', 'UUID', 'NEWID', 'NEXTVAL'}
+# Keywords that can follow 'ALTER COLUMN name' without changing column type (T-SQL uses 'ALTER COLUMN name type')
+_ALTER_COLUMN_ACTIONS = {'SET', 'DROP', 'TYPE', 'ADD', 'RESET', 'OPTIONS', 'RESTART'}
+# How constraint validation is skipped in each dialect; constraints are not checked in dialects absent here
+_NO_VALIDATION_MARKERS = {None: ('NOT', 'VALID'), 'postgres': ('NOT', 'VALID'), 'tsql': ('WITH', 'NOCHECK')}
+
+
+def _tokens(parsed: sqlparse.sql.Statement) -> List[_Token]:
+    """
+    List significant tokens of statement, skipping whitespace and comments.
+    """
+    tokens, position, depth = [], 0, 0
+    for token in parsed.flatten():
+        end = position + len(token.value)
+        if not token.is_whitespace and token.ttype not in T.Comment:
+            if token.value == ')':
+                depth = max(depth - 1, 0)
+            # Multi-word keywords such as 'NOT NULL' are single tokens, with whitespace normalized here
+            tokens.append(_Token(' '.join(token.value.upper().split()), position, end, depth))
+            if token.value == '(':
+                depth += 1
+        position = end
+    return tokens
+
+
+def _find(tokens: List[_Token], *sequence: str) -> Optional[int]:
+    """
+    Find index of first occurrence of token value sequence at top level, or None.
+    """
+    values = [token.value for token in tokens]
+    for i in range(len(values) - len(sequence) + 1):
+        if tokens[i].depth == 0 and tuple(values[i:i + len(sequence)]) == sequence:
+            return i
+    return None
+
+
+def _split_actions(tokens: List[_Token]) -> List[List[_Token]]:
+    """
+    Split tokens of ALTER TABLE into its comma-separated actions.
+    """
+    actions, current = [], []
+    for token in tokens:
+        if token.value == ',' and token.depth == 0:
+            actions.append(current)
+            current = []
+        elif token.value != ';':
+            current.append(token)
+    actions.append(current)
+    return [action for action in actions if action]
+
+
+def _span(sql: str, tokens: List[_Token]) -> Tuple[str, int]:
+    """
+    Get source text covered by tokens and its offset.
+    """
+    return sql[tokens[0].start:tokens[-1].end], tokens[0].start
+
+
+def check_migration(parsed: sqlparse.sql.Statement, dialect: Optional[str] = None) -> List[Tuple[Antipattern, str, int]]:
+    """
+    Check DDL and DML statement for schema changes and writes that lock or rewrite whole tables.
+
+    Statement type comes from sqlparse, so statements other than CREATE INDEX, ALTER TABLE,
+    UPDATE and DELETE cost one type lookup. Rules depend on dialect where engines differ:
+    constant column defaults are stored in catalog by every supported dialect, so only
+    volatile defaults are reported once dialect is known.
+
+    :param parsed: Parsed SQL statement
+    :param dialect: Validated dialect name, or None for conservative generic rules
+    :return: List of tuples containing antipattern, offending SQL and its offset in statement
+    """
+    statement_type = parsed.get_type()
+    # sqlparse cannot type some statements with CTEs, whose write is then found after CTE list
+    if statement_type not in ('CREATE', 'ALTER', 'UPDATE', 'DELETE', 'UNKNOWN'):
+        return []
+    sql = str(parsed)
+    tokens = [token for token in _tokens(parsed) if token.value != ';']
+    if statement_type == 'CREATE':
+        return _check_create_index(sql, tokens, dialect)
+    if statement_type == 'ALTER':
+        return _check_alter_table(sql, tokens, dialect)
+    return _check_write(sql, tokens)
+
+
+def _check_create_index(sql: str, tokens: List[_Token], dialect: Optional[str]) -> List[Tuple[Antipattern, str, int]]:
+    """
+    Report CREATE INDEX that blocks writes while index is built.
+    """
+    values = [token.value for token in tokens]
+    if 'INDEX' not in values[1:4] or dialect in _ONLINE_INDEX_DIALECTS:
+        return []
+    if 'CONCURRENTLY' in values or any(values[i:i + 3] == ['ONLINE', '=', 'ON'] for i in range(len(values))):
+        return []
+    return [(MIGRATION_ANTIPATTERNS["Blocking Index Creation"],) + _span(sql, tokens)]
+
+
+def _check_alter_table(sql: str, tokens: List[_Token], dialect: Optional[str]) -> List[Tuple[Antipattern, str, int]]:
+    """
+    Report ALTER TABLE actions that rewrite table or scan it under exclusive lock.
+    """
+    if len(tokens) < 3 or tokens[1].value != 'TABLE':
+        return []
+    # Actions start after table name, which may be qualified and preceded by IF EXISTS or ONLY
+    name = 2
+    while name < len(tokens) and tokens[name].value in ('IF', 'EXISTS', 'ONLY'):
+        name += 1
+    while name + 2 < len(tokens) and tokens[name + 1].value == '.':
+        name += 2
+    findings = []
+    for action in _split_actions(tokens[name + 1:]):
+        values = [token.value for token in action]
+        if values[:2] in (['WITH', 'CHECK'], ['WITH', 'NOCHECK']) and values[2:3] == ['ADD']:
+            # T-SQL puts validation option before ADD
+            findings.extend(_check_add(sql, action[2:], action[:2], dialect))
+        elif values[0] == 'ADD':
+            findings.extend(_check_add(sql, action, [], dialect))
+        elif values[0] in ('MODIFY', 'CHANGE'):
+            findings.append((MIGRATION_ANTIPATTERNS["Column Type Change"],) + _span(sql, action))
+        elif values[0] == 'ALTER':
+            name = 2 if values[1:2] == ['COLUMN'] else 1
+            following = values[name + 1:]
+            if following[:1] == ['TYPE'] or following[:3] == ['SET', 'DATA', 'TYPE'] or (following and following[0] not in _ALTER_COLUMN_ACTIONS):
+                findings.append((MIGRATION_ANTIPATTERNS["Column Type Change"],) + _span(sql, action))
+            if following[:2] == ['SET', 'NOT NULL'] or (following and following[0] not in _ALTER_COLUMN_ACTIONS and _find(action, 'NOT NULL') is not None):
+                findings.append((MIGRATION_ANTIPATTERNS["NOT NULL Addition"],) + _span(sql, action))
+    return findings
+
+
+def _check_add(sql: str, action: List[_Token], option: List[_Token], dialect: Optional[str]) -> List[Tuple[Antipattern, str, int]]:
+    """
+    Report ADD COLUMN with rewriting default or NOT NULL, and ADD CONSTRAINT that validates existing rows.
+
+    Option holds T-SQL 'WITH CHECK' or 'WITH NOCHECK' preceding ADD, if any.
+    """
+    values = [token.value for token in action]
+    findings = []
+    constraint = next((value for value in values if value in ('CHECK', 'FOREIGN', 'REFERENCES', 'PRIMARY', 'UNIQUE')), None)
+    if values[1:2] == ['CONSTRAINT'] or (constraint is not None and values[1] == constraint):
+        if constraint in ('CHECK', 'FOREIGN', 'REFERENCES') and dialect in _NO_VALIDATION_MARKERS:
+            if _find(option + action, *_NO_VALIDATION_MARKERS[dialect]) is None:
+                findings.append((MIGRATION_ANTIPATTERNS["Blocking Constraint Validation"],) + _span(sql, action))
+        return findings
+    default = _find(action, 'DEFAULT')
+    if default is not None:
+        expression = values[default + 1:]
+        volatile = any(value in _VOLATILE_FUNCTIONS and following == '(' for value, following in zip(expression, expression[1:]))
+        if dialect is None or volatile:
+            findings.append((MIGRATION_ANTIPATTERNS["Column Default Rewrite"],) + _span(sql, action))
+    elif _find(action, 'NOT NULL') is not None:
+        findings.append((MIGRATION_ANTIPATTERNS["NOT NULL Addition"],) + _span(sql, action))
+    return findings
+
+
+def _main_statement(tokens: List[_Token]) -> int:
+    """
+    Find index of first token of main statement, after leading 'WITH' CTE list if any.
+
+    Main statement starts at first top-level token after closing parenthesis of CTE body that
+    is followed by neither ',' nor 'AS', e.g. after '(cols)' of 'name (cols) AS (...)'.
+
+    :return: Index of first token, or len(tokens) if CTE list does not end
+    """
+    if not tokens or tokens[0].value != 'WITH':
+        return 0
+    for i in range(2, len(tokens)):
+        if tokens[i].depth == 0 and tokens[i - 1].value == ')' and tokens[i].value not in (',', 'AS'):
+            return i
+    return len(tokens)
+
+
+def _check_write(sql: str, tokens: List[_Token]) -> List[Tuple[Antipattern, str, int]]:
+    """
+    Report UPDATE or DELETE without WHERE, LIMIT or TOP.
+
+    Only statements that are writes themselves, or whose CTE list is followed by write, are
+    checked, so privileges such as 'GRANT UPDATE, DELETE ON t' are not taken for writes.
+    """
+    write = _main_statement(tokens)
+    if write >= len(tokens) or tokens[write].value not in ('UPDATE', 'DELETE'):
+        return []
+    statement = tokens[write:]
+    if any(token.depth == 0 and token.value in ('WHERE', 'LIMIT', 'TOP') for token in statement):
+        return []
+    return [(MIGRATION_ANTIPATTERNS["Unbatched Write"],) + _span(sql, statement)]
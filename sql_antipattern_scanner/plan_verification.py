@@ -0,0 +1,200 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/plan_verification.py
+import re
+import hashlib
+import sqlite3
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sql_antipattern_scanner.statements import split_statements, locate, normalize_sql
+
+# Plan evidence for finding: verdict is 'full_scan', 'index' or 'unverified'
+PlanEvidence = namedtuple('PlanEvidence', ['verdict', 'plan'])
+
+# Rules whose performance claim is a full table scan that query plan can confirm or refute
+VERIFIABLE_RULES = {
+    "Function in WHERE", "Leading Wildcard", "Both-sided Wildcard", "Subquery in IN clause",
+    "Unindexed Filter Column", "Unindexed Join Column",
+}
+
+VERDICT_RANK = {'full_scan': 0, 'unverified': 1, 'index': 2}
+
+# SQLite reports full scans as 'SCAN t' ('SCAN TABLE t' before 3.36), also when it walks whole covering
+# index, and index lookups as 'SEARCH t USING INDEX ...'
+_FULL_SCAN_RE = re.compile(r'^SCAN (?!CONSTANT ROW)', re.IGNORECASE)
+# DDL clauses of other dialects SQLite does not accept
+_UNSUPPORTED_DDL_RE = re.compile(r'\bCONCURRENTLY\b|\bUSING\s+\w+\s*(?=\()|\bIF\s+NOT\s+EXISTS\b(?=\s+ON\b)', re.IGNORECASE)
+# Pattern literal of LIKE or GLOB, whose leading wildcard decides whether index can be used
+_PATTERN_LITERAL_RE = re.compile(r"\b(LIKE|GLOB)\s+'(.?)", re.IGNORECASE)
+# Actions that reach files outside in-memory database: ATTACH (also used by VACUUM INTO), DETACH and PRAGMA
+_DENIED_ACTIONS = {sqlite3.SQLITE_ATTACH, sqlite3.SQLITE_DETACH, sqlite3.SQLITE_PRAGMA}
+
+
+def statement_fingerprint(sql: str) -> str:
+    """
+    Compute fingerprint of statement shape, shared by statements differing only in literals or formatting.
+
+    Literals are replaced by placeholders, except that LIKE and GLOB patterns keep whether
+    they start with wildcard, since that decides whether SQLite can search an index.
+
+    :param sql: SQL statement
+    :return: Hex fingerprint
+    """
+    patterns = ''.join('w' if first in ('%', '_', '*', '?') else 'p'
+                       for _, first in _PATTERN_LITERAL_RE.findall(sql))
+    return hashlib.sha1((normalize_sql(sql) + '|' + patterns).encode('utf-8')).hexdigest()
+
+
+def _authorize(action: int, *args) -> int:
+    """
+    Deny statements that reach beyond in-memory database, such as ATTACH DATABASE writing files.
+    """
+    return sqlite3.SQLITE_DENY if action in _DENIED_ACTIONS else sqlite3.SQLITE_OK
+
+
+class PlanVerifier:
+    """
+    Confirm full-table-scan findings with EXPLAIN QUERY PLAN on in-memory SQLite stand-in.
+
+    DDL is loaded once; plans are cached per statement fingerprint, so repeated statement
+    shapes across large corpora are explained only once.
+    """
+
+    def __init__(self, ddl: str = ""):
+        """
+        Initialize PlanVerifier and load DDL into in-memory database.
+
+        Statements SQLite cannot execute are skipped and listed in skipped_ddl, as are
+        ATTACH, DETACH, PRAGMA and VACUUM INTO, which could read or write files.
+
+        :param ddl: DDL script creating tables and indexes
+        """
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.set_authorizer(_authorize)
+        self.plans: Dict[str, Optional[List[str]]] = {}
+        self.skipped_ddl: List[str] = []
+        for statement in split_statements(ddl):
+            try:
+                self.connection.execute(_UNSUPPORTED_DDL_RE.sub('', statement.text))
+            except sqlite3.Error:
+                self.skipped_ddl.append(statement.text)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PlanVerifier':
+        """
+        Create PlanVerifier from DDL file or from schema of SQLite database.
+
+        :param path: Path to .sql DDL script or SQLite database file
+        :return: PlanVerifier instance
+        """
+        if path.lower().endswith('.sql'):
+            with open(path, 'r') as f:
+                return cls(f.read())
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            ddl = ';\n'.join(row[0] for row in connection.execute(
+                "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+                "ORDER BY type = 'index'"))
+        finally:
+            connection.close()
+        return cls(ddl)
+
+    def close(self) -> None:
+        """
+        Close in-memory database.
+        """
+        self.connection.close()
+
+    def explain(self, sql: str) -> Optional[List[str]]:
+        """
+        Get query plan of statement, using cache.
+
+        :param sql: SQL statement
+        :return: List of plan detail lines, or None if SQLite cannot prepare statement
+        """
+        fingerprint = statement_fingerprint(sql)
+        if fingerprint not in self.plans:
+            try:
+                # Unbound parameters are bound as NULL, so plan does not depend on argument values
+                rows = self.connection.execute('EXPLAIN QUERY PLAN ' + sql.strip().rstrip(';')).fetchall()
+                self.plans[fingerprint] = [row[-1] for row in rows]
+            except (sqlite3.Error, sqlite3.Warning, ValueError):
+                self.plans[fingerprint] = None
+        return self.plans[fingerprint]
+
+    def evidence(self, sql: str) -> PlanEvidence:
+        """
+        Classify query plan of statement.
+
+        :param sql: SQL statement
+        :return: PlanEvidence with 'full_scan' if plan scans whole table or index
+        """
+        plan = self.explain(sql)
+        if plan is None:
+            return PlanEvidence('unverified', [])
+        if any(_FULL_SCAN_RE.match(detail) for detail in plan):
+            return PlanEvidence('full_scan', plan)
+        return PlanEvidence('index', plan)
+
+    def verify(self, sql: str, issues: List[tuple]) -> List[Optional[PlanEvidence]]:
+        """
+        Attach plan evidence to issues of SQL text.
+
+        Each issue is verified against statement containing its offending SQL.
+
+        :param sql: Scanned SQL text, possibly holding several statements
+        :param issues: List of tuples containing antipattern, offending SQL, and context
+        :return: List of PlanEvidence, or None for rules plans cannot verify, in same order as issues
+        """
+        return self.verify_batch([(sql, issues)])[0]
+
+    def verify_batch(self, items: List[Tuple[str, List[tuple]]]) -> List[List[Optional[PlanEvidence]]]:
+        """
+        Attach plan evidence to issues of many SQL texts.
+
+        Statements are split at most once per text, and every distinct statement shape is
+        explained once across whole batch.
+
+        :param items: List of (SQL text, issues) pairs
+        :return: List of evidence lists, in same order as items
+        """
+        results = []
+        for sql, issues in items:
+            statements = None
+            evidence = []
+            for antipattern, offending_sql, _ in issues:
+                if antipattern.name not in VERIFIABLE_RULES:
+                    evidence.append(None)
+                    continue
+                if statements is None:
+                    statements = [statement.text for statement in split_statements(sql)] or [sql]
+                statement = next((text for text in statements if locate(text, offending_sql) is not None), statements[0])
+                evidence.append(self.evidence(statement))
+            results.append(evidence)
+        return results
+
+
+def rank_issues(issues: list, evidence: List[Optional[PlanEvidence]],
+                key: Callable[[Any], str] = lambda issue: issue[0].severity) -> List[Tuple[Any, Optional[PlanEvidence]]]:
+    """
+    Order issues for triage: confirmed full scans first, refuted ones last, by severity within each group.
+
+    :param issues: List of tuples containing antipattern, offending SQL, and context
+    :param evidence: Plan evidence of issues, as returned by PlanVerifier.verify
+    :param key: Callable returning severity of issue, for issues of other shapes
+    :return: List of (issue, evidence) pairs in triage order
+    """
+    severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+    return sorted(
+        zip(issues, evidence),
+        key=lambda pair: (VERDICT_RANK[pair[1].verdict] if pair[1] else VERDICT_RANK['unverified'],
+                          severity_order.get(key(pair[0]), 4))
+    )
+
+
+def evidence_dict(evidence: Optional[PlanEvidence]) -> Optional[dict]:
+    """
+    Convert plan evidence to report dictionary.
+
+    :param evidence: PlanEvidence or None
+    :return: Dictionary with verdict and plan, or None
+    """
+    return {"verdict": evidence.verdict, "plan": evidence.plan} if evidence else None
@@ -4,7 +4,54 @@ import csv
 from io import StringIO
 from jinja2 import Template
 import os
-from typing import Dict, Any
+import glob
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+# Keys every issue has; any other keys (location, plan evidence, cost) are carried as per-issue extras
+_ISSUE_KEYS = ('name', 'severity', 'description', 'suggestion', 'offending_sql', 'context', 'remediation', 'file', 'line')
+SEVERITIES = ('Critical', 'High', 'Medium', 'Low')
+# Fields reports can be projected to; original_sql is per report, all others per issue
+REPORT_FIELDS = ('file', 'line', 'name', 'severity', 'description', 'suggestion', 'offending_sql', 'context',
+                 'remediation', 'plan_evidence', 'original_sql')
+# Fields of minimal machine output: rule and location only
+MINIMAL_FIELDS = ('file', 'line', 'name', 'severity')
+_FIELD_HEADERS = {'file': 'File', 'line': 'Line', 'name': 'Name', 'severity': 'Severity', 'description': 'Description',
+                  'suggestion': 'Suggestion', 'offending_sql': 'Offending SQL', 'context': 'Context',
+                  'remediation': 'Remediation', 'plan_evidence': 'Plan Verdict'}
+
+
+def parse_fields(spec: str) -> Tuple[str, ...]:
+    """
+    Parse comma-separated list of report fields.
+
+    :param spec: Field names, e.g. 'name,severity,line'
+    :return: Tuple of field names in given order, without duplicates
+    :raises ValueError: If list is empty or names unknown field
+    """
+    fields = tuple(dict.fromkeys(field.strip() for field in spec.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in REPORT_FIELDS]
+    if not fields or unknown:
+        raise ValueError(f"Unknown report field(s) {', '.join(unknown) or '(none given)'}; choose from {', '.join(REPORT_FIELDS)}")
+    return fields
+
+
+def issue_entry(antipattern, offending_sql: str, context: str, fields: Optional[Sequence[str]] = None, **location) -> Dict[str, Any]:
+    """
+    Build report entry of issue.
+
+    :param antipattern: Antipattern of issue
+    :param offending_sql: Offending SQL of issue
+    :param context: Context of issue
+    :param fields: Fields to keep, or None for all
+    :param location: File and line of issue, if located
+    :return: Dictionary with location first, then rule and issue fields
+    """
+    entry = dict(location)
+    entry.update(name=antipattern.name, severity=antipattern.severity, description=antipattern.description,
+                 suggestion=antipattern.suggestion, offending_sql=offending_sql, context=context,
+                 remediation=antipattern.remediation)
+    return entry if fields is None else {field: entry[field] for field in fields if field in entry}
+
 
 class ReportGenerator:
     """
@@ -32,6 +79,11 @@ class ReportGenerator:
                 <h1>SQL Antipattern Scan Report</h1>
             </header>
             <main>
+                {% if partial %}
+                <div class="partial-warning">
+                    <strong>Partial scan:</strong> resource limits exceeded ({{ partial_reasons | join(", ") }}), so some checks were skipped or limited to regex matching.
+                </div>
+                {% endif %}
                 <h2>Summary</h2>
                 <div class="summary-container">
                     <div class="summary-card">
@@ -77,6 +129,8 @@ class ReportGenerator:
                     <details class="issue" data-severity="{{ issue['severity'].lower() }}">
                         <summary>
                             <span class="issue-name">{{ issue['name'] }}</span>
+                            {% if issue.get('file') %}<span class="issue-location">{{ issue['file'] }}:{{ issue['line'] }}</span>{% endif %}
+                            {% if issue.get('estimated_cost') is not none %}<span class="issue-cost" title="{{ issue['cost_factors'] | join(', ') }}">cost {{ '{:,}'.format(issue['estimated_cost']) }}</span>{% endif %}
                             <span class="severity {{ issue['severity'].lower() }}">{{ issue['severity'] }}</span>
                         </summary>
                         <div class="issue-details">
@@ -91,10 +145,37 @@ class ReportGenerator:
                                 <pre><code>{{ issue['context'] }}</code></pre>
                             </div>
                             <p><strong>Remediation:</strong> {{ issue['remediation'] }}</p>
+                            {% if issue.get('plan_evidence') %}
+                            <div class="code-block plan-evidence {{ issue['plan_evidence']['verdict'] }}">
+                                <h4>Query Plan ({{ issue['plan_evidence']['verdict'].replace('_', ' ') }}):</h4>
+                                <pre><code>{{ issue['plan_evidence']['plan'] | join('\n') }}</code></pre>
+                            </div>
+                            {% endif %}
                         </div>
                     </details>
                     {% endfor %}
                 </section>
+                {% if index_recommendations %}
+                <section class="index-recommendations">
+                    <h2>Index Recommendations</h2>
+                    <table>
+                        <thead>
+                            <tr><th>Table</th><th>Columns</th><th>Score</th><th>Statements</th><th>DDL</th></tr>
+                        </thead>
+                        <tbody>
+                            {% for recommendation in index_recommendations %}
+                            <tr>
+                                <td>{{ recommendation['table'] }}</td>
+                                <td>{% for column in recommendation['columns'] %}{{ column }} <span class="index-role">{{ recommendation['roles'][loop.index0] }}</span>{% if not loop.last %}, {% endif %}{% endfor %}</td>
+                                <td>{{ recommendation['score'] }}</td>
+                                <td>{{ recommendation['statements'] }}</td>
+                                <td><code>{{ recommendation['ddl'] }}</code></td>
+                            </tr>
+                            {% endfor %}
+                        </tbody>
+                    </table>
+                </section>
+                {% endif %}
                 <section class="original-sql">
                     <h2>Original SQL</h2>
                     <pre><code>{{ original_sql }}</code></pre>
@@ -174,6 +255,79 @@ class ReportGenerator:
         </html>
         ''')
 
+        # Self-contained report for very large result sets: issue bodies live in lazily loaded data chunks
+        self.large_html_template: Template = Template('''
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>SQL Antipattern Scan Report</title>
+            <style>
+                {{ css_content }}
+            </style>
+        </head>
+        <body>
+            <header>
+                <h1>SQL Antipattern Scan Report</h1>
+            </header>
+            <main>
+                {% if partial %}
+                <div class="partial-warning">
+                    <strong>Partial scan:</strong> resource limits exceeded ({{ partial_reasons | join(", ") | e }}), so some checks were skipped or limited to regex matching.
+                </div>
+                {% endif %}
+                <h2>Summary</h2>
+                <div class="summary-container">
+                    <div class="summary-card">
+                        <h3>Total Issues</h3>
+                        <div class="summary-box">
+                            <p class="large-number">{{ total }}</p>
+                        </div>
+                        <h3>Severity Score</h3>
+                        <div class="summary-box">
+                            <p class="large-number">{{ severity_score }}</p>
+                        </div>
+                    </div>
+                    <div class="chart-card">
+                        <h3>Severity Distribution</h3>
+                        <svg class="severity-bars" width="100%" viewBox="0 0 400 {{ bars | length * 30 }}" role="img" aria-label="Issues by severity">
+                            {% for severity, count, width in bars %}
+                            <text x="0" y="{{ loop.index0 * 30 + 19 }}">{{ severity }}</text>
+                            <rect class="{{ severity.lower() }}" x="70" y="{{ loop.index0 * 30 + 5 }}" width="{{ width }}" height="20"></rect>
+                            <text x="{{ 76 + width }}" y="{{ loop.index0 * 30 + 19 }}">{{ count }}</text>
+                            {% endfor %}
+                        </svg>
+                    </div>
+                </div>
+                <section class="detailed-findings">
+                    <h2>Detailed Findings</h2>
+                    <div class="report-filters">
+                        <select id="filter-severity" aria-label="Severity">
+                            <option value="">All severities</option>
+                            {% for severity in severities %}<option value="{{ severity }}">{{ severity }}</option>{% endfor %}
+                        </select>
+                        <select id="filter-rule" aria-label="Rule">
+                            <option value="">All rules</option>
+                        </select>
+                        <input id="filter-file" type="search" placeholder="Filter by file" aria-label="File">
+                    </div>
+                    <div class="pagination">
+                        <button id="previous-page" type="button">Previous</button>
+                        <span id="page-status"></span>
+                        <button id="next-page" type="button">Next</button>
+                    </div>
+                    <div id="issue-list"></div>
+                </section>
+            </main>
+            <script type="application/json" id="report-index">{{ index_json }}</script>
+            <script>
+                {{ js_content }}
+            </script>
+        </body>
+        </html>
+        ''')
+
     def generate_json(self, report_data: Dict[str, Any]) -> str:
         """
         Generate JSON report from given report data.
@@ -183,22 +337,53 @@ class ReportGenerator:
         """
         return json.dumps(report_data, indent=2)
 
-    def generate_csv(self, report_data: Dict[str, Any]) -> str:
+    def generate_minimal(self, report_data: Dict[str, Any]) -> str:
+        """
+        Generate minimal machine-readable report: JSON Lines, one compact object per issue.
+
+        :param report_data: Dictionary containing report data
+        :return: JSON Lines string, empty if there are no issues
+        """
+        return ''.join(json.dumps(issue, separators=(',', ':')) + '\n' for issue in report_data['issues'])
+
+    def generate_csv(self, report_data: Dict[str, Any], fields: Optional[Sequence[str]] = None) -> str:
         """
         Generate CSV report from given report data.
 
         :param report_data: Dictionary containing report data
+        :param fields: Report fields to write as columns, in order, or None for default columns
         :return: CSV string representation of report
         """
         output = StringIO()
         csv_writer = csv.writer(output)
+
+        # Projected reports get exactly requested columns, in requested order
+        if fields is not None:
+            columns = [field for field in fields if field != 'original_sql']
+            csv_writer.writerow([_FIELD_HEADERS[field] for field in columns])
+            for issue in report_data['issues']:
+                evidence = issue.get('plan_evidence')
+                csv_writer.writerow([(evidence['verdict'] if evidence else '') if field == 'plan_evidence' else issue.get(field, '')
+                                     for field in columns])
+            return output.getvalue()
         
+        # Findings located in files get leading File and Line columns
+        located = any('file' in issue for issue in report_data['issues'])
+
+        # Findings verified against query plans get trailing Plan Verdict column
+        verified = any('plan_evidence' in issue for issue in report_data['issues'])
+
         # Headers
-        csv_writer.writerow(['Name', 'Severity', 'Description', 'Suggestion', 'Offending SQL', 'Context', 'Remediation'])
+        headers = ['Name', 'Severity', 'Description', 'Suggestion', 'Offending SQL', 'Context', 'Remediation']
+        headers = (['File', 'Line'] if located else []) + headers + (['Plan Verdict'] if verified else [])
+        csv_writer.writerow(headers)
         
         # Write data
         for issue in report_data['issues']:
-            csv_writer.writerow([
+            location = [issue.get('file', ''), issue.get('line', '')] if located else []
+            evidence = issue.get('plan_evidence')
+            verdict = [evidence['verdict'] if evidence else ''] if verified else []
+            csv_writer.writerow(location + [
                 issue['name'],
                 issue['severity'],
                 issue['description'],
@@ -206,7 +391,7 @@ class ReportGenerator:
                 issue['offending_sql'],
                 issue['context'],
                 issue['remediation']
-            ])
+            ] + verdict)
         
         return output.getvalue()
 
@@ -261,9 +446,83 @@ class ReportGenerator:
         '''
         report_data['js_content'] = js_content
 
-        # Sort issues by severity
+        # Sort issues by severity, with full scans confirmed by query plan and most expensive statements first
         severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-        report_data['issues'] = sorted(report_data['issues'], key=lambda x: severity_order[x['severity']])
+        report_data['issues'] = sorted(
+            report_data['issues'],
+            key=lambda x: ((x.get('plan_evidence') or {}).get('verdict') != 'full_scan', -(x.get('estimated_cost') or 0),
+                           severity_order[x['severity']])
+        )
 
         # Render template with updated report data
-        return self.html_template.render(**report_data)
\ No newline at end of file
+        return self.html_template.render(**report_data)
+
+    def write_large_html(self, report_data: Dict[str, Any], output_dir: str, chunk_size: int = 1000) -> str:
+        """
+        Write self-contained HTML report for very large result sets.
+
+        Page holds only compact index (rule, file and line of each issue) and inline SVG chart,
+        so it opens quickly with hundreds of thousands of issues. Issue bodies are written to
+        data/chunk-NNNNN.js files that page loads as plain scripts when a page of results needs
+        them, which works from file:// without server or network access.
+
+        :param report_data: Dictionary containing report data
+        :param output_dir: Directory to write index.html and data chunks to
+        :param chunk_size: Number of issues per data chunk
+        :return: Path to index.html
+        """
+        # Order by severity with one pass over issues, keeping existing order (plan, cost) within each severity
+        buckets: Dict[str, List[dict]] = {severity: [] for severity in SEVERITIES}
+        for issue in report_data['issues']:
+            buckets[issue['severity']].append(issue)
+        issues = [issue for severity in SEVERITIES for issue in buckets[severity]]
+
+        # Rules and files are stored once and referenced by position from flat rows array
+        rules: Dict[tuple, int] = {}
+        files: Dict[str, int] = {}
+        rows: List[Any] = []
+        chunks: List[list] = []
+        for number, issue in enumerate(issues):
+            rule = (issue['name'], issue['severity'], issue['description'], issue['suggestion'], issue['remediation'])
+            rows.extend([rules.setdefault(rule, len(rules)), files.setdefault(issue.get('file') or '', len(files)),
+                         issue.get('line') or 0])
+            if number % chunk_size == 0:
+                chunks.append([])
+            extras = {key: value for key, value in issue.items() if key not in _ISSUE_KEYS}
+            chunks[-1].append([issue['offending_sql'], issue['context'], extras or None])
+
+        data_dir = os.path.join(output_dir, 'data')
+        os.makedirs(data_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(data_dir, 'chunk-*.js')):
+            os.remove(stale)
+        for number, chunk in enumerate(chunks):
+            with open(os.path.join(data_dir, f'chunk-{number:05d}.js'), 'w', encoding='utf-8') as f:
+                f.write(f'window.reportChunk({number}, {json.dumps(chunk, separators=(",", ":"))});\n')
+
+        index = {'chunk_size': chunk_size, 'total': len(issues), 'rules': list(rules), 'files': list(files), 'rows': rows}
+        severity_counts = {severity: len(buckets[severity]) for severity in SEVERITIES}
+        largest = max(severity_counts.values()) or 1
+
+        static_dir = os.path.join(os.path.dirname(__file__), 'static')
+        with open(os.path.join(static_dir, 'report_styles.css'), 'r') as css_file:
+            css_content = css_file.read()
+        with open(os.path.join(static_dir, 'large_report.js'), 'r') as js_file:
+            js_content = js_file.read()
+
+        html = self.large_html_template.render(
+            partial=report_data.get('partial'),
+            partial_reasons=report_data.get('partial_reasons', []),
+            total=len(issues),
+            severity_score=report_data['severity_score'],
+            severities=SEVERITIES,
+            bars=[(severity, severity_counts[severity], round(280 * severity_counts[severity] / largest))
+                  for severity in SEVERITIES],
+            # '<' is escaped so SQL text such as '</script>' cannot end the inline index early
+            index_json=json.dumps(index, separators=(',', ':')).replace('<', '\\u003c'),
+            css_content=css_content,
+            js_content=js_content,
+        )
+        path = os.path.join(output_dir, 'index.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        return path
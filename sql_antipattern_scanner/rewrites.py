@@ -0,0 +1,555 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/rewrites.py
+import difflib
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlparse import lexer, tokens as T
+
+# Replacement of sql[start:end], produced by rewrite rule named after antipattern it fixes
+Edit = namedtuple('Edit', ['start', 'end', 'replacement', 'rule'])
+
+RewriteResult = namedtuple('RewriteResult', ['text', 'edits'])
+
+_Token = namedtuple('_Token', ['ttype', 'value', 'start', 'end', 'depth'])
+
+_SKIPPED = (T.Whitespace, T.Newline, T.Comment.Single, T.Comment.Multiline)
+_CLAUSE_KEYWORDS = {'SELECT', 'FROM', 'WHERE', 'GROUP BY', 'HAVING', 'ORDER BY', 'LIMIT', 'OFFSET', 'FETCH', 'SET',
+                    'VALUES', 'UNION', 'UNION ALL', 'INTERSECT', 'EXCEPT', 'RETURNING', 'WINDOW', 'QUALIFY', 'INTO'}
+# Clauses whose '=' assigns: SET of UPDATE, MERGE and ON CONFLICT, and MySQL 'ON DUPLICATE KEY UPDATE'
+_ASSIGNMENT_CLAUSES = {'SET', 'UPDATE'}
+_OPERAND_TYPES = (T.Name, T.Literal.String.Symbol, T.Literal.String.Single, T.Literal.Number.Integer,
+                  T.Literal.Number.Float, T.Name.Placeholder)
+
+
+def _lex(sql: str) -> List[_Token]:
+    """
+    Lex SQL into tokens with character offsets and parenthesis depth, dropping whitespace and comments.
+
+    Parentheses carry depth of their enclosing level, tokens between them one more.
+
+    :param sql: SQL text
+    :return: List of tokens
+    """
+    tokens = []
+    position = 0
+    depth = 0
+    for ttype, value in lexer.tokenize(sql):
+        start = position
+        position += len(value)
+        if ttype in _SKIPPED:
+            continue
+        if ttype is T.Punctuation and value == ')':
+            depth = max(depth - 1, 0)
+        tokens.append(_Token(ttype, value, start, position, depth))
+        if ttype is T.Punctuation and value == '(':
+            depth += 1
+    return tokens
+
+
+def _upper(token: _Token) -> str:
+    """
+    Get upper-cased token value with whitespace collapsed, e.g. 'GROUP BY'.
+    """
+    return ' '.join(token.value.upper().split())
+
+
+def _is_keyword(token: Optional[_Token], *words: str) -> bool:
+    """
+    Check whether token is one of given keywords.
+    """
+    return token is not None and (token.ttype in T.Keyword) and _upper(token) in words
+
+
+def _is_clause(token: _Token) -> bool:
+    """
+    Check whether token starts clause.
+    """
+    return token.ttype is T.Keyword.DML or (token.ttype in T.Keyword and (_upper(token) in _CLAUSE_KEYWORDS or _upper(token).endswith('JOIN')))
+
+
+def _closing(tokens: List[_Token], i: int) -> Optional[int]:
+    """
+    Find index of parenthesis closing one at index i.
+    """
+    for j in range(i + 1, len(tokens)):
+        if tokens[j].value == ')' and tokens[j].depth == tokens[i].depth:
+            return j
+    return None
+
+
+def _operand_end(tokens: List[_Token], i: int) -> Optional[int]:
+    """
+    Find end of simple operand starting at index i: literal, placeholder or possibly qualified name.
+
+    :return: Index after operand, or None if operand is not simple
+    """
+    if i >= len(tokens) or not (tokens[i].ttype in _OPERAND_TYPES or _is_keyword(tokens[i], 'NULL')):
+        return None
+    j = i + 1
+    while j + 1 < len(tokens) and tokens[j].value == '.' and tokens[j + 1].ttype in (T.Name, T.Literal.String.Symbol):
+        j += 2
+    if j < len(tokens) and tokens[j].value == '(':
+        return None
+    return j
+
+
+def _operand_start(tokens: List[_Token], j: int) -> Optional[int]:
+    """
+    Find start of simple column operand ending at index j (inclusive).
+
+    :return: Index of first token of operand, or None if operand is not simple column
+    """
+    if j < 0 or tokens[j].ttype not in (T.Name, T.Literal.String.Symbol):
+        return None
+    i = j
+    while i >= 2 and tokens[i - 1].value == '.' and tokens[i - 2].ttype in (T.Name, T.Literal.String.Symbol):
+        i -= 2
+    return i
+
+
+def _standalone(tokens: List[_Token], i: int, j: int) -> bool:
+    """
+    Check whether predicate spanning tokens i..j-1 is whole boolean operand, not part of larger expression.
+
+    Predicate must follow clause keyword, ON, WHEN, AND, OR, NOT or opening parenthesis, and be
+    followed by clause keyword, THEN, AND, OR, closing parenthesis, semicolon or end of text.
+    """
+    before = tokens[i - 1] if i > 0 else None
+    after = tokens[j] if j < len(tokens) else None
+    return ((before is None or before.value == '(' or _is_clause(before) or _is_keyword(before, 'ON', 'WHEN', 'AND', 'OR', 'NOT'))
+            and (after is None or after.value in (')', ';') or _is_clause(after) or _is_keyword(after, 'THEN', 'AND', 'OR')))
+
+
+def _in_filter(tokens: List[_Token], i: int, j: int) -> bool:
+    """
+    Check whether predicate spanning tokens i..j-1 is AND/OR operand of WHERE or ON condition, not under NOT.
+
+    There NULL and false results both drop row, so predicate may be replaced by one that only
+    agrees on true results. Enclosing parenthesized groups are checked level by level.
+    """
+    while True:
+        before = tokens[i - 1] if i > 0 else None
+        after = tokens[j] if j < len(tokens) else None
+        if after is not None and not (after.value in (')', ';') or _is_clause(after) or _is_keyword(after, 'AND', 'OR')):
+            return False
+        if before is None or not (before.value == '(' or _is_keyword(before, 'WHERE', 'ON', 'AND', 'OR')):
+            return False
+        depth = tokens[i].depth
+        k = i - 1
+        while k >= 0 and tokens[k].depth >= depth and not (tokens[k].depth == depth and (_is_clause(tokens[k]) or _is_keyword(tokens[k], 'ON'))):
+            k -= 1
+        if k < 0:
+            return False
+        if tokens[k].depth == depth:
+            return _is_keyword(tokens[k], 'WHERE', 'ON')
+        close = _closing(tokens, k)
+        if close is None:
+            return False
+        i, j = k, close + 1
+
+
+def _text(sql: str, tokens: List[_Token], i: int, j: int) -> str:
+    """
+    Get source text of tokens i..j-1, keeping original spacing.
+    """
+    return sql[tokens[i].start:tokens[j - 1].end]
+
+
+def _statement_start(tokens: List[_Token], i: int) -> int:
+    """
+    Find index of first token of statement containing index i.
+    """
+    while i > 0 and not (tokens[i - 1].value == ';' and tokens[i - 1].depth == 0):
+        i -= 1
+    return i
+
+
+def _clause_end(tokens: List[_Token], i: int, depth: int) -> int:
+    """
+    Find end of clause whose first token is at index i.
+
+    :return: Index of next clause keyword, closing parenthesis or semicolon at depth, or end of tokens
+    """
+    for j in range(i, len(tokens)):
+        token = tokens[j]
+        if token.depth < depth or (token.depth == depth and (token.value in (')', ';') or _is_clause(token))):
+            return j
+    return len(tokens)
+
+
+def _split(tokens: List[_Token], i: int, j: int, depth: int, separator: Callable[[_Token], bool]) -> List[Tuple[int, int]]:
+    """
+    Split tokens i..j-1 on separator tokens at depth.
+
+    :return: List of (start, end) index pairs of non-empty parts
+    """
+    parts = []
+    start = i
+    for k in range(i, j):
+        if tokens[k].depth == depth and separator(tokens[k]):
+            parts.append((start, k))
+            start = k + 1
+    parts.append((start, j))
+    return [(a, b) for a, b in parts if a < b]
+
+
+def _conjuncts(tokens: List[_Token], i: int, j: int, depth: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Split condition into AND-ed conjuncts, keeping AND of BETWEEN with its predicate.
+
+    :return: List of (start, end) index pairs, or None if condition has top-level OR
+    """
+    parts = []
+    start = i
+    between = False
+    for k in range(i, j):
+        token = tokens[k]
+        if token.depth != depth:
+            continue
+        if _is_keyword(token, 'OR'):
+            return None
+        if _is_keyword(token, 'BETWEEN'):
+            between = True
+        elif _is_keyword(token, 'AND'):
+            if between:
+                between = False
+            else:
+                parts.append((start, k))
+                start = k + 1
+    parts.append((start, j))
+    return [(a, b) for a, b in parts if a < b]
+
+
+def _table_reference(tokens: List[_Token], i: int, j: int) -> Optional[Tuple[str, int]]:
+    """
+    Parse simple table reference 'name [[AS] alias]' spanning tokens i..j-1.
+
+    :return: Tuple of qualifier (alias, or table name) and index after table name, or None
+    """
+    end = _operand_end(tokens, i)
+    if end is None or tokens[i].ttype not in (T.Name, T.Literal.String.Symbol, T.Keyword):
+        return None
+    name = tokens[end - 1].value
+    rest = tokens[end:j]
+    if len(rest) == 2 and _is_keyword(rest[0], 'AS') and rest[1].ttype is T.Name:
+        return rest[1].value, end
+    if len(rest) == 1 and rest[0].ttype is T.Name:
+        return rest[0].value, end
+    if not rest:
+        return name, end
+    return None
+
+
+def _qualifier(tokens: List[_Token], i: int, j: int) -> Optional[str]:
+    """
+    Get qualifier of 'qualifier.column' operand spanning tokens i..j-1.
+    """
+    return tokens[i].value.lower() if j - i == 3 else None
+
+
+def rewrite_null_comparison(sql: str, tokens: List[_Token]) -> List[Edit]:
+    """
+    Rewrite 'col = NULL' to 'col IS NULL' and 'col != NULL' / 'col <> NULL' to 'col IS NOT NULL'.
+
+    Assignments in SET clauses and MySQL 'ON DUPLICATE KEY UPDATE' are left alone.
+    """
+    edits = []
+    clause = {}
+    for i, token in enumerate(tokens):
+        if _is_clause(token):
+            clause[token.depth] = _upper(token)
+        if (token.ttype is T.Operator.Comparison and token.value in ('=', '!=', '<>') and i + 1 < len(tokens)
+                and _is_keyword(tokens[i + 1], 'NULL') and clause.get(token.depth) not in _ASSIGNMENT_CLAUSES):
+            replacement = 'IS NULL' if token.value == '=' else 'IS NOT NULL'
+            edits.append(Edit(token.start, tokens[i + 1].end, replacement, "NULL Comparison"))
+    return edits
+
+
+def rewrite_between(sql: str, tokens: List[_Token]) -> List[Edit]:
+    """
+    Rewrite 'col BETWEEN a AND b' to 'col >= a AND col <= b', and NOT BETWEEN to '(col < a OR col > b)'.
+
+    Only simple operands are rewritten, so column is never evaluated twice with side effects,
+    and only when predicate stands alone, so 'a + b BETWEEN ...' is not split from 'a +'.
+    """
+    edits = []
+    for i, token in enumerate(tokens):
+        if not _is_keyword(token, 'BETWEEN'):
+            continue
+        negated = _is_keyword(tokens[i - 1] if i else None, 'NOT')
+        column_end = i - 1 if negated else i
+        column_start = _operand_start(tokens, column_end - 1)
+        low_end = _operand_end(tokens, i + 1)
+        if column_start is None or low_end is None or not _is_keyword(tokens[low_end] if low_end < len(tokens) else None, 'AND'):
+            continue
+        high_end = _operand_end(tokens, low_end + 1)
+        if high_end is None or not _standalone(tokens, column_start, high_end):
+            continue
+        column = _text(sql, tokens, column_start, column_end)
+        low = _text(sql, tokens, i + 1, low_end)
+        high = _text(sql, tokens, low_end + 1, high_end)
+        if negated:
+            replacement = f"({column} < {low} OR {column} > {high})"
+        else:
+            replacement = f"{column} >= {low} AND {column} <= {high}"
+            if column_start > 0 and _is_keyword(tokens[column_start - 1], 'NOT'):
+                replacement = f"({replacement})"
+        edits.append(Edit(tokens[column_start].start, tokens[high_end - 1].end, replacement, "BETWEEN Operator"))
+    return edits
+
+
+def rewrite_numeric_group_by(sql: str, tokens: List[_Token]) -> List[Edit]:
+    """
+    Replace positional GROUP BY references with expressions of select list.
+    """
+    edits = []
+    for i, token in enumerate(tokens):
+        if not _is_keyword(token, 'GROUP BY'):
+            continue
+        depth = token.depth
+        select = next((k for k in range(i - 1, _statement_start(tokens, i) - 1, -1)
+                       if tokens[k].depth == depth and tokens[k].ttype is T.Keyword.DML), None)
+        if select is None or _upper(tokens[select]) != 'SELECT':
+            continue
+        start = select + 1
+        while start < i and _is_keyword(tokens[start], 'DISTINCT', 'ALL'):
+            start += 1
+        items = _split(tokens, start, _clause_end(tokens, start, depth), depth, lambda t: t.value == ',')
+        expressions = []
+        for a, b in items:
+            if b - a >= 3 and _is_keyword(tokens[b - 2], 'AS'):
+                b -= 2
+            elif b - a >= 2 and tokens[b - 1].ttype is T.Name and tokens[b - 2].value != '.' and tokens[b - 2].ttype not in T.Operator:
+                b -= 1
+            wildcard = any(tokens[k].ttype is T.Wildcard for k in range(a, b))
+            expressions.append(None if wildcard else _text(sql, tokens, a, b))
+        for a, b in _split(tokens, i + 1, _clause_end(tokens, i + 1, depth), depth, lambda t: t.value == ','):
+            if b - a == 1 and tokens[a].ttype is T.Literal.Number.Integer:
+                position = int(tokens[a].value)
+                if 1 <= position <= len(expressions) and expressions[position - 1]:
+                    edits.append(Edit(tokens[a].start, tokens[a].end, expressions[position - 1], "Numeric GROUP BY"))
+    return edits
+
+
+def rewrite_comma_join(sql: str, tokens: List[_Token]) -> List[Edit]:
+    """
+    Rewrite 'FROM a x, b y WHERE x.id = y.a_id AND ...' to 'FROM a x JOIN b y ON x.id = y.a_id WHERE ...'.
+
+    Equality predicates between qualified columns of joined table and earlier tables move
+    into ON clause; tables without such predicate become CROSS JOIN. Only plain table
+    references and WHERE clauses without top-level OR are rewritten.
+    """
+    edits = []
+    for i, token in enumerate(tokens):
+        if not _is_keyword(token, 'FROM'):
+            continue
+        depth = token.depth
+        from_end = _clause_end(tokens, i + 1, depth)
+        items = _split(tokens, i + 1, from_end, depth, lambda t: t.value == ',')
+        if len(items) < 2 or len(items) != sum(1 for k in range(i + 1, from_end) if tokens[k].value == ',' and tokens[k].depth == depth) + 1:
+            continue
+        if from_end < len(tokens) and _upper(tokens[from_end]).endswith('JOIN'):
+            # Mixed comma and explicit joins are left for manual rewrite
+            continue
+        references = [_table_reference(tokens, a, b) for a, b in items]
+        if None in references:
+            continue
+        qualifiers = [reference[0].lower() for reference in references]
+        conjuncts: List[Tuple[int, int]] = []
+        where_end = from_end
+        if from_end < len(tokens) and _is_keyword(tokens[from_end], 'WHERE'):
+            where_end = _clause_end(tokens, from_end + 1, depth)
+            conjuncts = _conjuncts(tokens, from_end + 1, where_end, depth)
+            if conjuncts is None:
+                continue
+        used = set()
+        parts = [_text(sql, tokens, *items[0])]
+        for index in range(1, len(items)):
+            predicates = []
+            for a, b in conjuncts:
+                if (a, b) in used or b - a != 7 or tokens[a + 3].value != '=':
+                    continue
+                pair = {_qualifier(tokens, a, a + 3), _qualifier(tokens, a + 4, b)}
+                if qualifiers[index] in pair and (pair - {qualifiers[index]}) & set(qualifiers[:index]):
+                    predicates.append(_text(sql, tokens, a, b))
+                    used.add((a, b))
+            table = _text(sql, tokens, *items[index])
+            parts.append(f"JOIN {table} ON {' AND '.join(predicates)}" if predicates else f"CROSS JOIN {table}")
+        remaining = [_text(sql, tokens, a, b) for a, b in conjuncts if (a, b) not in used]
+        replacement = ' '.join(parts)
+        if conjuncts:
+            replacement += f" WHERE {' AND '.join(remaining)}" if remaining else ''
+            edits.append(Edit(tokens[items[0][0]].start, tokens[where_end - 1].end, replacement, "ANSI-89 Join"))
+        else:
+            edits.append(Edit(tokens[items[0][0]].start, tokens[items[-1][1] - 1].end, replacement, "ANSI-89 Join"))
+    return edits
+
+
+def rewrite_in_subquery(sql: str, tokens: List[_Token]) -> List[Edit]:
+    """
+    Rewrite 'col IN (SELECT c FROM t [WHERE ...])' to 'EXISTS (SELECT 1 FROM t WHERE ... AND t.c = col)'.
+
+    Only single-table subqueries selecting one column, without grouping, ordering, limits
+    or set operations, are rewritten. Unqualified outer column is qualified with table of
+    single-table outer query, so it cannot be captured by subquery. NOT IN, IN under NOT and
+    IN outside WHERE and ON conditions are left alone, since there IN differs from EXISTS
+    when subquery returns NULL.
+    """
+    edits = []
+    for i, token in enumerate(tokens):
+        if not (_is_keyword(token, 'IN') and i + 2 < len(tokens) and tokens[i + 1].value == '('
+                and _is_keyword(tokens[i + 2], 'SELECT')):
+            continue
+        if i >= 1 and _is_keyword(tokens[i - 1], 'NOT'):
+            continue
+        outer_start = _operand_start(tokens, i - 1)
+        close = _closing(tokens, i + 1)
+        if outer_start is None or close is None or not _in_filter(tokens, outer_start, close + 1):
+            continue
+        depth = tokens[i + 2].depth
+        select_start = i + 3
+        if _is_keyword(tokens[select_start], 'DISTINCT'):
+            select_start += 1
+        column_end = _operand_end(tokens, select_start)
+        if column_end is None or not _is_keyword(tokens[column_end], 'FROM'):
+            continue
+        table_end = _clause_end(tokens, column_end + 1, depth)
+        reference = _table_reference(tokens, column_end + 1, table_end)
+        if reference is None or not (table_end == close or _is_keyword(tokens[table_end], 'WHERE')):
+            continue
+        if table_end != close and _clause_end(tokens, table_end + 1, depth) != close:
+            continue
+        inner_qualifier = reference[0]
+        inner_column = _text(sql, tokens, select_start, column_end)
+        if column_end - select_start == 1:
+            inner_column = f"{inner_qualifier}.{inner_column}"
+        outer = _text(sql, tokens, outer_start, i)
+        if i - outer_start == 1:
+            outer_qualifier = _outer_table(tokens, i, tokens[i].depth)
+            if outer_qualifier is None:
+                continue
+            outer = f"{outer_qualifier}.{outer}"
+        if outer.split('.')[0].lower() == inner_qualifier.lower():
+            continue
+        correlation = f"{inner_column} = {outer}"
+        source = _text(sql, tokens, column_end + 1, table_end)
+        if table_end == close:
+            condition = f"WHERE {correlation}"
+        else:
+            where = _text(sql, tokens, table_end + 1, close)
+            if _conjuncts(tokens, table_end + 1, close, depth) is None:
+                where = f"({where})"
+            condition = f"WHERE {where} AND {correlation}"
+        replacement = f"EXISTS (SELECT 1 FROM {source} {condition})"
+        edits.append(Edit(tokens[outer_start].start, tokens[close].end, replacement, "Subquery in IN clause"))
+    return edits
+
+
+def _outer_table(tokens: List[_Token], i: int, depth: int) -> Optional[str]:
+    """
+    Get qualifier of only table of query level containing index i.
+
+    :return: Alias or table name, or None if level does not read exactly one plain table
+    """
+    k = i
+    while k > 0 and not (tokens[k].depth == depth and _is_keyword(tokens[k], 'FROM')):
+        if tokens[k].depth < depth or (tokens[k].value == ';' and tokens[k].depth == 0):
+            return None
+        k -= 1
+    if not _is_keyword(tokens[k], 'FROM'):
+        return None
+    end = _clause_end(tokens, k + 1, depth)
+    reference = _table_reference(tokens, k + 1, end)
+    return reference[0] if reference else None
+
+
+REWRITE_RULES: Dict[str, Callable[[str, List[_Token]], List[Edit]]] = {
+    "ANSI-89 Join": rewrite_comma_join,
+    "Subquery in IN clause": rewrite_in_subquery,
+    "NULL Comparison": rewrite_null_comparison,
+    "BETWEEN Operator": rewrite_between,
+    "Numeric GROUP BY": rewrite_numeric_group_by,
+}
+
+
+def apply_edits(sql: str, edits: List[Edit]) -> Tuple[str, List[Edit]]:
+    """
+    Splice non-overlapping edits into SQL text.
+
+    Edits are applied by start offset; edit overlapping earlier one is skipped.
+
+    :param sql: SQL text
+    :param edits: Edits with offsets into sql
+    :return: Tuple of rewritten text and applied edits
+    """
+    applied = []
+    last = 0
+    for edit in sorted(edits, key=lambda e: (e.start, -e.end)):
+        if edit.start >= last:
+            applied.append(edit)
+            last = edit.end
+    parts = []
+    position = 0
+    for edit in applied:
+        parts.append(sql[position:edit.start])
+        parts.append(edit.replacement)
+        position = edit.end
+    parts.append(sql[position:])
+    return ''.join(parts), applied
+
+
+class RewriteEngine:
+    """
+    Rewrite mechanically fixable antipatterns by splicing replacements at token offsets.
+
+    Text outside edited spans, including comments and formatting, is kept as is.
+    """
+
+    def __init__(self, rules: Optional[List[str]] = None, max_passes: int = 5):
+        """
+        Initialize RewriteEngine.
+
+        :param rules: Antipattern names to rewrite (all of REWRITE_RULES if omitted)
+        :param max_passes: Maximum number of passes; nested edits skipped as overlapping are retried in next pass
+        :raises ValueError: If rule has no rewrite
+        """
+        unknown = set(rules or []) - set(REWRITE_RULES)
+        if unknown:
+            raise ValueError(f"No rewrite for: {', '.join(sorted(unknown))}")
+        self.rules = [REWRITE_RULES[name] for name in (rules or REWRITE_RULES)]
+        self.max_passes = max_passes
+
+    def edits(self, sql: str) -> List[Edit]:
+        """
+        Compute edits of all rules for SQL text without applying them.
+
+        :param sql: SQL text
+        :return: List of edits, possibly overlapping
+        """
+        tokens = _lex(sql)
+        return [edit for rule in self.rules for edit in rule(sql, tokens)]
+
+    def rewrite(self, sql: str) -> RewriteResult:
+        """
+        Rewrite SQL text.
+
+        :param sql: SQL text, possibly holding several statements
+        :return: RewriteResult with rewritten text and applied edits (offsets relative to text of their pass)
+        """
+        applied: List[Edit] = []
+        for _ in range(self.max_passes):
+            sql, edits = apply_edits(sql, self.edits(sql))
+            if not edits:
+                break
+            applied.extend(edits)
+        return RewriteResult(sql, applied)
+
+    def patch(self, sql: str, path: str = 'query.sql') -> str:
+        """
+        Rewrite SQL text and render result as unified diff.
+
+        :param sql: SQL text
+        :param path: File path shown in diff headers
+        :return: Unified diff, empty if nothing was rewritten
+        """
+        rewritten = self.rewrite(sql).text
+        return ''.join(difflib.unified_diff(sql.splitlines(True), rewritten.splitlines(True), f"a/{path}", f"b/{path}"))
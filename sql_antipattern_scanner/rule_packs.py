@@ -0,0 +1,497 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/rule_packs.py
+import re
+import os
+import json
+import hashlib
+import tempfile
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import yaml
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+from sql_antipattern_scanner.antipatterns import Antipattern
+from sql_antipattern_scanner.dialects import SUPPORTED_DIALECTS
+
+RULE_PACK_ENTRY_POINT_GROUP = 'sql_antipattern_scanner.rule_packs'
+RULE_PACK_FORMAT_VERSION = 4
+SEVERITIES = ('Low', 'Medium', 'High', 'Critical')
+CLAUSES = ('SELECT', 'FROM', 'JOIN', 'ON', 'WHERE', 'GROUP BY', 'HAVING', 'ORDER BY', 'LIMIT', 'SET', 'VALUES')
+
+Rule = namedtuple('Rule', ['antipattern', 'keywords', 'sequence', 'regex', 'clauses', 'dialects'])
+
+_WORD_RE = re.compile(r'\w+')
+_STRING_RE = re.compile(r"'[^']*(?:''[^']*)*'|\"[^\"]*(?:\"\"[^\"]*)*\"")
+_CLAUSE_TOKEN_RE = re.compile(
+    r'\(|\)|\b(SELECT|FROM|JOIN|ON|WHERE|GROUP\s+BY|HAVING|ORDER\s+BY|LIMIT|SET|VALUES)\b',
+    re.IGNORECASE
+)
+
+
+def _sequence_to_regex(sequence: List[str]) -> str:
+    """
+    Translate token sequence into regex over raw SQL text.
+
+    Word tokens match case-insensitively on word boundaries, punctuation matches
+    literally, '?' matches any single token and '...' matches any run of tokens.
+
+    :param sequence: List of tokens
+    :return: Regex source string
+    """
+    parts = []
+    for token in sequence:
+        if token == '...':
+            parts.append(r'.*?')
+        elif token == '?':
+            parts.append(r'(?:\w+|\S)')
+        elif _WORD_RE.fullmatch(token):
+            parts.append(r'\b' + re.escape(token) + r'\b')
+        else:
+            parts.append(re.escape(token))
+    return r'\s*'.join(parts)
+
+
+def _keywords_to_regex(keywords: List[str]) -> str:
+    """
+    Translate keyword triggers into single alternation regex.
+
+    :param keywords: List of keywords, multi-word keywords allowed
+    :return: Regex source string
+    """
+    alternatives = []
+    for keyword in keywords:
+        # Word boundaries only where keyword starts or ends with word character, so 'RAND()' and '@@IDENTITY' match
+        source = r'\s+'.join(re.escape(word) for word in keyword.split())
+        if _WORD_RE.match(keyword[0]):
+            source = r'\b' + source
+        if _WORD_RE.match(keyword[-1]):
+            source += r'\b'
+        alternatives.append(source)
+    return '(?:' + '|'.join(alternatives) + ')'
+
+
+def _regex_words(regex: str) -> List[str]:
+    """
+    Find whole words every match of regex contains.
+
+    Words are runs of literal word characters at top level of pattern (outside alternations
+    and character classes) bounded on both sides by '\\b' or by something that can only
+    match non-word characters, such as '(' or '\\s+', so they show up as whole words in
+    matched SQL.
+
+    :param regex: Regex source
+    :return: List of upper-cased words, in pattern order
+    """
+    # Elements: word character, True for boundary or non-word text, False for optional non-word text, None otherwise
+    elements: List[Any] = []
+
+    def non_word(opcode, argument) -> bool:
+        if opcode is sre_parse.LITERAL:
+            return not _WORD_RE.match(chr(argument))
+        if opcode is sre_parse.IN:
+            return all(non_word(*item) for item in argument)
+        return opcode is sre_parse.CATEGORY and argument in (sre_parse.CATEGORY_SPACE, sre_parse.CATEGORY_NOT_WORD)
+
+    def flatten(pattern) -> None:
+        for opcode, argument in pattern:
+            if opcode is sre_parse.LITERAL and _WORD_RE.match(chr(argument)):
+                elements.append(chr(argument))
+            elif opcode is sre_parse.SUBPATTERN:
+                flatten(argument[-1])
+            elif (opcode is sre_parse.AT and argument is sre_parse.AT_BOUNDARY) or non_word(opcode, argument):
+                elements.append(True)
+            elif opcode in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and all(non_word(*item) for item in argument[2]):
+                elements.append(bool(argument[0]))
+            else:
+                elements.append(None)
+
+    flatten(sre_parse.parse(regex))
+    elements = [element for element in elements if element is not False]
+    words, run, bounded = [], '', False
+    for element in elements + [None]:
+        if isinstance(element, str):
+            run += element
+            continue
+        if run and bounded and element is True:
+            words.append(run.upper())
+        run = ''
+        bounded = element is True
+    return words
+
+
+def rule_triggers(rule: 'Rule') -> Tuple[str, ...]:
+    """
+    Get trigger words of rule: some trigger occurs as whole word in any SQL text rule matches.
+
+    Keywords trigger on their first word, token sequences on their first word token, and
+    regex rules without keywords on longest word pattern requires.
+
+    :param rule: Validated rule
+    :return: Tuple of upper-cased trigger words, empty if rule cannot be indexed
+    """
+    if rule.keywords:
+        runs = [_WORD_RE.search(keyword) for keyword in rule.keywords]
+        # Keyword without any word could match anywhere, so rule cannot be indexed
+        return tuple(dict.fromkeys(run.group(0).upper() for run in runs)) if all(runs) else ()
+    if rule.sequence:
+        return tuple(token.upper() for token in rule.sequence if _WORD_RE.fullmatch(token))[:1]
+    return tuple(sorted(_regex_words(rule.regex), key=len, reverse=True)[:1])
+
+
+def clause_spans(sql: str) -> Tuple[List[int], List[Optional[str]]]:
+    """
+    Compute clause segments of SQL text.
+
+    Each segment is described by its start offset and clause keyword. Parenthesised
+    expressions inherit enclosing clause until they introduce their own keyword, and
+    enclosing clause is restored on closing parenthesis. String literals are ignored.
+
+    :param sql: SQL text
+    :return: Tuple of sorted segment start offsets and matching clause names
+    """
+    masked = _STRING_RE.sub(lambda m: ' ' * len(m.group(0)), sql)
+    starts: List[int] = [0]
+    clauses: List[Optional[str]] = [None]
+    stack: List[Optional[str]] = []
+    current: Optional[str] = None
+    for match in _CLAUSE_TOKEN_RE.finditer(masked):
+        token = match.group(0)
+        if token == '(':
+            stack.append(current)
+        elif token == ')':
+            current = stack.pop() if stack else None
+        else:
+            current = ' '.join(token.upper().split())
+        starts.append(match.end())
+        clauses.append(current)
+    return starts, clauses
+
+
+def clause_at(spans: Tuple[List[int], List[Optional[str]]], position: int) -> Optional[str]:
+    """
+    Look up clause containing position.
+
+    :param spans: Spans produced by clause_spans
+    :param position: Offset into SQL text
+    :return: Clause name or None if position precedes any clause keyword
+    """
+    starts, clauses = spans
+    return clauses[max(bisect_right(starts, position) - 1, 0)]
+
+
+class RulePack:
+    """
+    Declarative collection of antipattern rules.
+
+    Rule packs are plain dictionaries (usually loaded from YAML or JSON files) with
+    'name' and 'rules' keys. Each rule carries Antipattern metadata plus at least one
+    of 'keywords', 'sequence' or 'regex', and optionally a 'clause' scope and list of
+    'dialects' the rule is limited to. Every rule must yield trigger word (see
+    rule_triggers); regex rules without one need 'keywords' naming words they match.
+    """
+
+    def __init__(self, name: str, rules: List[Rule]):
+        """
+        Initialize RulePack.
+
+        :param name: Name of rule pack
+        :param rules: List of validated rules
+        """
+        self.name = name
+        self.rules = rules
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RulePack':
+        """
+        Build rule pack from its dictionary representation.
+
+        :param data: Rule pack dictionary
+        :return: RulePack instance
+        :raises ValueError: If rule pack is malformed
+        """
+        if not isinstance(data, dict) or not isinstance(data.get('rules'), list):
+            raise ValueError("Rule pack must be a mapping with a 'rules' list")
+        name = str(data.get('name', 'unnamed'))
+        rules = [cls._parse_rule(name, index, rule) for index, rule in enumerate(data['rules'])]
+        return cls(name, rules)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'RulePack':
+        """
+        Load rule pack from YAML or JSON file.
+
+        :param path: Path to rule pack file
+        :return: RulePack instance
+        """
+        with open(path, 'r') as f:
+            return cls.from_text(f.read(), path)
+
+    @classmethod
+    def from_text(cls, text: str, path: str = '') -> 'RulePack':
+        """
+        Parse rule pack from YAML or JSON text.
+
+        :param text: Rule pack source
+        :param path: Originating path, used to pick parser by extension
+        :return: RulePack instance
+        """
+        if path.endswith('.json'):
+            data = json.loads(text)
+        else:
+            data = yaml.safe_load(text)
+        return cls.from_dict(data)
+
+    @staticmethod
+    def _parse_rule(pack_name: str, index: int, rule: Dict[str, Any]) -> Rule:
+        """
+        Validate single rule definition.
+
+        :param pack_name: Name of owning rule pack, used in error messages
+        :param index: Position of rule in pack
+        :param rule: Rule dictionary
+        :return: Validated Rule
+        :raises ValueError: If rule is malformed
+        """
+        where = f"Rule #{index} in pack '{pack_name}'"
+        if not isinstance(rule, dict):
+            raise ValueError(f"{where} must be a mapping")
+        missing = [field for field in Antipattern._fields if field not in rule]
+        if missing:
+            raise ValueError(f"{where} is missing fields: {', '.join(missing)}")
+        if rule['severity'] not in SEVERITIES:
+            raise ValueError(f"{where} has unknown severity: {rule['severity']}")
+
+        keywords = rule.get('keywords') or []
+        sequence = rule.get('sequence') or []
+        regex = rule.get('regex')
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        if isinstance(sequence, str):
+            sequence = sequence.split()
+        if not (keywords or sequence or regex):
+            raise ValueError(f"{where} needs at least one of 'keywords', 'sequence' or 'regex'")
+        if sequence and regex:
+            raise ValueError(f"{where} cannot define both 'sequence' and 'regex'")
+        if regex:
+            try:
+                re.compile(regex)
+            except re.error as e:
+                raise ValueError(f"{where} has invalid regex: {e}")
+
+        clauses = rule.get('clause') or []
+        if isinstance(clauses, str):
+            clauses = [clauses]
+        clauses = [' '.join(clause.upper().split()) for clause in clauses]
+        unknown = [clause for clause in clauses if clause not in CLAUSES]
+        if unknown:
+            raise ValueError(f"{where} has unknown clause scope: {', '.join(unknown)}")
+
+        dialects = rule.get('dialects') or []
+        if isinstance(dialects, str):
+            dialects = [dialects]
+        dialects = [dialect.lower() for dialect in dialects]
+        unknown = [dialect for dialect in dialects if dialect not in SUPPORTED_DIALECTS]
+        if unknown:
+            raise ValueError(f"{where} has unknown dialects: {', '.join(unknown)}")
+
+        antipattern = Antipattern(**{field: str(rule[field]) for field in Antipattern._fields})
+        parsed = Rule(antipattern, tuple(keywords), tuple(sequence), regex, tuple(clauses), tuple(dialects))
+        if not rule_triggers(parsed):
+            raise ValueError(f"{where} has no word to trigger on; add 'keywords' listing words every match contains")
+        return parsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert rule pack to dictionary accepted by from_dict.
+
+        :return: Rule pack dictionary with normalized rules
+        """
+        return {
+            'name': self.name,
+            'rules': [
+                dict(rule.antipattern._asdict(), keywords=list(rule.keywords), sequence=list(rule.sequence),
+                     regex=rule.regex, clause=list(rule.clauses), dialects=list(rule.dialects))
+                for rule in self.rules
+            ],
+        }
+
+    def compile(self) -> 'CompiledRulePack':
+        """
+        Compile rule pack into optimized matcher.
+
+        :return: CompiledRulePack instance
+        """
+        return CompiledRulePack(self.name, self.rules)
+
+
+class CompiledRulePack:
+    """
+    Optimized matcher for rule pack.
+
+    Every rule is reduced to one compiled regex plus a set of trigger words. Matching
+    tokenizes SQL into its distinct words once and evaluates only rules whose trigger
+    words occur, so cost grows with the number of plausible rules rather than the size
+    of the pack.
+    """
+
+    def __init__(self, name: str, rules: List[Rule]):
+        """
+        Initialize CompiledRulePack.
+
+        :param name: Name of rule pack
+        :param rules: List of validated rules
+        """
+        self.name = name
+        self.rules = rules
+        self.matchers: List[Tuple[re.Pattern, Antipattern, Tuple[str, ...]]] = []
+        self.trigger_index: Dict[str, List[int]] = {}
+
+        for index, rule in enumerate(rules):
+            if rule.sequence:
+                source = _sequence_to_regex(list(rule.sequence))
+            elif rule.regex:
+                source = rule.regex
+            else:
+                source = _keywords_to_regex(list(rule.keywords))
+            self.matchers.append((re.compile(source, re.IGNORECASE | re.DOTALL), rule.antipattern, rule.clauses))
+
+            for trigger in rule_triggers(rule):
+                self.trigger_index.setdefault(trigger, []).append(index)
+
+    def for_dialect(self, dialect: Optional[str]) -> 'CompiledRulePack':
+        """
+        Restrict matcher to rules applicable to dialect.
+
+        :param dialect: Dialect name, or None to keep every rule
+        :return: CompiledRulePack containing only applicable rules
+        """
+        if dialect is None or not any(rule.dialects for rule in self.rules):
+            return self
+        return CompiledRulePack(self.name, [rule for rule in self.rules if not rule.dialects or dialect in rule.dialects])
+
+    def candidates(self, sql: str) -> List[int]:
+        """
+        Select rules worth evaluating against SQL.
+
+        :param sql: SQL text
+        :return: Sorted list of rule indices
+        """
+        words = {word.upper() for word in _WORD_RE.findall(sql)}
+        selected = set()
+        for word in words.intersection(self.trigger_index):
+            selected.update(self.trigger_index[word])
+        return sorted(selected)
+
+    def match(self, sql: str, ignored: Iterable[str] = ()) -> List[Tuple[Antipattern, str, int]]:
+        """
+        Match rule pack against SQL.
+
+        :param sql: SQL text
+        :param ignored: Names of antipatterns to skip
+        :return: List of tuples containing antipattern, offending SQL and match offset
+        """
+        ignored = set(ignored)
+        results = []
+        spans = None
+        for index in self.candidates(sql):
+            pattern, antipattern, clauses = self.matchers[index]
+            if antipattern.name in ignored:
+                continue
+            for match in pattern.finditer(sql):
+                if clauses:
+                    if spans is None:
+                        spans = clause_spans(sql)
+                    if clause_at(spans, match.start()) not in clauses:
+                        continue
+                results.append((antipattern, match.group(0), match.start()))
+        return results
+
+
+def _cache_dir() -> str:
+    """
+    Get default directory for compiled rule pack cache.
+
+    :return: Cache directory path
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'sql_antipattern_scanner', 'rule_packs')
+
+
+def load_rule_pack(path: str, cache_dir: Optional[str] = None, use_cache: bool = True) -> CompiledRulePack:
+    """
+    Load and compile rule pack, reusing normalized rule data when source is unchanged.
+
+    Rules are cached as plain JSON under hash of source file contents, so subsequent
+    loads skip YAML parsing. Cached data is validated again like any rule pack, and
+    never deserialized into code, so cache directory writable by others cannot run code.
+
+    :param path: Path to YAML or JSON rule pack
+    :param cache_dir: Directory for normalized rule data (defaults to user cache directory)
+    :param use_cache: Whether to read and write rule data cache
+    :return: CompiledRulePack instance
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    if not use_cache:
+        return RulePack.from_text(source.decode('utf-8'), path).compile()
+
+    digest = hashlib.sha256(source + f"|v{RULE_PACK_FORMAT_VERSION}|{os.path.splitext(path)[1]}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir or _cache_dir(), f"{digest}.json")
+    try:
+        with open(cache_path, 'r') as f:
+            return RulePack.from_dict(json.load(f)).compile()
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        pass
+
+    rule_pack = RulePack.from_text(source.decode('utf-8'), path)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(rule_pack.to_dict(), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return rule_pack.compile()
+
+
+def _entry_points(group: str) -> List[Any]:
+    """
+    List installed entry points in group.
+
+    :param group: Entry point group name
+    :return: List of entry points
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return []
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+def discover_rule_packs(cache_dir: Optional[str] = None) -> List[CompiledRulePack]:
+    """
+    Load rule packs advertised by installed packages.
+
+    Packages register rule packs under 'sql_antipattern_scanner.rule_packs' entry point
+    group. Entry point may resolve to path of rule pack file, rule pack dictionary, or
+    callable returning either.
+
+    :param cache_dir: Directory for compiled matchers
+    :return: List of compiled rule packs
+    """
+    packs = []
+    for entry_point in _entry_points(RULE_PACK_ENTRY_POINT_GROUP):
+        target = entry_point.load()
+        if callable(target):
+            target = target()
+        if isinstance(target, dict):
+            packs.append(RulePack.from_dict(target).compile())
+        else:
+            packs.append(load_rule_pack(str(target), cache_dir=cache_dir))
+    return packs
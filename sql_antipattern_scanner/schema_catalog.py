@@ -0,0 +1,527 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/schema_catalog.py
+import re
+import json
+import sqlite3
+from collections import namedtuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from sql_antipattern_scanner.antipatterns import Antipattern
+from sql_antipattern_scanner.rule_packs import clause_spans, clause_at
+from sql_antipattern_scanner.statements import split_statements
+
+TableInfo = namedtuple('TableInfo', ['name', 'columns', 'indexes', 'row_count'])
+
+SCHEMA_ANTIPATTERNS = {
+    "Unindexed Filter Column": Antipattern(
+        "Unindexed Filter Column", "Filtering on a column that no index starts with forces a scan of the table.",
+        "Medium", "Add an index whose leading column is the filtered column, or filter on an indexed column.",
+        "CREATE INDEX idx_table_column ON table (column)"),
+    "Unindexed Join Column": Antipattern(
+        "Unindexed Join Column", "Joining on a column that no index starts with forces a scan of the joined table for every outer row or a hash join over the whole table.",
+        "High", "Add an index on the join column of the joined table.",
+        "CREATE INDEX idx_table_join_column ON table (join_column)"),
+}
+
+_IDENTIFIER = r'(?:"[^"]+"|`[^`]+`|\[[^\]]+\]|\w+)(?:\.(?:"[^"]+"|`[^`]+`|\[[^\]]+\]|\w+))*'
+_CREATE_TABLE_RE = re.compile(r'\bCREATE\s+(?:\w+\s+)*?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(' + _IDENTIFIER + r')\s*\(', re.IGNORECASE)
+_CREATE_INDEX_RE = re.compile(
+    r'\bCREATE\s+(?:UNIQUE\s+)?(?:CLUSTERED\s+|NONCLUSTERED\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?'
+    r'(?:' + _IDENTIFIER + r'\s+)?ON\s+(?:ONLY\s+)?(' + _IDENTIFIER + r')\s*(?:USING\s+\w+\s*)?\(', re.IGNORECASE)
+_NOT_ALIASES = {
+    'WHERE', 'ON', 'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'CROSS', 'OUTER', 'NATURAL', 'GROUP', 'ORDER',
+    'LIMIT', 'HAVING', 'UNION', 'SET', 'VALUES', 'USING', 'SELECT', 'WITH', 'OFFSET', 'WINDOW', 'QUALIFY', 'AS',
+}
+# Keywords are not taken as aliases, so 'FROM a JOIN b' still matches 'JOIN b'
+_TABLE_REF_RE = re.compile(r'(\bFROM|\bJOIN|\bUPDATE|\bINTO|,)\s+(' + _IDENTIFIER + r')(?:\s+(?:AS\s+)?(?!(?:'
+                           + '|'.join(sorted(_NOT_ALIASES)) + r')\b)(\w+))?', re.IGNORECASE)
+_COLUMN_REF_RE = r'((?:\w+\.)?\w+)'
+_PREDICATE_RE = re.compile(_COLUMN_REF_RE + r'\s*(?:=|<>|!=|<=|>=|<|>|\bIN\b|\bBETWEEN\b|\bLIKE\b)', re.IGNORECASE)
+_JOIN_PREDICATE_RE = re.compile(r'(\w+\.\w+)\s*=\s*(\w+\.\w+)')
+_FUNCTION_ARG_RE = re.compile(r'\b(\w+)\s*\(\s*((?:\w+\.)?\w+)\s*[,)]')
+_LIKE_RE = re.compile(_COLUMN_REF_RE + r'\s+(?:NOT\s+)?I?LIKE\s+[\'"](%?)', re.IGNORECASE)
+
+
+def _unquote(identifier: str) -> str:
+    """
+    Normalize identifier: drop quoting and schema prefix, lower-case.
+
+    :param identifier: Possibly quoted, possibly qualified identifier
+    :return: Bare lower-cased name
+    """
+    return identifier.split('.')[-1].strip('"`[]').lower()
+
+
+def table_references(sql: str, spans=None) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Find table references of statement: tables after FROM, JOIN, UPDATE and INTO, and comma-separated FROM items.
+
+    :param sql: SQL statement
+    :param spans: Clause spans of sql from clause_spans, computed if omitted
+    :return: Iterator of (introducing keyword, bare lower-cased table name, lower-cased alias or None) tuples
+    """
+    spans = spans if spans is not None else clause_spans(sql)
+    for match in _TABLE_REF_RE.finditer(sql):
+        keyword = match.group(1).upper()
+        if keyword == ',' and clause_at(spans, match.start()) != 'FROM':
+            continue
+        table = _unquote(match.group(2))
+        if table.upper() in _NOT_ALIASES:
+            continue
+        alias = match.group(3)
+        yield keyword, table, alias.lower() if alias and alias.upper() not in _NOT_ALIASES else None
+
+
+def join_predicates(sql: str) -> Iterator[re.Match]:
+    """
+    Find equality predicates between qualified columns, such as 'a.id = b.a_id'.
+
+    :param sql: SQL text
+    :return: Iterator of matches, group 1 and 2 holding left and right column references
+    """
+    return _JOIN_PREDICATE_RE.finditer(sql)
+
+
+def _split_top_level(body: str) -> List[str]:
+    """
+    Split comma-separated list, ignoring commas inside parentheses.
+
+    :param body: Text between outer parentheses
+    :return: List of stripped elements
+    """
+    parts, depth, start = [], 0, 0
+    for position, char in enumerate(body):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(body[start:position].strip())
+            start = position + 1
+    parts.append(body[start:].strip())
+    return [part for part in parts if part]
+
+
+def _parenthesised(sql: str, start: int) -> Tuple[str, int]:
+    """
+    Extract text between parenthesis at start and its matching closing parenthesis.
+
+    :param sql: SQL text
+    :param start: Offset just after opening parenthesis
+    :return: Tuple of enclosed text and offset after closing parenthesis
+    """
+    depth = 1
+    for position in range(start, len(sql)):
+        if sql[position] == '(':
+            depth += 1
+        elif sql[position] == ')':
+            depth -= 1
+            if depth == 0:
+                return sql[start:position], position + 1
+    return sql[start:], len(sql)
+
+
+def _column_list(text: str) -> Tuple[str, ...]:
+    """
+    Parse index column list, keeping first word of each element.
+
+    :param text: Comma-separated index columns, possibly with ordering or expressions
+    :return: Tuple of column names
+    """
+    return tuple(_unquote(part.split()[0]) for part in _split_top_level(text))
+
+
+class SchemaCatalog:
+    """
+    In-memory index of tables, columns, indexes and row-count estimates.
+
+    Lookups by table name, by (table, column) for index coverage and by column name
+    for owning tables are dictionary or set lookups.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty SchemaCatalog.
+        """
+        self.tables: Dict[str, TableInfo] = {}
+        self.leading_columns: Dict[str, Set[str]] = {}
+        self.column_tables: Dict[str, Set[str]] = {}
+
+    def add_table(self, name: str, columns: List[str], row_count: Optional[int] = None) -> None:
+        """
+        Add or replace table.
+
+        :param name: Table name
+        :param columns: Column names
+        :param row_count: Estimated number of rows, if known
+        """
+        table = _unquote(name)
+        columns = tuple(_unquote(column) for column in columns)
+        previous = self.tables.get(table)
+        self.tables[table] = TableInfo(table, columns, previous.indexes if previous else (), row_count)
+        self.leading_columns.setdefault(table, set())
+        for column in columns:
+            self.column_tables.setdefault(column, set()).add(table)
+
+    def add_index(self, table: str, columns: List[str]) -> None:
+        """
+        Add index on table.
+
+        :param table: Table name
+        :param columns: Indexed columns in index order
+        """
+        table = _unquote(table)
+        columns = tuple(_unquote(column) for column in columns)
+        if not columns:
+            return
+        info = self.tables.get(table) or TableInfo(table, (), (), None)
+        self.tables[table] = info._replace(indexes=info.indexes + (columns,))
+        self.leading_columns.setdefault(table, set()).add(columns[0])
+
+    def set_row_count(self, table: str, row_count: Optional[int]) -> None:
+        """
+        Set row-count estimate of table.
+
+        :param table: Table name
+        :param row_count: Estimated number of rows
+        """
+        table = _unquote(table)
+        if table in self.tables:
+            self.tables[table] = self.tables[table]._replace(row_count=row_count)
+
+    def table(self, name: str) -> Optional[TableInfo]:
+        """
+        Look up table.
+
+        :param name: Table name, possibly quoted or schema-qualified
+        :return: TableInfo or None if unknown
+        """
+        return self.tables.get(_unquote(name))
+
+    def is_indexed(self, table: str, column: str) -> bool:
+        """
+        Check whether some index of table starts with column.
+
+        :param table: Table name
+        :param column: Column name
+        :return: True if column is leading column of an index
+        """
+        return _unquote(column) in self.leading_columns.get(_unquote(table), ())
+
+    def tables_with_column(self, column: str) -> Set[str]:
+        """
+        Find tables that have column.
+
+        :param column: Column name
+        :return: Set of table names
+        """
+        return self.column_tables.get(_unquote(column), set())
+
+    @classmethod
+    def from_ddl(cls, sql: str) -> 'SchemaCatalog':
+        """
+        Build catalog from CREATE TABLE and CREATE INDEX statements.
+
+        Primary keys, UNIQUE constraints and inline KEY/INDEX definitions count as indexes.
+
+        :param sql: DDL script
+        :return: SchemaCatalog instance
+        """
+        catalog = cls()
+        for statement in split_statements(sql):
+            text = statement.text
+            table_match = _CREATE_TABLE_RE.search(text)
+            if table_match:
+                body, _ = _parenthesised(text, table_match.end())
+                catalog._add_table_definition(table_match.group(1), body)
+                continue
+            index_match = _CREATE_INDEX_RE.search(text)
+            if index_match:
+                body, _ = _parenthesised(text, index_match.end())
+                catalog.add_index(index_match.group(1), list(_column_list(body)))
+        return catalog
+
+    def _add_table_definition(self, name: str, body: str) -> None:
+        """
+        Add table from body of CREATE TABLE statement.
+
+        :param name: Table name
+        :param body: Column and constraint definitions
+        """
+        columns = []
+        indexes = []
+        for element in _split_top_level(body):
+            words = element.split()
+            keyword = words[0].upper()
+            if keyword == 'CONSTRAINT' and len(words) > 2:
+                words = words[2:]
+                keyword = words[0].upper()
+            if keyword in ('PRIMARY', 'UNIQUE', 'KEY', 'INDEX') and '(' in element:
+                indexes.append(_column_list(_parenthesised(element, element.index('(') + 1)[0]))
+            elif keyword in ('FOREIGN', 'CHECK', 'EXCLUDE', 'FULLTEXT', 'SPATIAL'):
+                continue
+            else:
+                column = _unquote(words[0])
+                columns.append(column)
+                if re.search(r'\bPRIMARY\s+KEY\b|\bUNIQUE\b', element, re.IGNORECASE):
+                    indexes.append((column,))
+        self.add_table(name, columns)
+        for index in indexes:
+            self.add_index(name, list(index))
+
+    @classmethod
+    def from_sqlite(cls, path: str) -> 'SchemaCatalog':
+        """
+        Build catalog from SQLite database, using sqlite_stat1 for row counts when present.
+
+        :param path: Path to SQLite database file
+        :return: SchemaCatalog instance
+        """
+        catalog = cls()
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            tables = [row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+            for table in tables:
+                quoted = '"' + table.replace('"', '""') + '"'
+                info = connection.execute(f"PRAGMA table_info({quoted})").fetchall()
+                catalog.add_table(table, [row[1] for row in info])
+                primary_key = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+                if primary_key:
+                    catalog.add_index(table, primary_key)
+                for index in connection.execute(f"PRAGMA index_list({quoted})").fetchall():
+                    index_name = '"' + index[1].replace('"', '""') + '"'
+                    columns = [row[2] for row in connection.execute(f"PRAGMA index_info({index_name})") if row[2]]
+                    catalog.add_index(table, columns)
+            has_stats = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'").fetchone()
+            if has_stats:
+                for table, stat in connection.execute("SELECT tbl, stat FROM sqlite_stat1"):
+                    if stat:
+                        catalog.set_row_count(table, int(stat.split()[0]))
+        finally:
+            connection.close()
+        return catalog
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SchemaCatalog':
+        """
+        Build catalog from JSON-compatible dictionary.
+
+        Expected shape: {"tables": {"users": {"columns": [...], "indexes": [[...], ...],
+        "row_count": 1000}}}.
+
+        :param data: Catalog dictionary
+        :return: SchemaCatalog instance
+        :raises ValueError: If dictionary is malformed
+        """
+        tables = data.get('tables') if isinstance(data, dict) else None
+        if not isinstance(tables, dict):
+            raise ValueError("Schema catalog must be a mapping with a 'tables' mapping")
+        catalog = cls()
+        for name, table in tables.items():
+            catalog.add_table(name, table.get('columns', []), table.get('row_count'))
+            for index in table.get('indexes', []):
+                catalog.add_index(name, [index] if isinstance(index, str) else index)
+        return catalog
+
+    @classmethod
+    def load(cls, path: str) -> 'SchemaCatalog':
+        """
+        Load catalog from DDL (.sql), JSON (.json) or SQLite database file.
+
+        :param path: Path to catalog source
+        :return: SchemaCatalog instance
+        """
+        if path.lower().endswith('.sql'):
+            with open(path, 'r') as f:
+                return cls.from_ddl(f.read())
+        if path.lower().endswith('.json'):
+            with open(path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        return cls.from_sqlite(path)
+
+
+class SchemaAwareChecks:
+    """
+    Refine syntactic findings with schema catalog and add index coverage findings.
+    """
+
+    def __init__(self, catalog: SchemaCatalog, wide_table_columns: int = 20, small_table_rows: int = 1000):
+        """
+        Initialize SchemaAwareChecks.
+
+        :param catalog: SchemaCatalog instance
+        :param wide_table_columns: Column count from which SELECT * is escalated to High
+        :param small_table_rows: Row count below which missing indexes are not reported
+        """
+        self.catalog = catalog
+        self.wide_table_columns = wide_table_columns
+        self.small_table_rows = small_table_rows
+
+    def statement_tables(self, sql: str) -> Dict[str, str]:
+        """
+        Map table names and aliases referenced by statement to catalog tables.
+
+        :param sql: SQL statement
+        :return: Dictionary mapping lower-cased name or alias to table name
+        """
+        tables = {}
+        for _, table, alias in table_references(sql):
+            if self.catalog.table(table) is None:
+                continue
+            tables[table] = table
+            if alias:
+                tables[alias] = table
+        return tables
+
+    def resolve(self, column_ref: str, tables: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """
+        Resolve column reference to (table, column).
+
+        :param column_ref: 'column' or 'alias.column'
+        :param tables: Mapping produced by statement_tables
+        :return: Tuple of table and column names, or None if ambiguous or unknown
+        """
+        if '.' in column_ref:
+            qualifier, column = column_ref.lower().split('.', 1)
+            table = tables.get(qualifier)
+            return (table, column) if table else None
+        column = column_ref.lower()
+        candidates = self.catalog.tables_with_column(column).intersection(tables.values())
+        if len(candidates) == 1:
+            return candidates.pop(), column
+        return None
+
+    def is_large(self, table: str) -> bool:
+        """
+        Check whether table is large enough for missing indexes to matter.
+
+        :param table: Table name
+        :return: True if row count is unknown or at least small_table_rows
+        """
+        row_count = self.catalog.table(table).row_count
+        return row_count is None or row_count >= self.small_table_rows
+
+    def apply(self, sql: str, issues: List[Tuple[Antipattern, str, str]], context) -> List[Tuple[Antipattern, str, str]]:
+        """
+        Refine issues of statement and append schema findings.
+
+        :param sql: Scanned SQL statement
+        :param issues: Issues reported by syntactic checks
+        :param context: Callable returning context for offset in sql
+        :return: Refined list of issues
+        """
+        tables = self.statement_tables(sql)
+        if not tables:
+            return issues
+        spans = clause_spans(sql)
+        refined = []
+        for antipattern, offending_sql, issue_context in issues:
+            if antipattern.name == "SELECT *":
+                antipattern = self._refine_select_star(antipattern, tables)
+            elif antipattern.name == "Function in WHERE":
+                antipattern = self._refine_function_in_where(antipattern, sql, spans, tables)
+            elif antipattern.name in ("Leading Wildcard", "Both-sided Wildcard", "Trailing Wildcard"):
+                antipattern = self._refine_wildcard(antipattern, sql, tables)
+            refined.append((antipattern, offending_sql, issue_context))
+        refined.extend(self._unindexed_filters(sql, spans, tables, context))
+        refined.extend(self._unindexed_joins(sql, spans, tables, context))
+        return refined
+
+    def _refine_select_star(self, antipattern: Antipattern, tables: Dict[str, str]) -> Antipattern:
+        """
+        Report real width of SELECT * and escalate it for wide tables.
+        """
+        names = sorted(set(tables.values()))
+        widths = {name: len(self.catalog.table(name).columns) for name in names}
+        total = sum(widths.values())
+        detail = ', '.join(f"{name} has {width} columns" for name, width in widths.items())
+        severity = 'High' if total >= self.wide_table_columns else antipattern.severity
+        return antipattern._replace(severity=severity, description=f"{antipattern.description} Schema: {detail}.")
+
+    def _refine_function_in_where(self, antipattern: Antipattern, sql: str, spans, tables: Dict[str, str]) -> Antipattern:
+        """
+        Tell whether wrapped columns are indexed; downgrade when no index could be used anyway.
+        """
+        indexed, unindexed = [], []
+        for match in _FUNCTION_ARG_RE.finditer(sql):
+            if clause_at(spans, match.start()) != 'WHERE':
+                continue
+            resolved = self.resolve(match.group(2), tables)
+            if resolved is None:
+                continue
+            target = indexed if self.catalog.is_indexed(*resolved) else unindexed
+            target.append(f"{match.group(1).upper()}({resolved[0]}.{resolved[1]})")
+        if indexed:
+            return antipattern._replace(description=f"{antipattern.description} Schema: {', '.join(indexed)} wraps an indexed column, so the index cannot be used.")
+        if unindexed:
+            return antipattern._replace(severity='Low', description=f"{antipattern.description} Schema: {', '.join(unindexed)} wraps a column without index, so the function does not change the access path.")
+        return antipattern
+
+    def _refine_wildcard(self, antipattern: Antipattern, sql: str, tables: Dict[str, str]) -> Antipattern:
+        """
+        Tell whether LIKE pattern defeats or can use existing index.
+        """
+        leading = antipattern.name != "Trailing Wildcard"
+        for match in _LIKE_RE.finditer(sql):
+            if bool(match.group(2)) != leading:
+                continue
+            resolved = self.resolve(match.group(1), tables)
+            if resolved is None:
+                continue
+            column = f"{resolved[0]}.{resolved[1]}"
+            if not self.catalog.is_indexed(*resolved):
+                return antipattern._replace(severity='Low', description=f"{antipattern.description} Schema: {column} has no index, so the wildcard does not change the access path.")
+            if leading:
+                return antipattern._replace(description=f"{antipattern.description} Schema: {column} is indexed, but the leading wildcard prevents using it.")
+            return antipattern._replace(severity='Low', description=f"{antipattern.description} Schema: {column} is indexed and the fixed prefix allows an index range scan.")
+        return antipattern
+
+    def _unindexed_filters(self, sql: str, spans, tables: Dict[str, str], context) -> List[Tuple[Antipattern, str, str]]:
+        """
+        Report WHERE predicates on large tables without supporting index.
+        """
+        findings, seen = [], set()
+        for match in _PREDICATE_RE.finditer(sql):
+            if clause_at(spans, match.start()) != 'WHERE':
+                continue
+            resolved = self.resolve(match.group(1), tables)
+            if resolved is None or resolved in seen or resolved[1] not in self.catalog.table(resolved[0]).columns:
+                continue
+            seen.add(resolved)
+            if not self.catalog.is_indexed(*resolved) and self.is_large(resolved[0]):
+                antipattern = self._sized(SCHEMA_ANTIPATTERNS["Unindexed Filter Column"], resolved)
+                findings.append((antipattern, match.group(1), context(match.start())))
+        return findings
+
+    def _unindexed_joins(self, sql: str, spans, tables: Dict[str, str], context) -> List[Tuple[Antipattern, str, str]]:
+        """
+        Report JOIN equality predicates where joined column has no supporting index.
+        """
+        findings, seen = [], set()
+        for match in join_predicates(sql):
+            if clause_at(spans, match.start()) not in ('ON', 'WHERE'):
+                continue
+            sides = [self.resolve(match.group(1), tables), self.resolve(match.group(2), tables)]
+            if None in sides or sides[0][0] == sides[1][0]:
+                continue
+            for table, column in sides:
+                if (table, column) in seen or column not in self.catalog.table(table).columns:
+                    continue
+                seen.add((table, column))
+                if not self.catalog.is_indexed(table, column) and self.is_large(table):
+                    antipattern = self._sized(SCHEMA_ANTIPATTERNS["Unindexed Join Column"], (table, column))
+                    findings.append((antipattern, match.group(0), context(match.start())))
+        return findings
+
+    def _sized(self, antipattern: Antipattern, resolved: Tuple[str, str]) -> Antipattern:
+        """
+        Name column in description and escalate findings on very large tables.
+        """
+        table, column = resolved
+        row_count = self.catalog.table(table).row_count
+        size = f" ({row_count} rows)" if row_count is not None else ""
+        severity = 'High' if row_count is not None and row_count >= 1000000 else antipattern.severity
+        return antipattern._replace(
+            severity=severity,
+            description=f"{antipattern.description} Column {table}.{column}{size} is not the leading column of any index.",
+            remediation=f"CREATE INDEX idx_{table}_{column} ON {table} ({column})")
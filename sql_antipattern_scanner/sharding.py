@@ -0,0 +1,269 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/sharding.py
+import os
+import json
+import hashlib
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner, Antipattern
+from sql_antipattern_scanner.embedded_sql import source_files
+from sql_antipattern_scanner.gating import SEVERITY_WEIGHTS
+from sql_antipattern_scanner.statements import Finding, LineIndex, locate, split_statements
+
+# Unit of work: byte range of file starting at statement boundary, with first line number and content hash
+ShardUnit = namedtuple('ShardUnit', ['path', 'offset', 'length', 'line', 'sha256'])
+
+# Findings of all shards, with aggregate severity score and number of statements and shards scanned
+MergedResult = namedtuple('MergedResult', ['findings', 'severity_score', 'statements', 'shards'])
+
+MANIFEST_VERSION = 1
+PARTIAL_VERSION = 1
+
+
+def _sha256(data: bytes) -> str:
+    """
+    Hash bytes with SHA-256.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def split_units(path: str, data: bytes, max_unit_bytes: int) -> List[ShardUnit]:
+    """
+    Split file into units of at most about max_unit_bytes, cutting only between statements.
+
+    Statements longer than max_unit_bytes form units of their own.
+
+    :param path: Path recorded on units
+    :param data: Contents of file
+    :param max_unit_bytes: Target maximum unit size in bytes
+    :return: List of units covering whole file
+    """
+    if len(data) <= max_unit_bytes:
+        return [ShardUnit(path, 0, len(data), 1, _sha256(data))]
+    text = data.decode('utf-8')
+    lines = LineIndex(text)
+    # Segments run from start of one statement to start of next; units are cut between segments
+    boundaries = [statement.start for statement in split_statements(text)[1:]] + [len(text)]
+    cuts, size, previous = [0], 0, 0
+    for boundary in boundaries:
+        segment = len(text[previous:boundary].encode('utf-8'))
+        if size and size + segment > max_unit_bytes:
+            cuts.append(previous)
+            size = 0
+        size += segment
+        previous = boundary
+    cuts.append(len(text))
+    units, offset = [], 0
+    for start, end in zip(cuts, cuts[1:]):
+        chunk = text[start:end].encode('utf-8')
+        units.append(ShardUnit(path, offset, len(chunk), lines.line_of(start), _sha256(chunk)))
+        offset += len(chunk)
+    return units
+
+
+class ShardManifest:
+    """
+    Deterministic assignment of input files to shards.
+
+    Files are split into units at statement boundaries, and units are assigned largest
+    first to shard with fewest bytes so far, so shards are balanced by bytes. Every unit
+    carries hash of its contents, so nodes scanning shard detect inputs that changed
+    since sharding, and manifest digest ties partial results to manifest they came from.
+    """
+
+    def __init__(self, root: str, shards: List[List[ShardUnit]]):
+        """
+        Initialize ShardManifest.
+
+        :param root: Directory unit paths are relative to
+        :param shards: Units of each shard
+        """
+        self.root = root
+        self.shards = shards
+
+    @classmethod
+    def build(cls, inputs: Iterable[str], shard_count: int, root: str = '.', max_unit_bytes: int = 64 * 1024 * 1024) -> 'ShardManifest':
+        """
+        Split SQL files into balanced shards.
+
+        :param inputs: SQL files or directories to search for .sql files
+        :param shard_count: Number of shards
+        :param root: Directory to record paths relative to
+        :param max_unit_bytes: Files larger than this are split between statements
+        :return: ShardManifest instance
+        :raises ValueError: If shard count is not positive
+        """
+        if shard_count < 1:
+            raise ValueError("Shard count must be positive")
+        paths = sorted({path for source in inputs for path in source_files(source, ('.sql',))})
+        units = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                data = f.read()
+            units.extend(split_units(os.path.relpath(path, root).replace(os.sep, '/'), data, max_unit_bytes))
+        shards: List[List[ShardUnit]] = [[] for _ in range(shard_count)]
+        loads = [0] * shard_count
+        for unit in sorted(units, key=lambda unit: (-unit.length, unit.path, unit.offset)):
+            index = min(range(shard_count), key=lambda i: (loads[i], i))
+            shards[index].append(unit)
+            loads[index] += unit.length
+        return cls(root, [sorted(shard, key=lambda unit: (unit.path, unit.offset)) for shard in shards])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert manifest to JSON-serializable dictionary.
+
+        :return: Manifest dictionary
+        """
+        return {
+            "version": MANIFEST_VERSION,
+            "root": self.root,
+            "shards": [
+                {"bytes": sum(unit.length for unit in shard), "units": [unit._asdict() for unit in shard]}
+                for shard in self.shards
+            ],
+        }
+
+    @property
+    def digest(self) -> str:
+        """
+        Hash of manifest contents, independent of file formatting.
+
+        :return: Hex digest
+        """
+        return _sha256(json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+    def save(self, path: str) -> None:
+        """
+        Write manifest as JSON.
+
+        :param path: Path to manifest file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'ShardManifest':
+        """
+        Read manifest written by save.
+
+        :param path: Path to manifest file
+        :return: ShardManifest instance
+        :raises ValueError: If file is not shard manifest
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"{path} is not a version {MANIFEST_VERSION} shard manifest")
+        return cls(data['root'], [[ShardUnit(**unit) for unit in shard['units']] for shard in data['shards']])
+
+
+def scanner_fingerprint(scanner: SQLAntipatternScanner) -> str:
+    """
+    Hash configuration of scanner that affects findings, so partials of differently configured scanners are not merged.
+
+    :param scanner: SQLAntipatternScanner instance
+    :return: Hex digest
+    """
+    configuration = [scanner.dialect, sorted(scanner.rule_names()), sorted(scanner.ignored_patterns), scanner.include_context]
+    return _sha256(json.dumps(configuration).encode('utf-8'))
+
+
+def scan_shard(scanner: SQLAntipatternScanner, manifest: ShardManifest, index: int, root: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Scan every statement of one shard and build compact partial result.
+
+    Rule prose is stored once per distinct antipattern and findings refer to it by index.
+
+    :param scanner: SQLAntipatternScanner instance
+    :param manifest: ShardManifest instance
+    :param index: Index of shard to scan
+    :param root: Directory unit paths are relative to (default: root recorded in manifest)
+    :return: Partial result dictionary
+    :raises ValueError: If shard index is out of range or input changed since sharding
+    """
+    if not 0 <= index < len(manifest.shards):
+        raise ValueError(f"Shard {index} is out of range 0-{len(manifest.shards) - 1}")
+    root = manifest.root if root is None else root
+    antipatterns: Dict[Antipattern, int] = {}
+    findings, statements, score = [], 0, 0
+    for unit in manifest.shards[index]:
+        with open(os.path.join(root, unit.path), 'rb') as f:
+            f.seek(unit.offset)
+            data = f.read(unit.length)
+        if _sha256(data) != unit.sha256:
+            raise ValueError(f"{unit.path} changed since sharding (bytes {unit.offset}-{unit.offset + unit.length})")
+        for statement in split_statements(data.decode('utf-8')):
+            statements += 1
+            for antipattern, offending_sql, context in scanner.scan_sql(statement.text):
+                position = locate(statement.text, offending_sql)
+                line = unit.line - 1 + statement.start_line + (statement.text.count('\n', 0, position) if position is not None else 0)
+                findings.append([unit.path, line, antipatterns.setdefault(antipattern, len(antipatterns)), offending_sql, context])
+                score += SEVERITY_WEIGHTS[antipattern.severity]
+    return {
+        "version": PARTIAL_VERSION,
+        "manifest": manifest.digest,
+        "shard": index,
+        "shard_count": len(manifest.shards),
+        "scanner": scanner_fingerprint(scanner),
+        "statements": statements,
+        "severity_score": score,
+        "antipatterns": [list(antipattern) for antipattern in antipatterns],
+        "findings": findings,
+    }
+
+
+def save_partial(partial: Dict[str, Any], path: str) -> None:
+    """
+    Write partial result as compact JSON.
+
+    :param partial: Partial result produced by scan_shard
+    :param path: Output path
+    """
+    with open(path, 'w') as f:
+        json.dump(partial, f, separators=(',', ':'))
+
+
+def load_partial(path: str) -> Dict[str, Any]:
+    """
+    Read partial result written by save_partial.
+
+    :param path: Path to partial result
+    :return: Partial result dictionary
+    :raises ValueError: If file is not partial result
+    """
+    with open(path, 'r') as f:
+        partial = json.load(f)
+    if not isinstance(partial, dict) or partial.get('version') != PARTIAL_VERSION:
+        raise ValueError(f"{path} is not a version {PARTIAL_VERSION} partial result")
+    return partial
+
+
+def merge_partials(partials: List[Dict[str, Any]]) -> MergedResult:
+    """
+    Combine partial results of all shards of one manifest.
+
+    :param partials: Partial results, one per shard, in any order
+    :return: MergedResult with findings ordered by file and line
+    :raises ValueError: If partials come from different manifests or scanner configurations,
+                        or shards are missing or duplicated
+    """
+    if not partials:
+        raise ValueError("No partial results to merge")
+    for key in ('manifest', 'scanner', 'shard_count'):
+        if len({partial[key] for partial in partials}) > 1:
+            raise ValueError(f"Partial results disagree on {key}; rescan shards with one manifest and scanner configuration")
+    shard_count = partials[0]['shard_count']
+    indexes = sorted(partial['shard'] for partial in partials)
+    if indexes != list(range(shard_count)):
+        missing = sorted(set(range(shard_count)) - set(indexes))
+        duplicated = sorted({index for index in indexes if indexes.count(index) > 1})
+        raise ValueError(f"Expected one partial result per shard: missing {missing}, duplicated {duplicated}")
+    findings = []
+    for partial in partials:
+        antipatterns = [Antipattern(*fields) for fields in partial['antipatterns']]
+        findings.extend(Finding(path, line, antipatterns[index], offending_sql, context)
+                        for path, line, index, offending_sql, context in partial['findings'])
+    # Stable sort keeps statement order within units; units of one file never overlap
+    findings.sort(key=lambda finding: (finding.file, finding.line))
+    return MergedResult(findings, sum(partial['severity_score'] for partial in partials),
+                        sum(partial['statements'] for partial in partials), shard_count)
@@ -1,11 +1,20 @@
 # sql_antipattern_scanner/sql_antipattern_scanner.py
 import re
+import time
 import sqlparse 
+from sqlparse.exceptions import SQLParseError
 from sqlparse.sql import IdentifierList, Identifier, Where, Comparison, Function
 from collections import namedtuple
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional, Sequence, Union
 from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
-from sql_antipattern_scanner.report_generator import ReportGenerator
+from sql_antipattern_scanner.report_generator import ReportGenerator, issue_entry
+from sql_antipattern_scanner.rule_packs import CompiledRulePack
+from sql_antipattern_scanner.dialects import validate_dialect, dialect_antipatterns
+from sql_antipattern_scanner.literals import collapse_literals
+from sql_antipattern_scanner.schema_catalog import SCHEMA_ANTIPATTERNS, SchemaCatalog, SchemaAwareChecks
+from sql_antipattern_scanner.suppression import ALL_RULES, inline_suppressions
+from sql_antipattern_scanner.migrations import MIGRATION_ANTIPATTERNS, check_migration
+from sql_antipattern_scanner.statements import locate_findings
 import json
 from functools import lru_cache
 import os
@@ -16,6 +25,12 @@ with open(config_path, 'r') as config_file:
 
 Antipattern = namedtuple('Antipattern', ['name', 'description', 'severity', 'suggestion', 'remediation'])
 
+# Issues found by scan, with reasons why scan was partial (empty if scan was complete)
+ScanResult = namedtuple('ScanResult', ['issues', 'partial_reasons'])
+
+_TOKEN_ESTIMATE_RE = re.compile(r"\w+|'[^']*(?:''[^']*)*'|\S")
+_NESTING_RE = re.compile(r"'[^']*(?:''[^']*)*'|[()]")
+
 class SQLAntipatternScanner:
     """
     Class for scanning SQL queries to detect antipatterns.
@@ -24,12 +39,56 @@ class SQLAntipatternScanner:
     and generate reports on detected antipatterns.
     """
 
-    def __init__(self):
+    # Rules checked on parse tree, by name and check method; they report antipattern of regex rule of same name
+    STRUCTURAL_CHECKS = (
+        ("SELECT *", "check_select_star"),
+        ("Subquery in IN clause", "check_subquery_in_in_clause"),
+        ("ANSI-89 Join", "check_ansi89_join"),
+        ("Function in WHERE", "check_functions_in_where"),
+        ("Numeric GROUP BY", "check_numeric_group_by"),
+        ("NULL Comparison", "check_null_comparison"),
+    )
+
+    def __init__(self, dialect: Optional[str] = None, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None,
+                 max_depth: Optional[int] = None, timeout: Optional[float] = None,
+                 literal_run_threshold: Optional[int] = 1024, schema_catalog: Optional[SchemaCatalog] = None,
+                 include_context: bool = True):
         """
         Initialize SQLAntipatternScanner with default patterns and load custom antipatterns.
+
+        Statements exceeding resource limits are not parsed. They degrade to regex-only
+        checks (truncated to max_bytes if needed) and are reported as partial scans.
+
+        :param dialect: SQL dialect ('mysql', 'postgres', 'sqlite', 'tsql' or 'snowflake'),
+                        or None to apply generic rules only
+        :param max_bytes: Maximum statement size in bytes to parse and scan in full
+        :param max_tokens: Maximum estimated number of tokens to parse
+        :param max_depth: Maximum parenthesis nesting depth to parse
+        :param timeout: Wall time budget per statement in seconds, checked between rules
+        :param literal_run_threshold: Minimum length in characters of VALUES rows or IN lists made of
+                                      literals to collapse into placeholder before scanning, or None
+                                      to disable collapsing
+        :param schema_catalog: SchemaCatalog used to check index coverage and table widths, or None
+                               for syntactic checks only
+        :param include_context: Whether to cut context around each issue; without it issues
+                                carry empty context and statements are not re-serialized for it
+        :raises ValueError: If unsupported dialect is specified
         """
-        self.patterns: List[Tuple[re.Pattern, Antipattern]] = DEFAULT_ANTIPATTERNS
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.literal_run_threshold = literal_run_threshold
+        self.include_context = include_context
+        self.dialect: Optional[str] = validate_dialect(dialect)
+        # Copied, so rules added to this scanner never leak into module-level defaults or other scanners
+        self.patterns: List[Tuple[re.Pattern, Antipattern]] = list(DEFAULT_ANTIPATTERNS) if self.dialect is None else dialect_antipatterns(self.dialect)
         self.ignored_patterns: Set[str] = set()
+        self.rule_packs: List[CompiledRulePack] = []
+        self.schema_checks: Optional[SchemaAwareChecks] = SchemaAwareChecks(schema_catalog) if schema_catalog is not None else None
+        # Result cache is per instance, so scanners neither share cached results nor keep each other alive
+        self.scan = lru_cache(maxsize=100)(self._scan)
+        self.parse = lru_cache(maxsize=100)(self._parse)
         self.load_custom_antipatterns()
 
     def load_custom_antipatterns(self) -> None:
@@ -56,6 +115,18 @@ class SQLAntipatternScanner:
         :param antipattern: Antipattern namedtuple describing antipattern
         """
         self.patterns.append((pattern, antipattern))
+        self.scan.cache_clear()
+
+    def add_rule_pack(self, rule_pack: CompiledRulePack) -> None:
+        """
+        Add compiled rule pack to scanner.
+
+        Rules limited to other dialects are dropped once here rather than on every scan.
+
+        :param rule_pack: CompiledRulePack produced by RulePack.compile or load_rule_pack
+        """
+        self.rule_packs.append(rule_pack.for_dialect(self.dialect))
+        self.scan.cache_clear()
 
     def ignore_pattern(self, pattern_name: str) -> None:
         """
@@ -64,46 +135,184 @@ class SQLAntipatternScanner:
         :param pattern_name: Name of pattern to ignore
         """
         self.ignored_patterns.add(pattern_name)
+        self.scan.cache_clear()
 
-    @lru_cache(maxsize=100)
-    def scan_sql(self, sql: str) -> List[Tuple[Antipattern, str, str]]:
+    def rule_names(self) -> Set[str]:
         """
-        Scan SQL query for antipatterns.
+        Get names of all rules scanner can report.
+
+        :return: Set of antipattern names
+        """
+        names = {antipattern.name for _, antipattern in self.patterns}
+        names.update(antipattern.name for rule_pack in self.rule_packs for _, antipattern, _ in rule_pack.matchers)
+        names.update(MIGRATION_ANTIPATTERNS)
+        if self.schema_checks is not None:
+            names.update(SCHEMA_ANTIPATTERNS)
+        return names
+
+    def check_limits(self, sql: str) -> List[str]:
+        """
+        Check statement against resource limits without parsing it.
+
+        Token and nesting counts stop as soon as limit is exceeded, so cost of check
+        is bounded by limits rather than by size of statement.
+
+        :param sql: SQL query to check
+        :return: List of exceeded limits ('max_bytes', 'max_tokens', 'max_depth')
+        """
+        return [limit for limit, _ in self._limit_breaches(sql)]
+
+    def _limit_breaches(self, sql: str) -> List[Tuple[str, int]]:
+        """
+        Find exceeded resource limits and character offset at which each is exceeded.
+        """
+        exceeded = []
+        if self.max_bytes is not None and len(sql) > self.max_bytes // 4 and len(sql.encode('utf-8')) > self.max_bytes:
+            exceeded.append(('max_bytes', len(sql.encode('utf-8')[:self.max_bytes].decode('utf-8', 'ignore'))))
+        if self.max_tokens is not None:
+            for count, match in enumerate(_TOKEN_ESTIMATE_RE.finditer(sql), 1):
+                if count > self.max_tokens:
+                    exceeded.append(('max_tokens', match.start()))
+                    break
+        if self.max_depth is not None:
+            depth = 0
+            for match in _NESTING_RE.finditer(sql):
+                token = match.group(0)
+                if token == '(':
+                    depth += 1
+                    if depth > self.max_depth:
+                        exceeded.append(('max_depth', match.start()))
+                        break
+                elif token == ')':
+                    depth = max(depth - 1, 0)
+        return exceeded
+
+    def _parse(self, sql: str) -> Optional[sqlparse.sql.Statement]:
+        """
+        Parse SQL statement.
+
+        Called through parse, which caches trees of recent statements, so later passes such
+        as index advice reuse trees built while scanning. Trees are shared and must not be modified.
+
+        :param sql: SQL statement
+        :return: Parse tree of first statement, or None if statement cannot be parsed
+        """
+        try:
+            return sqlparse.parse(sql)[0]
+        except (SQLParseError, RecursionError):
+            return None
+
+    def _scan(self, sql: str) -> ScanResult:
+        """
+        Scan SQL query for antipatterns, honoring resource limits.
+
+        Called through scan, which caches results of recent statements per scanner.
+
+        Rules suppressed by '-- antipattern: ignore[rule]' comments are not evaluated, and
+        statements suppressing every rule are not parsed at all. Statements exceeding
+        resource limits are truncated to their part within limits before regex checks.
+        Timeout is checked between rules and between matches; single regex match cannot
+        be interrupted, so max_bytes is what bounds its cost.
 
         :param sql: SQL query to scan
-        :return: List of tuples containing antipattern, offending SQL, and context
+        :return: ScanResult with detected antipatterns and reasons for partial scan
         """
+        suppressed = inline_suppressions(sql)
+        if ALL_RULES in suppressed:
+            return ScanResult([], [])
+        ignored = self.ignored_patterns | {name for name in self.rule_names() if name.lower() in suppressed} if suppressed else self.ignored_patterns
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        original_sql, collapsed = sql, None
+        if self.literal_run_threshold is not None:
+            # Bulk literal runs are collapsed first, so they neither trip limits nor reach sqlparse
+            collapsed = collapse_literals(sql, self.literal_run_threshold)
+            sql = collapsed.text
+        breaches = self._limit_breaches(sql)
+        partial_reasons = [limit for limit, _ in breaches]
+        text = sql
+        parsed = None
+        if breaches:
+            # Regex-only fallback sees only part of statement within every limit
+            text = sql[:min(offset for _, offset in breaches)]
+        else:
+            parsed = self.parse(sql)
+            if parsed is not None:
+                text = str(parsed)
+            else:
+                partial_reasons.append('parse_error')
+
+        def context_at(position: int) -> str:
+            # Offsets in collapsed text are mapped back, so contexts show original SQL rather than placeholder
+            if collapsed is not None and collapsed.collapsed:
+                return self.get_context(original_sql, collapsed.to_original(position))
+            return self.get_context(text, position)
+
+        def out_of_time() -> bool:
+            if deadline is not None and time.monotonic() > deadline:
+                if 'timeout' not in partial_reasons:
+                    partial_reasons.append('timeout')
+                return True
+            return False
+
         antipatterns = []
-        parsed = sqlparse.parse(sql)[0]
         
-        checks = [
-            ("SELECT *", self.check_select_star),
-            ("Subquery in IN clause", self.check_subquery_in_in_clause),
-            ("ANSI-89 Join", self.check_ansi89_join),
-            ("Function in WHERE", self.check_functions_in_where),
-            ("Numeric GROUP BY", self.check_numeric_group_by),
-            ("NULL Comparison", self.check_null_comparison),
-        ]
+        checks = [(name, getattr(self, method)) for name, method in self.STRUCTURAL_CHECKS]
         
         detected_antipatterns: Set[str] = set()
-        for name, check_function in checks:
-            if name not in self.ignored_patterns:
-                for antipattern, offending_sql, context in check_function(parsed):
-                    if antipattern.name not in detected_antipatterns:
-                        antipatterns.append((antipattern, offending_sql, context))
-                        detected_antipatterns.add(antipattern.name)
+        if parsed is not None:
+            for name, check_function in checks:
+                if out_of_time():
+                    break
+                if name not in ignored:
+                    for antipattern, offending_sql, context in check_function(parsed):
+                        if antipattern.name not in detected_antipatterns:
+                            antipatterns.append((antipattern, offending_sql, context))
+                            detected_antipatterns.add(antipattern.name)
+            # Check schema changes and bulk writes for table locks and rewrites
+            if not out_of_time():
+                for antipattern, offending_sql, position in check_migration(parsed, self.dialect):
+                    if antipattern.name not in ignored:
+                        antipatterns.append((antipattern, offending_sql, context_at(position)))
         
         # Apply regex checks for remaining antipatterns
         for pattern, antipattern in self.patterns:
-            if antipattern.name not in self.ignored_patterns and antipattern.name not in detected_antipatterns:
-                matches = pattern.finditer(str(parsed))
+            if out_of_time():
+                break
+            if antipattern.name not in ignored and antipattern.name not in detected_antipatterns:
+                matches = pattern.finditer(text)
                 for match in matches:
+                    if out_of_time():
+                        break
                     offending_sql = match.group(0)
-                    context = self.get_context(str(parsed), match.start())
+                    context = context_at(match.start())
                     antipatterns.append((antipattern, offending_sql, context))
                     detected_antipatterns.add(antipattern.name)
+
+        # Apply compiled rule packs, skipping rules already reported above
+        skipped = ignored | detected_antipatterns
+        for rule_pack in self.rule_packs:
+            if out_of_time():
+                break
+            for antipattern, offending_sql, position in rule_pack.match(text, skipped):
+                antipatterns.append((antipattern, offending_sql, context_at(position)))
+
+        # Refine findings with schema catalog and add index coverage findings
+        if self.schema_checks is not None and not out_of_time():
+            antipatterns = [
+                issue for issue in self.schema_checks.apply(text, antipatterns, context_at)
+                if issue[0].name not in ignored
+            ]
         
-        return antipatterns
+        return ScanResult(antipatterns, partial_reasons)
+
+    def scan_sql(self, sql: str) -> List[Tuple[Antipattern, str, str]]:
+        """
+        Scan SQL query for antipatterns.
+
+        :param sql: SQL query to scan
+        :return: List of tuples containing antipattern, offending SQL, and context
+        """
+        return self.scan(sql).issues
 
     def apply_regex_checks(self, sql: str) -> List[Tuple[Antipattern, str, str]]:
         """
@@ -149,7 +358,7 @@ class SQLAntipatternScanner:
             elif select_seen and token.ttype is sqlparse.tokens.Wildcard:
                 antipattern = next((ap for _, ap in self.patterns if ap.name == "SELECT *"), None)
                 if antipattern:
-                    antipatterns.append((antipattern, f"SELECT {str(token)}", self.get_context(str(parsed), parsed.token_index(token))))
+                    antipatterns.append((antipattern, f"SELECT {str(token)}", self.get_context(parsed, parsed.token_index(token))))
                 break
         return antipatterns
 
@@ -214,7 +423,7 @@ class SQLAntipatternScanner:
                         if comparison.right.value.upper() == 'NULL' and comparison.tokens[1].value != 'IS':
                             antipattern = next((ap for _, ap in self.patterns if ap.name == "NULL Comparison"), None)
                             if antipattern:
-                                antipatterns.append((antipattern, str(comparison), self.get_context(str(parsed), parsed.token_index(token))))
+                                antipatterns.append((antipattern, str(comparison), self.get_context(parsed, parsed.token_index(token))))
         return antipatterns
 
     def check_numeric_group_by(self, parsed: sqlparse.sql.Statement) -> List[Tuple[Antipattern, str, str]]:
@@ -236,7 +445,7 @@ class SQLAntipatternScanner:
                 if re.search(r'\b\d+\b', group_by_clause):
                     antipattern = next((ap for _, ap in self.patterns if ap.name == "Numeric GROUP BY"), None)
                     if antipattern:
-                        antipatterns.append((antipattern, f"GROUP BY {group_by_clause}", self.get_context(str(parsed), parsed.token_index(token))))
+                        antipatterns.append((antipattern, f"GROUP BY {group_by_clause}", self.get_context(parsed, parsed.token_index(token))))
                     break
         return antipatterns
 
@@ -254,9 +463,11 @@ class SQLAntipatternScanner:
                     if isinstance(sub_token, Function):
                         antipattern = next((ap for _, ap in self.patterns if ap.name == "Function in WHERE"), None)
                         if antipattern:
-                            context_start = max(0, token.token_index(sub_token) - 50)
-                            context_end = min(len(str(parsed)), token.token_index(sub_token) + len(str(sub_token)) + 50)
-                            context = str(parsed)[context_start:context_end]
+                            context = ''
+                            if self.include_context:
+                                context_start = max(0, token.token_index(sub_token) - 50)
+                                context_end = min(len(str(parsed)), token.token_index(sub_token) + len(str(sub_token)) + 50)
+                                context = str(parsed)[context_start:context_end]
                             antipatterns.append((antipattern, str(sub_token), context))
         return antipatterns
 
@@ -268,32 +479,41 @@ class SQLAntipatternScanner:
         :return: List of tuples containing antipattern, offending SQL, and context
         """
         antipatterns = []
-        def recursive_check(token):
-            if isinstance(token, sqlparse.sql.TokenList):
-                in_clause = False
-                for t in token.tokens:
-                    if t.ttype is sqlparse.tokens.Keyword and t.value.upper() == 'IN':
-                        in_clause = True
-                    elif in_clause and isinstance(t, sqlparse.sql.Parenthesis):
-                        if any('SELECT' in str(st).upper() for st in t.flatten()):
-                            antipattern = next((ap for _, ap in self.patterns if ap.name == "Subquery in IN clause"), None)
-                            if antipattern:
-                                antipatterns.append((antipattern, str(token), self.get_context(str(parsed), parsed.token_index(token))))
-                        in_clause = False
-                    recursive_check(t)
-        
-        recursive_check(parsed)
+        # Walk token tree depth-first with explicit stack, so deep nesting cannot hit recursion limit
+        stack = [iter(parsed.tokens)]
+        in_clause_stack = [False]
+        while stack:
+            t = next(stack[-1], None)
+            if t is None:
+                stack.pop()
+                in_clause_stack.pop()
+                continue
+            if t.ttype is sqlparse.tokens.Keyword and t.value.upper() == 'IN':
+                in_clause_stack[-1] = True
+            elif in_clause_stack[-1] and isinstance(t, sqlparse.sql.Parenthesis):
+                if any('SELECT' in str(st).upper() for st in t.flatten()):
+                    antipattern = next((ap for _, ap in self.patterns if ap.name == "Subquery in IN clause"), None)
+                    if antipattern:
+                        token = t.parent
+                        antipatterns.append((antipattern, str(token), self.get_context(parsed, parsed.token_index(token))))
+                in_clause_stack[-1] = False
+            if isinstance(t, sqlparse.sql.TokenList):
+                stack.append(iter(t.tokens))
+                in_clause_stack.append(False)
         return antipatterns
 
-    def get_context(self, sql: str, position: int, context_chars: int = 100) -> str:
+    def get_context(self, sql: Union[str, sqlparse.sql.Statement], position: int, context_chars: int = 100) -> str:
         """
         Get context around specific position in query.
 
-        :param sql: Full SQL query
+        :param sql: Full SQL query, or parsed statement, which is serialized only if context is included
         :param position: Position to get context around
         :param context_chars: Number of characters to include in context
-        :return: String containing context
+        :return: String containing context, or empty string if scanner does not include context
         """
+        if not self.include_context:
+            return ''
+        sql = str(sql)
         start = max(0, position - context_chars)
         end = min(len(sql), position + context_chars)
         return sql[start:end]
@@ -308,40 +528,46 @@ class SQLAntipatternScanner:
         severity_map = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
         return sum(severity_map[ap.severity] for ap, _, _ in antipatterns)
 
-    def generate_report(self, antipatterns: List[Tuple[Antipattern, str, str]], sql: str, format: str = 'json') -> str:
+    def generate_report(self, antipatterns: List[Tuple[Antipattern, str, str]], sql: str, format: str = 'json',
+                        partial_reasons: Optional[List[str]] = None, fields: Optional[Sequence[str]] = None) -> str:
         """
         Generate report of detected antipatterns in specified format.
 
+        Fields not requested are not computed; in particular original SQL is only
+        reindented when 'original_sql' is requested.
+
         :param antipatterns: List of detected antipatterns
         :param sql: Original SQL query
-        :param format: Desired report format ('json', 'csv', or 'html')
+        :param format: Desired report format ('json', 'csv', 'html' or 'minimal')
+        :param partial_reasons: Resource limits that made scan partial, if any
+        :param fields: Report fields to include (see REPORT_FIELDS), or None for all
         :return: Generated report as string
         :raises ValueError: If unsupported format is specified
         """
+        if fields is not None and 'line' in fields:
+            issues = [issue_entry(finding.antipattern, finding.offending_sql, finding.context, fields, line=finding.line)
+                      for finding in locate_findings(antipatterns, sql)]
+        else:
+            issues = [issue_entry(ap, offending_sql, context, fields) for ap, offending_sql, context in antipatterns]
         report_data = {
             "total_issues": len(antipatterns),
             "severity_score": self.get_severity_score(antipatterns),
-            "issues": [
-                {
-                    "name": ap.name,
-                    "severity": ap.severity,
-                    "description": ap.description,
-                    "suggestion": ap.suggestion,
-                    "offending_sql": offending_sql,
-                    "context": context,
-                    "remediation": ap.remediation
-                }
-                for ap, offending_sql, context in antipatterns
-            ],
-            "original_sql": sqlparse.format(sql, reindent=True, keyword_case='upper')
+            "issues": issues,
         }
+        if fields is None or 'original_sql' in fields:
+            report_data["original_sql"] = sqlparse.format(sql, reindent=True, keyword_case='upper') if not partial_reasons else sql
+        if partial_reasons:
+            report_data["partial"] = True
+            report_data["partial_reasons"] = partial_reasons
 
         report_generator = ReportGenerator()
         if format == 'json':
             return report_generator.generate_json(report_data)
         elif format == 'csv':
-            return report_generator.generate_csv(report_data)
+            return report_generator.generate_csv(report_data, fields)
         elif format == 'html':
             return report_generator.generate_html(report_data)
+        elif format == 'minimal':
+            return report_generator.generate_minimal(report_data)
         else:
             raise ValueError(f"Unsupported format: {format}")
\ No newline at end of file
@@ -0,0 +1,172 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/statements.py
+import os
+import re
+import hashlib
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+StatementSpan = namedtuple('StatementSpan', ['text', 'start', 'end', 'start_line', 'end_line'])
+
+# Finding located in source file, line is 1-based
+Finding = namedtuple('Finding', ['file', 'line', 'antipattern', 'offending_sql', 'context'])
+
+_SPLIT_RE = re.compile(r"'[^']*(?:''[^']*)*'|\"[^\"]*(?:\"\"[^\"]*)*\"|--[^\n]*|/\*.*?\*/|;", re.DOTALL)
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_NORMALIZE_RE = re.compile(r"'[^']*(?:''[^']*)*'|--[^\n]*|/\*.*?\*/|\b\d+(?:\.\d+)?\b", re.DOTALL)
+
+
+class LineIndex:
+    """
+    Map character offsets of text to 1-based line numbers.
+    """
+
+    def __init__(self, text: str):
+        """
+        Initialize LineIndex.
+
+        :param text: Text to index
+        """
+        self.line_starts: List[int] = [0] + [match.end() for match in re.finditer(r'\n', text)]
+
+    def line_of(self, offset: int) -> int:
+        """
+        Get line number containing offset.
+
+        :param offset: Character offset
+        :return: 1-based line number
+        """
+        return bisect_right(self.line_starts, offset)
+
+
+def split_statements(sql: str) -> List[StatementSpan]:
+    """
+    Split SQL script into statements without parsing it.
+
+    Splits on semicolons outside string literals and comments, which is far cheaper
+    than sqlparse.split on large scripts. Comment-only fragments are dropped.
+
+    :param sql: SQL script
+    :return: List of statement spans with offsets and line numbers
+    """
+    lines = LineIndex(sql)
+    spans = []
+    start = 0
+    boundaries = [match.end() for match in _SPLIT_RE.finditer(sql) if match.group(0) == ';']
+    if not boundaries or boundaries[-1] < len(sql):
+        boundaries.append(len(sql))
+    for end in boundaries:
+        text = sql[start:end]
+        stripped = text.strip()
+        if stripped and stripped != ';' and _COMMENT_RE.sub('', stripped).strip(' \t\r\n;'):
+            offset = start + len(text) - len(text.lstrip())
+            stop = start + len(text.rstrip())
+            spans.append(StatementSpan(sql[offset:stop], offset, stop, lines.line_of(offset), lines.line_of(max(stop - 1, offset))))
+        start = end
+    return spans
+
+
+def locate(text: str, fragment: str) -> Optional[int]:
+    """
+    Find offset of reported fragment within statement text.
+
+    Structural checks may report fragments with normalized whitespace or case, so
+    exact lookup falls back to whitespace- and case-insensitive search.
+
+    :param text: Statement text
+    :param fragment: Offending SQL fragment reported by scanner
+    :return: Offset of fragment, or None if it cannot be found
+    """
+    position = text.find(fragment)
+    if position >= 0:
+        return position
+    parts = fragment.split()
+    if not parts:
+        return None
+    match = re.search(r'\s+'.join(re.escape(part) for part in parts), text, re.IGNORECASE)
+    return match.start() if match else None
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize SQL text so cosmetic differences do not change its identity.
+
+    Comments are removed, string and numeric literals become '?', whitespace is
+    collapsed and text is upper-cased.
+
+    :param sql: SQL text
+    :return: Normalized SQL text
+    """
+    def replace(match):
+        return ' ' if match.group(0)[0] in '-/' else '?'
+    return ' '.join(_NORMALIZE_RE.sub(replace, sql).split()).upper()
+
+
+def fingerprint_findings(findings: List[Finding]) -> List[str]:
+    """
+    Compute stable fingerprints for findings.
+
+    Fingerprint combines rule, file, normalized offending SQL and occurrence index among
+    identical (rule, file, offending SQL) findings, so it survives reformatting and
+    lines moving while still telling repeated findings apart.
+
+    :param findings: List of findings
+    :return: List of hex fingerprints, in same order as findings
+    """
+    occurrences: Dict[Tuple[str, str, str], int] = {}
+    fingerprints = []
+    for finding in findings:
+        key = (finding.antipattern.name, finding.file, normalize_sql(finding.offending_sql))
+        index = occurrences.get(key, 0)
+        occurrences[key] = index + 1
+        fingerprints.append(hashlib.sha1('\x1f'.join(key + (str(index),)).encode('utf-8')).hexdigest())
+    return fingerprints
+
+
+def locate_findings(issues: list, sql: str, file: str = '') -> List[Finding]:
+    """
+    Attach file and line to scanner issues for SQL text.
+
+    :param issues: List of tuples containing antipattern, offending SQL, and context
+    :param sql: Scanned SQL text
+    :param file: File path recorded on findings
+    :return: List of findings
+    """
+    lines = LineIndex(sql)
+    findings = []
+    for antipattern, offending_sql, context in issues:
+        position = locate(sql, offending_sql)
+        findings.append(Finding(file, lines.line_of(position) if position is not None else 1, antipattern, offending_sql, context))
+    return findings
+
+
+def finding_statements(findings: List[Finding], repo_root: str = '.', sources: Optional[Dict[str, str]] = None,
+                       extensions: Tuple[str, ...] = ('.sql',)) -> List[Optional[StatementSpan]]:
+    """
+    Get statements findings are located in.
+
+    Each file is read and split at most once. Files of other extensions, such as
+    application code holding embedded SQL, are not split.
+
+    :param findings: List of located findings
+    :param repo_root: Directory finding paths are relative to
+    :param sources: SQL text by file path, for findings of text not read from disk
+    :param extensions: Extensions of SQL files to read from disk
+    :return: List of statement spans (None if file is not read or no statement covers line), in same order as findings
+    """
+    statements: Dict[str, List[StatementSpan]] = {}
+    spans = []
+    for finding in findings:
+        if finding.file not in statements:
+            if sources is not None and finding.file in sources:
+                statements[finding.file] = split_statements(sources[finding.file])
+            elif not finding.file.lower().endswith(extensions):
+                statements[finding.file] = []
+            else:
+                try:
+                    with open(os.path.join(repo_root, finding.file), 'r') as f:
+                        statements[finding.file] = split_statements(f.read())
+                except (OSError, UnicodeDecodeError):
+                    statements[finding.file] = []
+        spans.append(next((s for s in statements[finding.file] if s.start_line <= finding.line <= s.end_line), None))
+    return spans
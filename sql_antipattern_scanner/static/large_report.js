@@ -0,0 +1,143 @@
+/* sql_antipattern_scanner/sql_antipattern_scanner/static/large_report.js */
+(function () {
+    'use strict';
+
+    // Compact index: rules, files and flat [rule, file, line] rows, one row per issue
+    const index = JSON.parse(document.getElementById('report-index').textContent);
+    const pageSize = 100;
+    const loaded = {};
+    const pending = {};
+    let matches = [];
+    let page = 0;
+
+    // Data chunks are plain scripts, so they load from file:// without fetch or a server
+    window.reportChunk = function (number, items) {
+        loaded[number] = items;
+        (pending[number] || []).forEach(function (resolve) { resolve(); });
+        delete pending[number];
+    };
+
+    function loadChunk(number) {
+        return new Promise(function (resolve) {
+            if (loaded[number]) {
+                resolve();
+                return;
+            }
+            if (pending[number]) {
+                pending[number].push(resolve);
+                return;
+            }
+            pending[number] = [resolve];
+            const script = document.createElement('script');
+            script.src = 'data/chunk-' + String(number).padStart(5, '0') + '.js';
+            document.head.appendChild(script);
+        });
+    }
+
+    function element(tag, className, text) {
+        const node = document.createElement(tag);
+        if (className) {
+            node.className = className;
+        }
+        if (text !== undefined && text !== null) {
+            node.textContent = String(text);
+        }
+        return node;
+    }
+
+    function codeBlock(title, text) {
+        const block = element('div', 'code-block');
+        block.appendChild(element('h4', null, title));
+        const pre = element('pre');
+        pre.appendChild(element('code', null, text));
+        block.appendChild(pre);
+        return block;
+    }
+
+    function renderIssue(id) {
+        const rule = index.rules[index.rows[id * 3]];
+        const file = index.files[index.rows[id * 3 + 1]];
+        const line = index.rows[id * 3 + 2];
+        const item = loaded[Math.floor(id / index.chunk_size)][id % index.chunk_size];
+        const details = element('details', 'issue');
+        const summary = element('summary');
+        summary.appendChild(element('span', 'issue-name', rule[0]));
+        if (file) {
+            summary.appendChild(element('span', 'issue-location', file + ':' + line));
+        }
+        summary.appendChild(element('span', 'severity ' + rule[1].toLowerCase(), rule[1]));
+        details.appendChild(summary);
+        // Details are built on first expansion only
+        details.addEventListener('toggle', function () {
+            if (!details.open || details.dataset.rendered) {
+                return;
+            }
+            details.dataset.rendered = '1';
+            const body = element('div', 'issue-details');
+            body.appendChild(element('p', null, 'Description: ' + rule[2]));
+            body.appendChild(element('p', null, 'Suggestion: ' + rule[3]));
+            body.appendChild(codeBlock('Offending SQL:', item[0]));
+            body.appendChild(codeBlock('Context:', item[1]));
+            body.appendChild(element('p', null, 'Remediation: ' + rule[4]));
+            if (item[2]) {
+                body.appendChild(codeBlock('Details:', JSON.stringify(item[2], null, 2)));
+            }
+            details.appendChild(body);
+        });
+        return details;
+    }
+
+    function render() {
+        const start = page * pageSize;
+        const ids = matches.slice(start, start + pageSize);
+        const chunks = Array.from(new Set(ids.map(function (id) { return Math.floor(id / index.chunk_size); })));
+        document.getElementById('page-status').textContent = matches.length
+            ? 'Showing ' + (start + 1) + '-' + (start + ids.length) + ' of ' + matches.length
+            : 'No matching issues';
+        document.getElementById('previous-page').disabled = page === 0;
+        document.getElementById('next-page').disabled = start + pageSize >= matches.length;
+        const requested = page;
+        Promise.all(chunks.map(loadChunk)).then(function () {
+            if (requested !== page) {
+                return;
+            }
+            const list = document.getElementById('issue-list');
+            list.textContent = '';
+            ids.forEach(function (id) { list.appendChild(renderIssue(id)); });
+        });
+    }
+
+    function applyFilters() {
+        const severity = document.getElementById('filter-severity').value;
+        const rule = document.getElementById('filter-rule').value;
+        const file = document.getElementById('filter-file').value.toLowerCase();
+        const fileMatches = index.files.map(function (name) { return !file || name.toLowerCase().indexOf(file) !== -1; });
+        matches = [];
+        for (let id = 0; id < index.total; id++) {
+            const ruleInfo = index.rules[index.rows[id * 3]];
+            if ((!severity || ruleInfo[1] === severity) && (!rule || ruleInfo[0] === rule) && fileMatches[index.rows[id * 3 + 1]]) {
+                matches.push(id);
+            }
+        }
+        page = 0;
+        render();
+    }
+
+    const ruleSelect = document.getElementById('filter-rule');
+    Array.from(new Set(index.rules.map(function (rule) { return rule[0]; }))).sort().forEach(function (name) {
+        const option = element('option', null, name);
+        option.value = name;
+        ruleSelect.appendChild(option);
+    });
+    ['filter-severity', 'filter-rule'].forEach(function (id) {
+        document.getElementById(id).addEventListener('change', applyFilters);
+    });
+    let typing = null;
+    document.getElementById('filter-file').addEventListener('input', function () {
+        clearTimeout(typing);
+        typing = setTimeout(applyFilters, 200);
+    });
+    document.getElementById('previous-page').addEventListener('click', function () { page -= 1; render(); });
+    document.getElementById('next-page').addEventListener('click', function () { page += 1; render(); });
+    applyFilters();
+})();
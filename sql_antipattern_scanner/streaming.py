@@ -0,0 +1,313 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/streaming.py
+import sys
+import json
+import time
+import heapq
+import random
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import normalize_sql
+
+SAMPLING_MODES = ('reservoir', 'uniform')
+
+
+class ReservoirSampler:
+    """
+    Keep uniform random sample of fixed size from stream of unknown length (Algorithm R).
+    """
+
+    def __init__(self, size: int, rng: random.Random):
+        """
+        Initialize ReservoirSampler.
+
+        :param size: Number of items to keep
+        :param rng: Random number generator
+        """
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.items: List[str] = []
+
+    def add(self, item: str) -> None:
+        """
+        Offer item to sample.
+
+        :param item: Stream item
+        """
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            slot = self.rng.randrange(self.seen)
+            if slot < self.size:
+                self.items[slot] = item
+
+    def reset(self) -> None:
+        """
+        Start new sample.
+        """
+        self.seen = 0
+        self.items = []
+
+
+class UniformSampler:
+    """
+    Keep each stream item with fixed probability, up to cap per sample.
+    """
+
+    def __init__(self, rate: float, size: int, rng: random.Random):
+        """
+        Initialize UniformSampler.
+
+        :param rate: Probability of keeping item
+        :param size: Maximum number of items kept, so sample stays bounded at any input rate
+        :param rng: Random number generator
+        """
+        self.rate = rate
+        self.size = size
+        self.rng = rng
+        self.items: List[str] = []
+
+    def add(self, item: str) -> None:
+        """
+        Offer item to sample.
+
+        :param item: Stream item
+        """
+        if len(self.items) < self.size and self.rng.random() < self.rate:
+            self.items.append(item)
+
+    def reset(self) -> None:
+        """
+        Start new sample.
+        """
+        self.items = []
+
+
+class SpaceSaving:
+    """
+    Track approximate most frequent keys of stream in fixed memory (Space-Saving algorithm).
+
+    At most capacity keys are counted. New key replaces key with smallest count and
+    inherits that count as its error bound, so every key occurring more than
+    total / capacity times is guaranteed to be tracked. Minimum is found with lazy
+    min-heap whose entries are lower bounds of counts and are refreshed when popped.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize SpaceSaving.
+
+        :param capacity: Maximum number of keys tracked
+        """
+        self.capacity = capacity
+        # Key -> [count, error, representative item]
+        self.counts: Dict[str, list] = {}
+        self.heap: List[Tuple[int, str]] = []
+
+    def add(self, key: str, item: str) -> None:
+        """
+        Count occurrence of key.
+
+        :param key: Key to count
+        :param item: Representative item stored when key starts being tracked
+        """
+        entry = self.counts.get(key)
+        if entry is not None:
+            entry[0] += 1
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = [1, 0, item]
+            heapq.heappush(self.heap, (1, key))
+            return
+        while True:
+            count, victim = heapq.heappop(self.heap)
+            actual = self.counts[victim][0]
+            if actual == count:
+                break
+            heapq.heappush(self.heap, (actual, victim))
+        del self.counts[victim]
+        self.counts[key] = [count + 1, count, item]
+        heapq.heappush(self.heap, (count + 1, key))
+
+    def top(self, k: int) -> List[Tuple[str, int, int, str]]:
+        """
+        Get most frequent keys.
+
+        :param k: Number of keys
+        :return: List of (key, count, error, representative item), most frequent first
+        """
+        return [(key, count, error, item)
+                for key, (count, error, item) in heapq.nlargest(k, self.counts.items(), key=lambda pair: pair[1][0])]
+
+
+class StreamingScanner:
+    """
+    Scan high-volume statement stream in bounded CPU and memory.
+
+    Every statement only has its shape counted by Space-Saving heavy-hitter tracker and
+    is offered to sampler. Full scans run at snapshot time on representatives of top-K
+    shapes and on sampled statements, and are cached per shape, so scanning cost per
+    snapshot is bounded by top_k + sample_size regardless of input rate.
+    """
+
+    def __init__(self, scanner: SQLAntipatternScanner, sampling: str = 'reservoir', sample_size: int = 100,
+                 sample_rate: float = 0.01, top_k: int = 20, capacity: int = 1000, max_shape_chars: int = 2048,
+                 seed: Optional[int] = None):
+        """
+        Initialize StreamingScanner.
+
+        :param scanner: SQLAntipatternScanner instance used for full scans
+        :param sampling: Sampling mode, 'reservoir' (fixed-size sample per snapshot) or 'uniform' (fixed rate)
+        :param sample_size: Reservoir size, or cap on uniform sample per snapshot
+        :param sample_rate: Probability of sampling statement in uniform mode
+        :param top_k: Number of most frequent shapes scanned and reported per snapshot
+        :param capacity: Number of shapes heavy-hitter tracker counts
+        :param max_shape_chars: Statement prefix length normalized into shape, bounding per-statement cost
+        :param seed: Random seed, for reproducible samples
+        :raises ValueError: If sampling mode is unknown
+        """
+        if sampling not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode: {sampling}")
+        rng = random.Random(seed)
+        self.scanner = scanner
+        self.sampling = sampling
+        self.sampler = ReservoirSampler(sample_size, rng) if sampling == 'reservoir' else UniformSampler(sample_rate, sample_size, rng)
+        self.top_k = top_k
+        self.heavy_hitters = SpaceSaving(capacity)
+        self.max_shape_chars = max_shape_chars
+        self.total = 0
+        self.window = 0
+        self.issue_cache: Dict[str, List[dict]] = {}
+
+    def shape(self, sql: str) -> str:
+        """
+        Compute shape of statement from bounded prefix.
+
+        :param sql: SQL statement
+        :return: Normalized shape
+        """
+        return normalize_sql(sql[:self.max_shape_chars])
+
+    def observe(self, sql: str) -> None:
+        """
+        Count statement and offer it to sampler.
+
+        :param sql: SQL statement
+        """
+        self.total += 1
+        self.window += 1
+        self.heavy_hitters.add(self.shape(sql), sql)
+        self.sampler.add(sql)
+
+    def issues(self, sql: str, shape: Optional[str] = None) -> List[dict]:
+        """
+        Scan statement, using cache per shape.
+
+        :param sql: SQL statement
+        :param shape: Shape of statement, computed if omitted
+        :return: List of issue dictionaries
+        """
+        shape = shape if shape is not None else self.shape(sql)
+        if shape not in self.issue_cache:
+            self.issue_cache[shape] = [
+                {"name": ap.name, "severity": ap.severity, "offending_sql": offending_sql}
+                for ap, offending_sql, _ in self.scanner.scan(sql).issues
+            ]
+        return self.issue_cache[shape]
+
+    def snapshot(self, elapsed: float) -> dict:
+        """
+        Scan top-K shapes and sample, summarize statements since previous snapshot and start new sample.
+
+        Rule counts of sample are extrapolated to whole window.
+
+        :param elapsed: Seconds since previous snapshot
+        :return: Snapshot event dictionary
+        """
+        heavy_hitters = []
+        for shape, count, error, sql in self.heavy_hitters.top(self.top_k):
+            heavy_hitters.append({
+                "shape": shape,
+                "count": count,
+                "error": error,
+                "share": round(count / self.total, 4) if self.total else 0.0,
+                "issues": self.issues(sql, shape),
+            })
+        sampled = self.sampler.items
+        rule_counts: Dict[Tuple[str, str], int] = {}
+        for sql in sampled:
+            for issue in {(issue["name"], issue["severity"]) for issue in self.issues(sql)}:
+                rule_counts[issue] = rule_counts.get(issue, 0) + 1
+        scale = self.window / len(sampled) if sampled else 0.0
+        event = {
+            "event": "snapshot",
+            "statements": self.window,
+            "total_statements": self.total,
+            "rate": round(self.window / elapsed, 1) if elapsed > 0 else None,
+            "heavy_hitters": heavy_hitters,
+            "sample": {
+                "mode": self.sampling,
+                "statements": len(sampled),
+                "rules": [
+                    {"name": name, "severity": severity, "sampled": count, "estimated_statements": round(count * scale)}
+                    for (name, severity), count in sorted(rule_counts.items(), key=lambda pair: -pair[1])
+                ],
+            },
+        }
+        # Cache keeps only shapes still tracked, so it stays within capacity
+        self.issue_cache = {shape: issues for shape, issues in self.issue_cache.items() if shape in self.heavy_hitters.counts}
+        self.sampler.reset()
+        self.window = 0
+        return event
+
+
+def _statement(line: str) -> Optional[str]:
+    """
+    Get statement from line of query tap: raw SQL, or JSON object with 'sql' key.
+
+    :param line: Input line
+    :return: SQL statement, or None for blank or malformed lines
+    """
+    line = line.strip()
+    if line.startswith('{'):
+        try:
+            sql = json.loads(line).get('sql')
+        except (ValueError, AttributeError):
+            return None
+        return sql if isinstance(sql, str) else None
+    return line or None
+
+
+def stream(lines: Iterable[str], streaming: StreamingScanner, output: TextIO = sys.stdout, interval: float = 10.0,
+           clock: Callable[[], float] = time.monotonic) -> None:
+    """
+    Consume statement stream and emit snapshots as JSON Lines.
+
+    Snapshot is emitted after each statement arriving interval seconds or more after
+    previous snapshot, and once more at end of stream.
+
+    :param lines: Stream lines, one statement per line
+    :param streaming: StreamingScanner instance
+    :param output: Stream JSON Lines are written to
+    :param interval: Seconds between snapshots
+    :param clock: Monotonic clock
+    """
+    def emit(elapsed: float) -> None:
+        output.write(json.dumps(streaming.snapshot(elapsed)) + '\n')
+        output.flush()
+
+    last = clock()
+    try:
+        for line in lines:
+            sql = _statement(line)
+            if sql is None:
+                continue
+            streaming.observe(sql)
+            now = clock()
+            if now - last >= interval:
+                emit(now - last)
+                last = now
+    except KeyboardInterrupt:
+        pass
+    emit(clock() - last)
@@ -0,0 +1,128 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/suppression.py
+import re
+import json
+import hashlib
+from typing import Dict, List, Optional, Set, Tuple
+from sql_antipattern_scanner.statements import Finding, finding_statements, normalize_sql
+
+# Suppression entry covering every rule
+ALL_RULES = '*'
+
+BASELINE_VERSION = 1
+
+_COMMENT_SCAN_RE = re.compile(r"'[^']*(?:''[^']*)*'|\"[^\"]*(?:\"\"[^\"]*)*\"|--[^\n]*|/\*.*?\*/|;", re.DOTALL)
+_DIRECTIVE_RE = re.compile(r'\bantipattern:\s*ignore\b(?:\[([^\]]*)\])?', re.IGNORECASE)
+
+
+def inline_suppressions(sql: str) -> Set[str]:
+    """
+    Collect rules suppressed by '-- antipattern: ignore[rule, ...]' comments of first statement.
+
+    Comments above statement or inside it count; comment-like text in string literals
+    does not. Bare 'ignore' (or 'ignore[*]') suppresses every rule.
+
+    :param sql: SQL text
+    :return: Set of lower-cased suppressed rule names, containing ALL_RULES if every rule is suppressed
+    """
+    suppressed: Set[str] = set()
+    for match in _COMMENT_SCAN_RE.finditer(sql):
+        token = match.group(0)
+        if token == ';':
+            break
+        if token[0] not in '-/':
+            continue
+        for directive in _DIRECTIVE_RE.finditer(token):
+            if directive.group(1) is None:
+                suppressed.add(ALL_RULES)
+            else:
+                suppressed.update(rule.strip().lower() for rule in directive.group(1).split(',') if rule.strip())
+    return suppressed
+
+
+class Baseline:
+    """
+    Set of accepted finding fingerprints, so scans report only findings absent from it.
+
+    Fingerprint combines rule, file, normalized enclosing statement and occurrence index
+    among findings with same rule, file and statement. It survives reformatting, changed
+    literals and lines moving, while telling repeated identical statements apart.
+    """
+
+    def __init__(self, fingerprints: Optional[Set[str]] = None):
+        """
+        Initialize Baseline.
+
+        :param fingerprints: Accepted finding fingerprints
+        """
+        self.fingerprints: Set[str] = set(fingerprints or ())
+
+    @staticmethod
+    def fingerprints_of(findings: List[Finding], repo_root: str = '.', sources: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Compute baseline fingerprints of findings.
+
+        Findings whose statement cannot be found, such as SQL embedded in application
+        code, are keyed by normalized context instead.
+
+        :param findings: List of located findings
+        :param repo_root: Directory finding paths are relative to
+        :param sources: SQL text by file path, for findings of text not read from disk
+        :return: List of hex fingerprints, in same order as findings
+        """
+        occurrences: Dict[Tuple[str, str, str], int] = {}
+        fingerprints = []
+        for finding, statement in zip(findings, finding_statements(findings, repo_root, sources)):
+            key = (finding.antipattern.name, finding.file, normalize_sql(statement.text if statement else finding.context))
+            index = occurrences.get(key, 0)
+            occurrences[key] = index + 1
+            fingerprints.append(hashlib.sha1('\x1f'.join(key + (str(index),)).encode('utf-8')).hexdigest())
+        return fingerprints
+
+    @classmethod
+    def from_findings(cls, findings: List[Finding], repo_root: str = '.', sources: Optional[Dict[str, str]] = None) -> 'Baseline':
+        """
+        Create Baseline accepting given findings.
+
+        :param findings: List of located findings
+        :param repo_root: Directory finding paths are relative to
+        :param sources: SQL text by file path, for findings of text not read from disk
+        :return: Baseline instance
+        """
+        return cls(set(cls.fingerprints_of(findings, repo_root, sources)))
+
+    @classmethod
+    def load(cls, path: str) -> 'Baseline':
+        """
+        Load Baseline from JSON file.
+
+        :param path: Path to baseline file
+        :return: Baseline instance
+        :raises ValueError: If file is not a baseline of supported version
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get('version') != BASELINE_VERSION or not isinstance(data.get('fingerprints'), list):
+            raise ValueError(f"{path} is not a version {BASELINE_VERSION} baseline file")
+        return cls(set(data['fingerprints']))
+
+    def save(self, path: str) -> None:
+        """
+        Save Baseline to JSON file, fingerprints sorted so file diffs cleanly.
+
+        :param path: Path to baseline file
+        """
+        with open(path, 'w') as f:
+            json.dump({'version': BASELINE_VERSION, 'fingerprints': sorted(self.fingerprints)}, f, indent=2)
+            f.write('\n')
+
+    def new_findings(self, findings: List[Finding], repo_root: str = '.',
+                     sources: Optional[Dict[str, str]] = None) -> List[bool]:
+        """
+        Check which findings are absent from baseline, with one set lookup per finding.
+
+        :param findings: List of located findings
+        :param repo_root: Directory finding paths are relative to
+        :param sources: SQL text by file path, for findings of text not read from disk
+        :return: List of flags, True for new findings, in same order as findings
+        """
+        return [fingerprint not in self.fingerprints for fingerprint in self.fingerprints_of(findings, repo_root, sources)]
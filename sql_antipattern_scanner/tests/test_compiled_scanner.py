@@ -0,0 +1,108 @@
+# sql-antipattern-scanner/tests/test_compiled_scanner.py
+from sql_antipattern_scanner.compiled_scanner import CompiledScanner, ScannerBuilder
+from sql_antipattern_scanner.sql_antipattern_scanner import Antipattern, SQLAntipatternScanner
+from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
+from sql_antipattern_scanner.rule_packs import RulePack
+
+import re
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+CUSTOM = Antipattern("Custom Rule", "Uses forbidden table", "High", "Use view", "")
+SQL = "SELECT * FROM legacy WHERE a = NULL"
+
+
+class TestScannerIsolation(unittest.TestCase):
+    """
+    Test suite for isolation of mutable scanners from each other.
+    """
+
+    def test_patterns_do_not_leak(self) -> None:
+        """
+        Test rule added to one scanner reaches neither defaults nor other scanners.
+        """
+        count = len(DEFAULT_ANTIPATTERNS)
+        scanner = SQLAntipatternScanner()
+        scanner.add_pattern(re.compile(r'\blegacy\b', re.IGNORECASE), CUSTOM)
+        self.assertEqual(len(DEFAULT_ANTIPATTERNS), count)
+        self.assertNotIn("Custom Rule", [issue[0].name for issue in SQLAntipatternScanner().scan_sql(SQL)])
+
+    def test_cache_is_per_instance(self) -> None:
+        """
+        Test cached results are neither shared between scanners nor stale after configuration changes.
+        """
+        scanner = SQLAntipatternScanner()
+        self.assertIn("SELECT *", [issue[0].name for issue in scanner.scan(SQL).issues])
+        scanner.ignore_pattern("SELECT *")
+        self.assertNotIn("SELECT *", [issue[0].name for issue in scanner.scan(SQL).issues])
+        self.assertIn("SELECT *", [issue[0].name for issue in SQLAntipatternScanner().scan(SQL).issues])
+
+
+class TestCompiledScanner(unittest.TestCase):
+    """
+    Test suite for ScannerBuilder and frozen CompiledScanner.
+    """
+
+    def test_matches_mutable_scanner(self) -> None:
+        """
+        Test compiled scanner reports same issues as equally configured mutable scanner.
+        """
+        mutable = SQLAntipatternScanner(dialect='mysql')
+        mutable.ignore_pattern("NULL Comparison")
+        compiled = ScannerBuilder().dialect('mysql').ignore("NULL Comparison").build()
+        self.assertEqual(compiled.scan_sql(SQL), mutable.scan_sql(SQL))
+
+    def test_immutable(self) -> None:
+        """
+        Test configuration and results of compiled scanner cannot be changed.
+        """
+        scanner = ScannerBuilder().build()
+        with self.assertRaises(TypeError):
+            scanner.add_pattern(re.compile('x'), CUSTOM)
+        with self.assertRaises(TypeError):
+            scanner.ignore_pattern("SELECT *")
+        with self.assertRaises(AttributeError):
+            scanner.dialect = 'mysql'
+        self.assertIsInstance(scanner.patterns, tuple)
+        self.assertIsInstance(scanner.scan(SQL).issues, tuple)
+        with self.assertRaises(ValueError):
+            ScannerBuilder().dialect('oracle')
+
+    def test_builder_clones_are_independent(self) -> None:
+        """
+        Test variants derived from compiled scanner keep its rules without affecting it.
+        """
+        pack = RulePack.from_dict({'name': 'house-rules', 'rules': [
+            {'name': 'No Legacy', 'description': 'Legacy table is frozen.', 'severity': 'High',
+             'suggestion': 'Query replacement table.', 'remediation': '', 'keywords': ['LEGACY']}]}).compile()
+        base = ScannerBuilder().add_rule_pack(pack).ignore("NULL Comparison").build()
+        tenant = base.builder().add_pattern(re.compile(r'\blegacy\b', re.IGNORECASE), CUSTOM).ignore("SELECT *").build()
+        self.assertIsInstance(tenant, CompiledScanner)
+        self.assertEqual({issue[0].name for issue in base.scan_sql(SQL)}, {"SELECT *", "No Legacy"})
+        self.assertEqual({issue[0].name for issue in tenant.scan_sql(SQL)}, {"Custom Rule", "No Legacy"})
+
+    def test_custom_rules_survive_dialect_change(self) -> None:
+        """
+        Test custom rules of compiled scanner are kept by derived builder that switches dialect.
+        """
+        foo = Antipattern("FOO", "Uses foo", "Low", "Avoid foo", "")
+        base = ScannerBuilder().add_pattern(re.compile(r'\bfoo\b', re.IGNORECASE), foo).build()
+        postgres = base.builder().dialect('postgres').build()
+        self.assertEqual(postgres.dialect, 'postgres')
+        self.assertEqual(postgres.custom_patterns, base.custom_patterns)
+        self.assertIn("FOO", [issue[0].name for issue in postgres.scan_sql("SELECT foo FROM t")])
+        self.assertEqual(len(base.builder().build().patterns), len(base.patterns))
+
+    def test_shared_between_threads(self) -> None:
+        """
+        Test one compiled scanner gives same results when scanning concurrently from many threads.
+        """
+        scanner = ScannerBuilder().cache_size(8).build()
+        queries = [f"SELECT * FROM t{i % 20} WHERE a = NULL ORDER BY RAND()" for i in range(400)]
+        expected = [scanner._scan(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertEqual(list(pool.map(scanner.scan, queries)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# sql-antipattern-scanner/tests/test_cost_model.py
+from sql_antipattern_scanner.cost_model import CostModel, estimate_findings
+from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
+from sql_antipattern_scanner.statements import Finding, locate_findings
+from sql_antipattern_scanner.report_generator import ReportGenerator
+from sql_antipattern_scanner.cli import add_finding_costs, generate_findings_report_data, generate_report_data
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import os
+import tempfile
+import unittest
+
+SELECT_STAR = DEFAULT_ANTIPATTERNS[0][1]
+
+
+class TestCostModel(unittest.TestCase):
+    """
+    Test suite for structural cost estimation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up cost model with table-size hints before each test method.
+        """
+        self.model = CostModel({'users': 1000000, 'orders': 5000000, 'tiny': 10})
+
+    def test_table_sizes_and_filters(self) -> None:
+        """
+        Test size hints and WHERE/LIMIT bound cost, and unbounded scans are named.
+        """
+        tiny = self.model.estimate("SELECT id FROM tiny")
+        unbounded = self.model.estimate("SELECT id FROM users")
+        filtered = self.model.estimate("SELECT id FROM users WHERE id = 1")
+        self.assertLess(tiny.cost, filtered.cost)
+        self.assertLess(filtered.cost, unbounded.cost)
+        self.assertIn("unbounded scan of users", unbounded.factors)
+        self.assertEqual(filtered.factors, [])
+
+    def test_joins_and_subqueries(self) -> None:
+        """
+        Test cross joins and correlated subqueries cost more than conditioned joins and plain subqueries.
+        """
+        joined = self.model.estimate("SELECT * FROM users u JOIN orders o ON o.user_id = u.id WHERE u.id = 5")
+        cross = self.model.estimate("SELECT * FROM users, orders")
+        self.assertIn("1 join", joined.factors)
+        self.assertIn("1 join without condition", cross.factors)
+        self.assertLess(joined.cost, cross.cost)
+
+        uncorrelated = self.model.estimate("SELECT * FROM users WHERE id IN (SELECT user_id FROM orders WHERE total > 5)")
+        correlated = self.model.estimate("SELECT * FROM users u WHERE EXISTS (SELECT 1 FROM orders o WHERE o.user_id = u.id)")
+        self.assertIn("subquery at depth 1", uncorrelated.factors)
+        self.assertIn("correlated subquery at depth 1", correlated.factors)
+        self.assertLess(uncorrelated.cost, correlated.cost)
+
+    def test_expression_sort(self) -> None:
+        """
+        Test sorts on expressions cost more than sorts on columns.
+        """
+        column = self.model.estimate("SELECT * FROM users WHERE a = 1 ORDER BY name")
+        expression = self.model.estimate("SELECT * FROM users WHERE a = 1 ORDER BY LOWER(name)")
+        self.assertIn("sort on expression", expression.factors)
+        self.assertLess(column.cost, expression.cost)
+
+    def test_mysql_limit_offset(self) -> None:
+        """
+        Test MySQL 'LIMIT offset, count' bounds rows by count, not offset.
+        """
+        self.assertEqual(self.model.estimate("SELECT id FROM users LIMIT 100000, 10"),
+                         self.model.estimate("SELECT id FROM users LIMIT 10 OFFSET 100000"))
+        self.assertLess(self.model.estimate("SELECT id FROM users LIMIT 0, 10").cost,
+                        self.model.estimate("SELECT id FROM users LIMIT 0, 500000").cost)
+
+    def test_cache_bounded(self) -> None:
+        """
+        Test estimate cache keeps only most recently used statements.
+        """
+        model = CostModel(cache_size=2)
+        model.estimate("SELECT a FROM t1")
+        model.estimate("SELECT a FROM t2")
+        model.estimate("SELECT a FROM t1")
+        model.estimate("SELECT a FROM t3")
+        self.assertEqual(list(model.cache), ["SELECT a FROM t1", "SELECT a FROM t3"])
+
+    def test_query_issues_sorted_by_cost(self) -> None:
+        """
+        Test issues of scanned SQL text get cost of their own statement and are ordered most expensive first.
+        """
+        statements = ["SELECT * FROM tiny;", "SELECT id FROM users, orders WHERE note = NULL;"]
+        sql = "\n".join(statements) + "\n"
+        scanner = SQLAntipatternScanner()
+        issues = [issue for statement in statements for issue in scanner.scan_sql(statement)]
+        report_data = generate_report_data(scanner, issues, sql)
+        add_finding_costs(report_data, self.model, locate_findings(issues, sql, "<query>"), sources={"<query>": sql})
+        costs = [issue["estimated_cost"] for issue in report_data["issues"]]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertEqual(costs[-1], self.model.estimate("SELECT * FROM tiny;").cost)
+        self.assertEqual(report_data["issues"][0]["cost_factors"], ["1 join"])
+        projected = generate_report_data(scanner, issues, sql, fields=("name", "line"))
+        add_finding_costs(projected, self.model, locate_findings(issues, sql, "<query>"), sources={"<query>": sql},
+                          include_costs=False)
+        self.assertEqual([issue["name"] for issue in projected["issues"]], [issue["name"] for issue in report_data["issues"]])
+        self.assertEqual(set(projected["issues"][0]), {"name", "line"})
+
+    def test_findings_sorted_by_cost(self) -> None:
+        """
+        Test findings get cost of their statement and are ordered most expensive first.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'a.sql'), 'w') as f:
+                f.write("SELECT * FROM tiny;\nSELECT * FROM users, orders;\n")
+            findings = [Finding('a.sql', 1, SELECT_STAR, 'SELECT *', ''), Finding('a.sql', 2, SELECT_STAR, 'SELECT *', '')]
+            estimates = estimate_findings(self.model, findings, directory)
+            report_data = generate_findings_report_data(SQLAntipatternScanner(), findings)
+            add_finding_costs(report_data, self.model, findings, directory)
+        self.assertLess(estimates[0].cost, estimates[1].cost)
+        self.assertEqual([issue["line"] for issue in report_data["issues"]], [2, 1])
+        self.assertIn("issue-cost", ReportGenerator().generate_html(report_data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# sql-antipattern-scanner/tests/test_dialects.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.dialects import detect_dialect, detect_directory_dialect
+from sql_antipattern_scanner.rule_packs import RulePack
+
+import os
+import tempfile
+import unittest
+
+
+class TestDialects(unittest.TestCase):
+    """
+    Test suite for dialect-aware scanning.
+    """
+
+    def test_mysql_only_rule_skipped_for_postgres(self) -> None:
+        """
+        Test ORDER BY RAND() is only reported for MySQL.
+        """
+        sql = "SELECT id FROM users ORDER BY RAND()"
+        mysql_names = [issue[0].name for issue in SQLAntipatternScanner(dialect="mysql").scan_sql(sql)]
+        postgres_names = [issue[0].name for issue in SQLAntipatternScanner(dialect="postgres").scan_sql(sql)]
+        self.assertIn("ORDER BY RAND()", mysql_names)
+        self.assertNotIn("ORDER BY RAND()", postgres_names)
+
+    def test_dialect_only_rule(self) -> None:
+        """
+        Test dialect-only rule is enabled for its dialect.
+        """
+        sql = "SELECT TOP 10 id FROM users ORDER BY NEWID()"
+        names = [issue[0].name for issue in SQLAntipatternScanner(dialect="tsql").scan_sql(sql)]
+        self.assertIn("ORDER BY NEWID()", names)
+        self.assertEqual(SQLAntipatternScanner().scan_sql(sql), [])
+
+    def test_dialect_function_table(self) -> None:
+        """
+        Test dialect-specific functions are recognized in WHERE clauses.
+        """
+        sql = "SELECT id FROM events WHERE DATE_TRUNC('day', created_at) = '2024-01-01'"
+        names = [issue[0].name for issue in SQLAntipatternScanner(dialect="postgres").scan_sql(sql)]
+        self.assertIn("Function in WHERE", names)
+
+    def test_unsupported_dialect(self) -> None:
+        """
+        Test unsupported dialect is rejected.
+        """
+        with self.assertRaises(ValueError):
+            SQLAntipatternScanner(dialect="oracle")
+
+    def test_rule_pack_dialect_filter(self) -> None:
+        """
+        Test rule pack rules limited to other dialects are dropped.
+        """
+        rule_pack = RulePack.from_dict({"rules": [{
+            "name": "STRAIGHT_JOIN", "description": "", "severity": "Low", "suggestion": "",
+            "remediation": "", "keywords": ["STRAIGHT_JOIN"], "dialects": ["mysql"]}]}).compile()
+        scanner = SQLAntipatternScanner(dialect="sqlite")
+        scanner.add_rule_pack(rule_pack)
+        self.assertEqual(scanner.rule_packs[0].rules, [])
+
+    def test_detect_dialect(self) -> None:
+        """
+        Test dialect detection heuristics.
+        """
+        self.assertEqual(detect_dialect("SELECT `id` FROM `users` LIMIT 10, 20"), "mysql")
+        self.assertEqual(detect_dialect("SELECT TOP 5 * FROM [users] WITH (NOLOCK)"), "tsql")
+        self.assertEqual(detect_dialect("SELECT payload::jsonb FROM events"), "postgres")
+        self.assertIsNone(detect_dialect("SELECT id FROM users"))
+
+    def test_detect_directory_dialect(self) -> None:
+        """
+        Test dialect detection across directory.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            for index, sql in enumerate(["PRAGMA foreign_keys = ON;", "INSERT OR REPLACE INTO t VALUES (1);",
+                                         "SELECT `id` FROM `users`;"]):
+                with open(os.path.join(tmp, f"{index}.sql"), "w") as f:
+                    f.write(sql)
+            self.assertEqual(detect_directory_dialect(tmp), "sqlite")
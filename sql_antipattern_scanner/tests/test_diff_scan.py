@@ -0,0 +1,121 @@
+# sql-antipattern-scanner/tests/test_diff_scan.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.diff_scan import git_diff, parse_unified_diff, scan_changed_lines, scan_diff
+from sql_antipattern_scanner.statements import split_statements
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+MIGRATION_SQL = """SELECT * FROM users;
+SELECT id FROM orders
+WHERE status = NULL;
+-- untouched
+SELECT id FROM products WHERE name LIKE '%lamp%';
+"""
+
+MIGRATION_DIFF = """diff --git a/migrations/001.sql b/migrations/001.sql
+--- a/migrations/001.sql
++++ b/migrations/001.sql
+@@ -3 +3 @@ SELECT id FROM orders
+-WHERE status = 1;
++WHERE status = NULL;
+"""
+
+
+class TestDiffScan(unittest.TestCase):
+    """
+    Test suite for diff-aware incremental scanning.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up test environment before each test method.
+        """
+        self.scanner: SQLAntipatternScanner = SQLAntipatternScanner()
+
+    def test_split_statements(self) -> None:
+        """
+        Test statements are split with line numbers, ignoring semicolons in literals.
+        """
+        statements = split_statements("SELECT ';' FROM t;\n\nSELECT 1\nFROM u; -- trailing")
+        self.assertEqual([s.text for s in statements], ["SELECT ';' FROM t;", "SELECT 1\nFROM u;"])
+        self.assertEqual([(s.start_line, s.end_line) for s in statements], [(1, 1), (3, 4)])
+
+    def test_parse_unified_diff(self) -> None:
+        """
+        Test changed lines are extracted per new file path.
+        """
+        diff = MIGRATION_DIFF + """--- a/old.sql
++++ /dev/null
+@@ -1,2 +0,0 @@
+-SELECT 1;
+-+++ not a header
+"""
+        self.assertEqual(parse_unified_diff(diff), {"migrations/001.sql": {3}})
+        timestamped = "--- a.sql\t2024-01-01 00:00:00\n+++ my dir/a.sql\t2024-01-02 00:00:00\n@@ -1 +1 @@\n-x\n+y\n"
+        self.assertEqual(parse_unified_diff(timestamped), {"my dir/a.sql": {1}})
+
+    def test_only_changed_statements_scanned(self) -> None:
+        """
+        Test untouched statements are not reported.
+        """
+        findings = scan_changed_lines(self.scanner, MIGRATION_SQL, {3}, "001.sql")
+        self.assertEqual([(f.antipattern.name, f.line) for f in findings],
+                         [("NULL Comparison", 3)])
+
+    def test_findings_on_unchanged_lines_attributed_to_change(self) -> None:
+        """
+        Test findings on unchanged lines of changed statement are reported on its first changed line.
+        """
+        sql = "SELECT *\nFROM users\nWHERE id = 1;"
+        self.assertEqual([(f.antipattern.name, f.line) for f in scan_changed_lines(self.scanner, sql, {3})], [("SELECT *", 3)])
+        self.assertEqual([(f.antipattern.name, f.line) for f in scan_changed_lines(self.scanner, sql, {1})], [("SELECT *", 1)])
+        findings = scan_changed_lines(SQLAntipatternScanner(dialect='postgres'), "DELETE FROM logs\n;\n", {2})
+        self.assertEqual([(f.antipattern.name, f.line) for f in findings], [("Unbatched Write", 2)])
+
+    def test_deleted_lines_touch_statement(self) -> None:
+        """
+        Test hunk that only deletes lines rescans statement around deletion.
+        """
+        diff = "--- a/m.sql\n+++ b/m.sql\n@@ -2 +1,0 @@\n-WHERE created < now()\n"
+        self.assertEqual(parse_unified_diff(diff), {"m.sql": {1, 2}})
+        sql = "SELECT id FROM a;\nDELETE FROM logs\n;\n"
+        diff = "--- a/m.sql\n+++ b/m.sql\n@@ -3 +2,0 @@\n-WHERE created < now()\n"
+        findings = scan_changed_lines(SQLAntipatternScanner(dialect='postgres'), sql, parse_unified_diff(diff)["m.sql"])
+        self.assertEqual([(f.antipattern.name, f.line) for f in findings], [("Unbatched Write", 2)])
+
+    def test_scan_diff(self) -> None:
+        """
+        Test scanning files referenced by diff.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "migrations"))
+            with open(os.path.join(tmp, "migrations", "001.sql"), "w") as f:
+                f.write(MIGRATION_SQL)
+            findings, scanned = scan_diff(self.scanner, MIGRATION_DIFF, tmp)
+        self.assertEqual(scanned, ["migrations/001.sql"])
+        self.assertEqual([(f.file, f.line, f.antipattern.name) for f in findings],
+                         [("migrations/001.sql", 3, "NULL Comparison")])
+
+    @unittest.skipIf(shutil.which("git") is None, "git is not installed")
+    def test_git_diff_in_subdirectory(self) -> None:
+        """
+        Test git diff paths are relative to repo root that is subdirectory of repository.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "db")
+            os.makedirs(os.path.join(root, "migrations"))
+            path = os.path.join(root, "migrations", "001.sql")
+            with open(path, "w") as f:
+                f.write(MIGRATION_SQL.replace("= NULL", "= 1"))
+            git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            for command in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "initial"]):
+                subprocess.run(git + command, cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+            with open(path, "w") as f:
+                f.write(MIGRATION_SQL)
+            findings, scanned = scan_diff(self.scanner, git_diff("HEAD", root), root)
+        self.assertEqual(scanned, ["migrations/001.sql"])
+        self.assertEqual([(f.line, f.antipattern.name) for f in findings], [(3, "NULL Comparison")])
@@ -0,0 +1,89 @@
+# sql-antipattern-scanner/tests/test_embedded_sql.py
+from sql_antipattern_scanner.embedded_sql import extract_python, extract_java, extract_go, extract_tree, scan_embedded, looks_like_sql
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import os
+import tempfile
+import unittest
+
+PYTHON_SOURCE = '''"""SELECT docstring FROM nowhere"""
+def f(cur, table, uid):
+    cur.execute(f"SELECT * FROM {table} WHERE id = {uid}")
+    q = ("SELECT id FROM orders "
+         "WHERE LOWER(status) = %s") % (x,)
+    cur.execute("""
+        SELECT a
+        FROM t
+        WHERE b LIKE '%x'
+    """)
+    cur.execute("SELECT id FROM {} WHERE x = {name}".format(t, name=1))
+    print("Select an option from the menu")
+'''
+
+
+class TestEmbeddedSQL(unittest.TestCase):
+    """
+    Test suite for embedded SQL extraction.
+    """
+
+    def test_python_templates(self) -> None:
+        """
+        Test f-strings, %-formatting and str.format become placeholders, and docstrings and prose are skipped.
+        """
+        embedded = extract_python("a.py", PYTHON_SOURCE)
+        self.assertEqual([(item.line, item.sql.strip().split('\n')[0]) for item in embedded], [
+            (3, "SELECT * FROM ? WHERE id = ?"),
+            (4, "SELECT id FROM orders WHERE LOWER(status) = ?"),
+            (6, "SELECT a"),
+            (11, "SELECT id FROM ? WHERE x = ?"),
+        ])
+        self.assertFalse(looks_like_sql("Select an option from the menu"))
+
+    def test_java_and_go(self) -> None:
+        """
+        Test concatenation, text blocks, raw strings and printf verbs in Java and Go.
+        """
+        java = ('// "SELECT * FROM comment WHERE x = 1"\n'
+                'String q = "SELECT * FROM users " +\n    "WHERE id = " + id + " AND name = \\"x\\"";\n'
+                'String r = String.format("SELECT id FROM t WHERE c = %d", v);\n'
+                'String s = """\n    SELECT * FROM blocks WHERE a = 1\n    """;\n')
+        self.assertEqual([(item.line, item.sql.strip()) for item in extract_java("B.java", java)], [
+            (2, 'SELECT * FROM users WHERE id = ? AND name = "x"'),
+            (4, "SELECT id FROM t WHERE c = ?"),
+            (5, "SELECT * FROM blocks WHERE a = 1"),
+        ])
+        go = 'db.Query(`SELECT *\nFROM users WHERE name LIKE \'%bob\'`)\nfmt.Sprintf("SELECT id FROM t WHERE x = %v", 3)\n'
+        self.assertEqual([item.line for item in extract_go("c.go", go)], [1, 3])
+
+    def test_tree_scan_maps_lines(self) -> None:
+        """
+        Test parallel tree extraction and findings mapped to host source lines.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'a.py'), 'w') as f:
+                f.write(PYTHON_SOURCE)
+            with open(os.path.join(directory, 'c.go'), 'w') as f:
+                f.write('package main\nvar q = `SELECT *\nFROM users WHERE name LIKE \'%bob\'`\n')
+            embedded = extract_tree(directory, workers=2)
+            self.assertEqual(embedded, extract_tree(directory, workers=1))
+        findings = {(os.path.basename(finding.file), finding.line, finding.antipattern.name)
+                    for finding in scan_embedded(SQLAntipatternScanner(), embedded)}
+        self.assertIn(("a.py", 9, "Leading Wildcard"), findings)
+        self.assertIn(("c.go", 3, "Leading Wildcard"), findings)
+        self.assertIn(("a.py", 5, "Function in WHERE"), findings)
+
+    def test_concatenated_literals_map_lines(self) -> None:
+        """
+        Test findings in literals joined across lines map to line of their own literal part.
+        """
+        scanner = SQLAntipatternScanner()
+        java = 'String q = "SELECT id FROM t\\n" +\n    "WHERE LOWER(name) = ?";\n'
+        self.assertEqual([(f.line, f.antipattern.name) for f in scan_embedded(scanner, extract_java("B.java", java))],
+                         [(2, "Function in WHERE")])
+        python = 'q = ("SELECT id FROM t "\n     f"JOIN {u} ON 1 = 1 "\n     + "WHERE LOWER(name) = %s") % (x,)\n'
+        self.assertEqual([(f.line, f.antipattern.name) for f in scan_embedded(scanner, extract_python("a.py", python))],
+                         [(3, "Function in WHERE")])
+
+
+if __name__ == '__main__':
+    unittest.main()
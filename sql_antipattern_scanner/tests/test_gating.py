@@ -0,0 +1,75 @@
+# sql-antipattern-scanner/tests/test_gating.py
+from sql_antipattern_scanner.gating import Gate, GateEvaluator
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.suppression import Baseline
+from sql_antipattern_scanner.statements import locate_findings
+
+import unittest
+from unittest import mock
+
+SQL = "SELECT id FROM a;\nSELECT * FROM b;\nSELECT id FROM c WHERE x = NULL;\nSELECT id FROM d ORDER BY RAND();\n"
+
+
+class TestGating(unittest.TestCase):
+    """
+    Test suite for threshold gating with early exit.
+    """
+
+    def test_fail_on(self) -> None:
+        """
+        Test first statement with finding at or above severity breaches gate and later files are not read.
+        """
+        evaluator = GateEvaluator(SQLAntipatternScanner(), Gate(fail_on="Critical"))
+
+        def files():
+            yield "q.sql", SQL, None
+            self.fail("Gate read file after breach")
+
+        breach = evaluator.check_files(files())
+        self.assertEqual((breach.file, breach.line, breach.antipattern.name), ("q.sql", 3, "NULL Comparison"))
+        self.assertEqual(evaluator.statements, 3)
+        self.assertIsNone(GateEvaluator(SQLAntipatternScanner(), Gate(fail_on="Critical")).check_file("q.sql", "SELECT * FROM b"))
+
+    def test_max_score(self) -> None:
+        """
+        Test gate breaches as soon as accumulated score exceeds limit, and passes at limit.
+        """
+        breach = GateEvaluator(SQLAntipatternScanner(), Gate(max_score=5)).check_file("q.sql", SQL)
+        self.assertEqual((breach.line, breach.score), (3, 6))
+        evaluator = GateEvaluator(SQLAntipatternScanner(), Gate(max_score=9))
+        self.assertIsNone(evaluator.check_file("q.sql", SQL))
+        self.assertEqual(evaluator.score, 9)
+
+    def test_cheap_stage_skips_parse(self) -> None:
+        """
+        Test regex match proves breach without parsing, and statements no structural check can flag are not parsed.
+        """
+        evaluator = GateEvaluator(SQLAntipatternScanner(), Gate(fail_on="High"))
+        with mock.patch('sqlparse.parse') as parse:
+            self.assertIsNone(evaluator.check("SELECT id FROM a"))
+            self.assertEqual(evaluator.check("SELECT id FROM d ORDER BY RAND()").antipattern.name, "ORDER BY RAND()")
+            parse.assert_not_called()
+        self.assertEqual(evaluator.check("SELECT id FROM a, b WHERE a.id = b.id").antipattern.name, "ANSI-89 Join")
+
+    def test_suppression_and_baseline(self) -> None:
+        """
+        Test suppressed and baseline findings do not fail gate.
+        """
+        scanner = SQLAntipatternScanner()
+        self.assertIsNone(GateEvaluator(scanner, Gate(fail_on="Low")).check("SELECT * FROM b -- antipattern: ignore"))
+        sql = "SELECT id FROM c WHERE x = NULL;\n"
+        baseline = Baseline.from_findings(locate_findings(scanner.scan(sql).issues, sql, "q.sql"), sources={"q.sql": sql})
+        evaluator = GateEvaluator(scanner, Gate(fail_on="Critical"), baseline)
+        self.assertIsNone(evaluator.check_file("q.sql", sql))
+        self.assertIsNotNone(evaluator.check_file("q.sql", sql + "SELECT id FROM d WHERE y = NULL;\n"))
+
+    def test_unknown_severity(self) -> None:
+        """
+        Test unknown severity is rejected.
+        """
+        with self.assertRaises(ValueError):
+            Gate(fail_on="Severe")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# sql-antipattern-scanner/tests/test_history.py
+from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
+from sql_antipattern_scanner.history import FindingsStore
+from sql_antipattern_scanner.statements import Finding, fingerprint_findings
+
+import unittest
+
+SELECT_STAR = DEFAULT_ANTIPATTERNS[0][1]
+NULL_COMPARISON = DEFAULT_ANTIPATTERNS[2][1]
+
+
+class TestHistory(unittest.TestCase):
+    """
+    Test suite for findings history store.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up in-memory store with two runs before each test method.
+        """
+        self.store = FindingsStore(":memory:")
+        self.store.record_run([
+            Finding("a.sql", 1, SELECT_STAR, "SELECT *", ""),
+            Finding("a.sql", 4, NULL_COMPARISON, "x = NULL", ""),
+        ], label="first")
+        self.store.record_run([
+            Finding("a.sql", 2, SELECT_STAR, "select  *", ""),
+            Finding("b.sql", 1, SELECT_STAR, "SELECT *", ""),
+        ], label="second")
+
+    def tearDown(self) -> None:
+        """
+        Close store after each test method.
+        """
+        self.store.close()
+
+    def test_fingerprint_ignores_formatting_and_line(self) -> None:
+        """
+        Test fingerprints survive reformatting but distinguish repeated findings.
+        """
+        first = fingerprint_findings([Finding("a.sql", 1, SELECT_STAR, "SELECT *", "")])
+        moved = fingerprint_findings([Finding("a.sql", 9, SELECT_STAR, "select\n*", "")])
+        repeated = fingerprint_findings([Finding("a.sql", 1, SELECT_STAR, "SELECT *", "")] * 2)
+        self.assertEqual(first, moved)
+        self.assertNotEqual(repeated[0], repeated[1])
+
+    def test_new_and_fixed_findings(self) -> None:
+        """
+        Test diff between latest run and run before it.
+        """
+        self.assertEqual([(f["file"], f["rule"]) for f in self.store.new_findings()], [("b.sql", "SELECT *")])
+        self.assertEqual([(f["file"], f["rule"]) for f in self.store.fixed_findings()], [("a.sql", "NULL Comparison")])
+
+    def test_first_run_is_all_new(self) -> None:
+        """
+        Test first run has no previous run to compare against.
+        """
+        self.assertEqual(len(self.store.new_findings(run_id=1)), 2)
+
+    def test_top_rules_by_file(self) -> None:
+        """
+        Test aggregation of rules per file across runs.
+        """
+        top = self.store.top_rules_by_file(limit=1)
+        self.assertEqual(top, [{"file": "a.sql", "rule": "SELECT *", "count": 2, "runs": 2}])
+
+    def test_trend(self) -> None:
+        """
+        Test finding counts per run.
+        """
+        self.assertEqual([row["count"] for row in self.store.trend()], [2, 2])
+        self.assertEqual([row["count"] for row in self.store.trend(rule="NULL Comparison")], [1, 0])
@@ -0,0 +1,92 @@
+# sql-antipattern-scanner/tests/test_index_advisor.py
+from sql_antipattern_scanner.index_advisor import IndexAdvisor, advise_indexes
+from sql_antipattern_scanner.schema_catalog import SchemaCatalog
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import unittest
+
+
+class TestIndexAdvisor(unittest.TestCase):
+    """
+    Test suite for workload index recommendations.
+    """
+
+    def test_extract_usage(self) -> None:
+        """
+        Test equality, join, sort and range columns are attributed to tables, and unindexable predicates are skipped.
+        """
+        advisor = IndexAdvisor()
+        usage = advisor.extract("SELECT o.id FROM orders o JOIN customers c ON c.id = o.customer_id "
+                                "WHERE o.status = 'open' AND o.total > 100 AND c.name LIKE '%x' AND o.note <> 'a' "
+                                "ORDER BY o.created_at DESC")
+        self.assertEqual(usage['orders'], (('customer_id', 'status'), ('created_at',), ('total',)))
+        self.assertEqual(usage['customers'], (('id',), (), ()))
+        self.assertEqual(advisor.extract("SELECT * FROM a, b WHERE x = 1"), {})
+        self.assertEqual(advisor.extract("SELECT id FROM users WHERE LOWER(email) = 'x'"), {})
+
+    def test_or_predicates_skipped(self) -> None:
+        """
+        Test predicates joined by OR are not combined into composite candidates, while AND-ed siblings are kept.
+        """
+        advisor = IndexAdvisor()
+        self.assertEqual(advisor.extract("SELECT id FROM t WHERE a = 1 OR b = 2"), {})
+        self.assertEqual(advisor.extract("SELECT id FROM t WHERE c = 3 AND (a = 1 OR b > 2) ORDER BY d")['t'], (('c',), ('d',), ()))
+        usage = advisor.extract("SELECT o.id FROM orders o JOIN customers c ON c.id = o.customer_id WHERE o.status = 'x' OR o.total > 5")
+        self.assertEqual(usage, {'orders': (('customer_id',), (), ()), 'customers': (('id',), (), ())})
+        self.assertEqual(advisor.extract("SELECT id FROM t WHERE a = 'x OR y' AND b = 2")['t'], (('a', 'b'), (), ()))
+
+    def test_subquery_scopes(self) -> None:
+        """
+        Test columns of subqueries resolve against tables of their own SELECT, reusing scanner parse tree.
+        """
+        sql = "SELECT total FROM orders WHERE id IN (SELECT order_id FROM items WHERE sku = 'x') AND status = 'open'"
+        scanner = SQLAntipatternScanner()
+        scanner.scan(sql)
+        usage = IndexAdvisor().extract(sql, parsed=scanner.parse(sql))
+        self.assertEqual(usage, {'orders': (('id', 'status'), (), ()), 'items': (('sku',), (), ())})
+        self.assertEqual(scanner.parse.cache_info().hits, 1)
+
+    def test_primary_key_candidates_skipped_without_catalog(self) -> None:
+        """
+        Test usages on presumed primary key id, from filters or join keys, add no candidate without catalog.
+        """
+        advisor = IndexAdvisor()
+        advisor.add("UPDATE orders SET status = 'x' WHERE id = 5")
+        advisor.add("SELECT o.total FROM orders o JOIN customers c ON c.id = o.customer_id")
+        self.assertEqual([(r.table, r.columns) for r in advisor.recommend()], [('orders', ('customer_id',))])
+
+    def test_ranked_composite_recommendations(self) -> None:
+        """
+        Test frequent statements rank first and prefix candidates fold into composite index.
+        """
+        advisor = IndexAdvisor(dialect='postgres')
+        advisor.add("SELECT id FROM orders WHERE status = 'open'", weight=50)
+        advisor.add("SELECT id FROM orders WHERE customer_id = 7 AND status = 'open' ORDER BY created_at")
+        advisor.add("SELECT id FROM users WHERE email = 'a@b.c'", weight=10)
+        recommendations = advisor.recommend()
+        self.assertEqual([(r.table, r.columns, r.roles, r.score, r.statements) for r in recommendations], [
+            ('orders', ('status', 'customer_id', 'created_at'), ('equality', 'equality', 'sort'), 51.0, 2),
+            ('users', ('email',), ('equality',), 10.0, 1),
+        ])
+        self.assertEqual(advisor.ddl(recommendations[1]), "CREATE INDEX CONCURRENTLY idx_users_email ON users (email)")
+
+    def test_catalog_skips_existing_and_small(self) -> None:
+        """
+        Test catalog resolves unqualified columns and drops covered candidates and small tables.
+        """
+        catalog = SchemaCatalog()
+        catalog.add_table('orders', ['id', 'customer_id', 'status'], row_count=100000)
+        catalog.add_table('customers', ['id', 'region'], row_count=100000)
+        catalog.add_table('flags', ['id', 'name'], row_count=10)
+        catalog.add_index('orders', ['customer_id', 'status'])
+        report = advise_indexes([
+            "SELECT region FROM orders JOIN customers ON customers.id = orders.customer_id WHERE region = 'eu'",
+            "SELECT id FROM orders WHERE customer_id = 1",
+            "SELECT id FROM flags WHERE name = 'x'",
+        ], catalog)
+        self.assertEqual([(entry['table'], entry['columns']) for entry in report], [('customers', ['id', 'region'])])
+        self.assertEqual(report[0]['ddl'], "CREATE INDEX idx_customers_id_region ON customers (id, region)")
+
+
+if __name__ == '__main__':
+    unittest.main()
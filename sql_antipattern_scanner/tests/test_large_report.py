@@ -0,0 +1,101 @@
+# sql-antipattern-scanner/tests/test_large_report.py
+from sql_antipattern_scanner.report_generator import ReportGenerator
+
+import os
+import json
+import tempfile
+import unittest
+
+
+def make_issue(index: int, severity: str) -> dict:
+    """
+    Build report issue located in one of a few files.
+    """
+    return {
+        "file": f"queries/q{index % 3}.sql",
+        "line": index + 1,
+        "name": f"Rule {severity}",
+        "severity": severity,
+        "description": "Description",
+        "suggestion": "Suggestion",
+        "offending_sql": f"SELECT * FROM t{index} WHERE note = '</script>'",
+        "context": "Context",
+        "remediation": "Remediation",
+    }
+
+
+def read_chunk(path: str) -> tuple:
+    """
+    Parse data chunk script back into chunk number and items.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    number, items = text[len('window.reportChunk('):-len(');\n')].split(', ', 1)
+    return int(number), json.loads(items)
+
+
+class TestLargeReport(unittest.TestCase):
+    """
+    Test suite for chunked HTML report of large result sets.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up report data with issues of mixed severity before each test method.
+        """
+        severities = ['Low', 'Critical', 'Medium', 'High']
+        self.report_data = {
+            "total_issues": 10,
+            "severity_score": 7,
+            "issues": [make_issue(index, severities[index % 4]) for index in range(10)],
+            "original_sql": "",
+        }
+        self.report_data["issues"][0]["estimated_cost"] = 42
+
+    def test_chunks_and_index(self) -> None:
+        """
+        Test issue bodies are split into ordered data chunks and page holds compact index only.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = ReportGenerator().write_large_html(self.report_data, directory, chunk_size=4)
+            chunks = sorted(os.listdir(os.path.join(directory, 'data')))
+            self.assertEqual(chunks, ['chunk-00000.js', 'chunk-00001.js', 'chunk-00002.js'])
+            items = [read_chunk(os.path.join(directory, 'data', name)) for name in chunks]
+            self.assertEqual([number for number, _ in items], [0, 1, 2])
+            self.assertEqual([len(chunk) for _, chunk in items], [4, 4, 2])
+
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            self.assertNotIn('</script>\'', html)
+            self.assertNotIn('cdn.jsdelivr.net', html)
+            self.assertIn('<svg class="severity-bars"', html)
+            self.assertIn('<p class="large-number">7</p>', html)
+            start = html.index('id="report-index">') + len('id="report-index">')
+            index = json.loads(html[start:html.index('</script>', start)])
+            self.assertEqual(index['total'], 10)
+            self.assertEqual(len(index['rows']), 30)
+
+            # Rows are ordered by severity, and each references rule and file by position
+            severities = [index['rules'][index['rows'][i * 3]][1] for i in range(10)]
+            self.assertEqual(severities, ['Critical'] * 3 + ['High'] * 2 + ['Medium'] * 2 + ['Low'] * 3)
+            self.assertEqual(len(index['rules']), 4)
+            self.assertEqual(sorted(index['files']), ['queries/q0.sql', 'queries/q1.sql', 'queries/q2.sql'])
+
+            # Low issue 0 comes eighth, carrying its cost as extra
+            self.assertEqual(items[1][1][3][2], {"estimated_cost": 42})
+            self.assertIsNone(items[0][1][0][2])
+
+    def test_stale_chunks_removed(self) -> None:
+        """
+        Test rewriting report into same directory drops chunks of previous, larger report.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            generator = ReportGenerator()
+            generator.write_large_html(self.report_data, directory, chunk_size=2)
+            self.report_data["issues"] = self.report_data["issues"][:3]
+            generator.write_large_html(self.report_data, directory, chunk_size=2)
+            self.assertEqual(sorted(os.listdir(os.path.join(directory, 'data'))), ['chunk-00000.js', 'chunk-00001.js'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# sql-antipattern-scanner/tests/test_literals.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.literals import collapse_literals, PLACEHOLDER
+
+import time
+import unittest
+
+
+class TestLiterals(unittest.TestCase):
+    """
+    Test suite for literal run collapsing.
+    """
+
+    def test_collapse_values_rows(self) -> None:
+        """
+        Test VALUES rows are collapsed into single placeholder.
+        """
+        rows = ", ".join(f"({i}, 'name {i}', NULL, -1.5e3)" for i in range(100))
+        sql = f"INSERT INTO users (id, name, note, score) VALUES {rows};"
+        collapsed = collapse_literals(sql, min_length=64)
+        self.assertEqual(collapsed.text, f"INSERT INTO users (id, name, note, score) VALUES {PLACEHOLDER};")
+
+    def test_collapse_in_list(self) -> None:
+        """
+        Test long IN lists are collapsed while short ones are kept.
+        """
+        long_list = ", ".join(str(i) for i in range(100))
+        sql = f"SELECT id FROM t WHERE a IN ({long_list}) AND b IN (1, 2)"
+        collapsed = collapse_literals(sql, min_length=64)
+        self.assertEqual(collapsed.text, f"SELECT id FROM t WHERE a IN {PLACEHOLDER} AND b IN (1, 2)")
+
+    def test_non_literal_rows_kept(self) -> None:
+        """
+        Test rows containing expressions end collapsed run.
+        """
+        rows = ", ".join(f"({i}, 'x')" for i in range(50))
+        sql = f"INSERT INTO t VALUES {rows}, (51, NOW())"
+        collapsed = collapse_literals(sql, min_length=64)
+        self.assertEqual(collapsed.text, f"INSERT INTO t VALUES {PLACEHOLDER}, (51, NOW())")
+
+    def test_offsets_map_to_original(self) -> None:
+        """
+        Test offsets in collapsed text map back to original SQL.
+        """
+        long_list = ", ".join(str(i) for i in range(100))
+        sql = f"SELECT id FROM t WHERE a IN ({long_list}) AND b = NULL"
+        collapsed = collapse_literals(sql, min_length=64)
+        self.assertEqual(collapsed.to_original(collapsed.text.index("b = NULL")), sql.index("b = NULL"))
+        self.assertEqual(collapsed.to_original(collapsed.text.index(PLACEHOLDER) + 1), sql.index("(0"))
+        self.assertEqual(collapsed.to_original(3), 3)
+
+    def test_scanner_uses_collapsed_statement(self) -> None:
+        """
+        Test scanner findings on bulk insert come from collapsed statement.
+        """
+        rows = ", ".join(f"({i}, 'row {i}')" for i in range(20000))
+        sql = f"INSERT INTO t (id, name) SELECT * FROM (VALUES {rows}) v WHERE v.id IN (SELECT id FROM u)"
+        issues = SQLAntipatternScanner().scan_sql(sql)
+        names = [issue[0].name for issue in issues]
+        self.assertIn("Subquery in IN clause", names)
+        self.assertTrue(all(len(issue[2]) < 1000 for issue in issues))
+
+    def test_non_literal_tail_is_linear(self) -> None:
+        """
+        Test long literal list ending in non-literal is left uncollapsed quickly.
+        """
+        values = ", ".join(str(i) for i in range(20000))
+        sql = f"SELECT id FROM t WHERE a IN ({values}, :extra) AND b IN ({values}, e)"
+        started = time.monotonic()
+        self.assertFalse(collapse_literals(sql).collapsed)
+        self.assertEqual(SQLAntipatternScanner().scan_sql("SELECT * FROM t WHERE a IN (" + ", ".join(str(i) for i in range(300)) + ", :extra)")[0][0].name, "SELECT *")
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(collapse_literals(f"SELECT 1 WHERE a IN ({values}, 1e5, -2.5E-3, 'it''s', NULL)").text,
+                         f"SELECT 1 WHERE a IN {PLACEHOLDER}")
+
+    def test_contexts_from_original_sql(self) -> None:
+        """
+        Test contexts of findings after collapsed run are cut from original SQL.
+        """
+        long_list = ", ".join(str(i) for i in range(2000))
+        sql = f"SELECT id FROM t WHERE a IN ({long_list}) ORDER BY RAND()"
+        issue = next(issue for issue in SQLAntipatternScanner().scan_sql(sql) if issue[0].name == "ORDER BY RAND()")
+        self.assertIn("1999) ORDER BY RAND()", issue[2])
+        self.assertNotIn(PLACEHOLDER, issue[2])
@@ -0,0 +1,84 @@
+# sql-antipattern-scanner/tests/test_migrations.py
+from sql_antipattern_scanner.migrations import check_migration
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.gating import Gate, GateEvaluator
+
+import sqlparse
+import unittest
+
+
+def names(sql: str, dialect=None) -> list:
+    return [antipattern.name for antipattern, _, _ in check_migration(sqlparse.parse(sql)[0], dialect)]
+
+
+class TestMigrationSafety(unittest.TestCase):
+    """
+    Test suite for DDL and bulk write safety checks.
+    """
+
+    def test_index_creation(self) -> None:
+        """
+        Test index builds are reported unless built online or in dialects that build them online.
+        """
+        self.assertEqual(names("CREATE UNIQUE INDEX idx ON users (email)"), ["Blocking Index Creation"])
+        self.assertEqual(names("CREATE INDEX CONCURRENTLY idx ON users (email)", 'postgres'), [])
+        self.assertEqual(names("CREATE INDEX idx ON users (email) WITH (ONLINE = ON)", 'tsql'), [])
+        self.assertEqual(names("CREATE INDEX idx ON users (email)", 'mysql'), [])
+        self.assertEqual(names("CREATE TABLE users (id int)"), [])
+
+    def test_alter_table_actions(self) -> None:
+        """
+        Test each action of ALTER TABLE is checked and offending action is reported with its offset.
+        """
+        sql = "ALTER TABLE public.users ADD COLUMN c int DEFAULT 0, ALTER COLUMN d TYPE bigint, ALTER COLUMN e SET NOT NULL"
+        findings = check_migration(sqlparse.parse(sql)[0], 'postgres')
+        self.assertEqual([(antipattern.name, offending_sql) for antipattern, offending_sql, _ in findings],
+                         [("Column Type Change", "ALTER COLUMN d TYPE bigint"), ("NOT NULL Addition", "ALTER COLUMN e SET NOT NULL")])
+        self.assertEqual(sql[findings[0][2]:].split(',')[0], "ALTER COLUMN d TYPE bigint")
+        self.assertEqual(names("ALTER TABLE users ADD COLUMN c int DEFAULT 0"), ["Column Default Rewrite"])
+        self.assertEqual(names("ALTER TABLE users ADD COLUMN c uuid DEFAULT gen_random_uuid()", 'postgres'), ["Column Default Rewrite"])
+        self.assertEqual(names("ALTER TABLE users ADD COLUMN c int NOT NULL", 'postgres'), ["NOT NULL Addition"])
+        self.assertEqual(names("ALTER TABLE users MODIFY COLUMN c bigint", 'mysql'), ["Column Type Change"])
+        self.assertEqual(names("ALTER TABLE users ALTER COLUMN c DROP NOT NULL", 'postgres'), [])
+
+    def test_constraint_validation(self) -> None:
+        """
+        Test constraints are reported unless validation of existing rows is deferred.
+        """
+        self.assertEqual(names("ALTER TABLE o ADD CONSTRAINT fk FOREIGN KEY (u) REFERENCES users (id)", 'postgres'),
+                         ["Blocking Constraint Validation"])
+        self.assertEqual(names("ALTER TABLE o ADD CONSTRAINT fk FOREIGN KEY (u) REFERENCES users (id) NOT VALID", 'postgres'), [])
+        self.assertEqual(names("ALTER TABLE o WITH NOCHECK ADD CONSTRAINT c CHECK (a > 0)", 'tsql'), [])
+        self.assertEqual(names("ALTER TABLE o ADD PRIMARY KEY (id)"), [])
+
+    def test_unbatched_writes(self) -> None:
+        """
+        Test UPDATE and DELETE are reported only without top-level WHERE, LIMIT or TOP.
+        """
+        self.assertEqual(names("DELETE FROM sessions"), ["Unbatched Write"])
+        self.assertEqual(names("WITH old AS (SELECT 1) UPDATE t SET a = (SELECT b FROM u WHERE u.id = 1)"), ["Unbatched Write"])
+        self.assertEqual(names("DELETE FROM sessions WHERE expires < now()"), [])
+        self.assertEqual(names("DELETE FROM sessions LIMIT 1000", 'mysql'), [])
+        self.assertEqual(names("WITH old (id) AS (SELECT 1), n AS MATERIALIZED (SELECT 2) DELETE FROM t", 'postgres'), ["Unbatched Write"])
+
+    def test_privileges_are_not_writes(self) -> None:
+        """
+        Test GRANT and REVOKE naming UPDATE or DELETE privileges are not reported as writes.
+        """
+        self.assertEqual(names("GRANT UPDATE, DELETE ON orders TO app_user"), [])
+        self.assertEqual(names("REVOKE DELETE ON orders FROM app_user"), [])
+
+    def test_scanner_and_gate(self) -> None:
+        """
+        Test scanner reports migration findings with context, honoring suppression, and gate fails on them.
+        """
+        scanner = SQLAntipatternScanner(dialect='postgres')
+        self.assertEqual([(issue[0].name, issue[1]) for issue in scanner.scan_sql("DELETE FROM sessions")],
+                         [("Unbatched Write", "DELETE FROM sessions")])
+        self.assertEqual(scanner.scan_sql("-- antipattern: ignore[unbatched write]\nDELETE FROM sessions"), [])
+        breach = GateEvaluator(scanner, Gate(fail_on="High")).check_file("m.sql", "SELECT id FROM a;\nCREATE INDEX idx ON o (u);\n")
+        self.assertEqual((breach.line, breach.antipattern.name), (2, "Blocking Index Creation"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# sql-antipattern-scanner/tests/test_plan_verification.py
+from sql_antipattern_scanner.plan_verification import PlanVerifier, PlanEvidence, rank_issues
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.cli import generate_report_data
+from sql_antipattern_scanner.report_generator import ReportGenerator
+
+import os
+import tempfile
+import unittest
+
+DDL = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, name TEXT);
+CREATE INDEX CONCURRENTLY idx_users_email ON users USING btree (email);
+CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, total NUMERIC);
+"""
+
+
+class TestPlanVerification(unittest.TestCase):
+    """
+    Test suite for query plan verification.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up verifier and scanner before each test method.
+        """
+        self.verifier = PlanVerifier(DDL)
+        self.scanner = SQLAntipatternScanner()
+
+    def tearDown(self) -> None:
+        """
+        Close verifier after each test method.
+        """
+        self.verifier.close()
+
+    def test_ddl_from_other_dialect_is_loaded(self) -> None:
+        """
+        Test CONCURRENTLY and USING clauses are dropped so index is created.
+        """
+        self.assertEqual(self.verifier.skipped_ddl, [])
+        self.assertEqual(self.verifier.evidence("SELECT id FROM users WHERE email = 'a'").verdict, 'index')
+
+    def test_full_scan_confirmed_and_cached(self) -> None:
+        """
+        Test function on indexed column is confirmed as full scan and plan is cached per shape.
+        """
+        sql = "SELECT id FROM users WHERE LOWER(email) = 'a'"
+        issues = self.scanner.scan_sql(sql)
+        evidence = self.verifier.verify(sql, issues)
+        self.assertEqual(evidence[0].verdict, 'full_scan')
+        self.verifier.verify("select id from users where lower(email) = 'b'", issues)
+        self.assertEqual(len(self.verifier.plans), 1)
+
+    def test_like_patterns_cached_by_shape(self) -> None:
+        """
+        Test prefix and leading-wildcard LIKE patterns get own plans while same shapes share one.
+        """
+        verifier = PlanVerifier("CREATE TABLE tags (name TEXT COLLATE NOCASE); CREATE INDEX idx_tags_name ON tags (name);")
+        self.assertEqual(verifier.evidence("SELECT name FROM tags WHERE name LIKE 'a%'").verdict, 'index')
+        self.assertEqual(verifier.evidence("SELECT name FROM tags WHERE name LIKE '%a'").verdict, 'full_scan')
+        self.assertEqual(verifier.evidence("SELECT name FROM tags WHERE name LIKE 'b%'").verdict, 'index')
+        self.assertEqual(len(verifier.plans), 2)
+        verifier.close()
+
+    def test_file_access_rejected(self) -> None:
+        """
+        Test ATTACH, PRAGMA and VACUUM INTO in DDL are skipped without touching files.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            attached, vacuumed = os.path.join(tmp, "attached.db"), os.path.join(tmp, "vacuumed.db")
+            statements = [f"ATTACH DATABASE '{attached}' AS other", "PRAGMA writable_schema = ON", f"VACUUM INTO '{vacuumed}'"]
+            verifier = PlanVerifier(";\n".join(statements) + ";\nCREATE TABLE t (id INTEGER);")
+            self.assertEqual(verifier.skipped_ddl, [statement + ";" for statement in statements])
+            self.assertEqual(os.listdir(tmp), [])
+            self.assertEqual(verifier.evidence("SELECT id FROM t").verdict, 'full_scan')
+            verifier.close()
+
+    def test_multiple_statements_and_unverifiable(self) -> None:
+        """
+        Test issues are verified against their own statement and unparseable statements stay unverified.
+        """
+        statements = ["SELECT * FROM orders", "SELECT id FROM users WHERE email = 'a' OR name LIKE '%a'",
+                      "SELECT x FROM missing WHERE UPPER(x) = 'A'"]
+        issues = [issue for statement in statements for issue in self.scanner.scan_sql(statement)]
+        evidence = self.verifier.verify_batch([(';\n'.join(statements), issues)])[0]
+        verdicts = {antipattern.name: item.verdict if item else None for (antipattern, _, _), item in zip(issues, evidence)}
+        self.assertIsNone(verdicts["SELECT *"])
+        self.assertEqual(verdicts["Leading Wildcard"], 'full_scan')
+        self.assertEqual(verdicts["Function in WHERE"], 'unverified')
+
+    def test_ranking_and_report(self) -> None:
+        """
+        Test confirmed full scans outrank higher-severity unverified findings in reports.
+        """
+        issues = self.scanner.scan_sql("SELECT * FROM users WHERE UPPER(name) = 'A'")
+        issues = [(issues[0][0]._replace(severity='High'),) + issues[0][1:]] + issues[1:]
+        evidence = [None, PlanEvidence('full_scan', ['SCAN users'])]
+        ranked = rank_issues(issues, evidence)
+        self.assertEqual(ranked[0][1].verdict, 'full_scan')
+        report_data = generate_report_data(self.scanner, issues, "SELECT 1", plan_evidence=evidence)
+        self.assertEqual(report_data["issues"][1]["plan_evidence"], {"verdict": "full_scan", "plan": ["SCAN users"]})
+        self.assertIn("Plan Verdict", ReportGenerator().generate_csv(report_data).splitlines()[0])
+        html = ReportGenerator().generate_html(report_data)
+        self.assertLess(html.index("Query Plan (full scan)"), html.index('<span class="issue-name">SELECT *'))
+
+
+if __name__ == '__main__':
+    unittest.main()
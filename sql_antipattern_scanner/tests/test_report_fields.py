@@ -0,0 +1,93 @@
+# sql-antipattern-scanner/tests/test_report_fields.py
+from sql_antipattern_scanner.cli import generate_report_data, generate_findings_report_data, main
+from sql_antipattern_scanner.compiled_scanner import ScannerBuilder
+from sql_antipattern_scanner.report_generator import ReportGenerator, MINIMAL_FIELDS, parse_fields
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import locate_findings
+
+import io
+import json
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+SQL = "SELECT *\nFROM a\nWHERE x = NULL;\n"
+
+
+class TestReportFields(unittest.TestCase):
+    """
+    Test suite for report field projection and minimal machine output.
+    """
+
+    def test_parse_fields(self) -> None:
+        """
+        Test field lists keep given order without duplicates, and unknown fields are rejected.
+        """
+        self.assertEqual(parse_fields("name, severity,line,name"), ("name", "severity", "line"))
+        with self.assertRaises(ValueError):
+            parse_fields("name,cost")
+        with self.assertRaises(ValueError):
+            parse_fields(" , ")
+
+    def test_unrequested_fields_not_computed(self) -> None:
+        """
+        Test projected report holds only requested fields, located issues, and never reindents original SQL.
+        """
+        scanner = SQLAntipatternScanner()
+        issues = scanner.scan_sql(SQL)
+        with mock.patch('sql_antipattern_scanner.cli.sqlparse.format') as reindent:
+            report_data = generate_report_data(scanner, issues, SQL, fields=("name", "severity", "line"), file="q.sql")
+            reindent.assert_not_called()
+        self.assertNotIn("original_sql", report_data)
+        self.assertEqual(report_data["issues"], [
+            {"name": "SELECT *", "severity": "Medium", "line": 1},
+            {"name": "NULL Comparison", "severity": "Critical", "line": 3},
+        ])
+        self.assertEqual(report_data["severity_score"], 6)
+        self.assertIn("original_sql", generate_report_data(scanner, issues, SQL))
+        report = json.loads(scanner.generate_report(issues, SQL, fields=("line", "name")))
+        self.assertEqual([issue["line"] for issue in report["issues"]], [1, 3])
+        self.assertNotIn("fields", report)
+        self.assertNotIn("fields", report_data)
+        self.assertEqual(scanner.generate_report(issues, SQL, "csv", fields=("line", "name")).splitlines(),
+                         ["Line,Name", "1,SELECT *", "3,NULL Comparison"])
+
+    def test_scanner_without_context(self) -> None:
+        """
+        Test scanner built without context reports same issues with empty contexts.
+        """
+        with_context = ScannerBuilder().build().scan_sql(SQL)
+        without_context = ScannerBuilder().include_context(False).build().scan_sql(SQL)
+        self.assertEqual([issue[:2] for issue in without_context], [issue[:2] for issue in with_context])
+        self.assertTrue(all(issue[2] for issue in with_context))
+        self.assertFalse(any(issue[2] for issue in without_context))
+        self.assertFalse(SQLAntipatternScanner(include_context=False).scan_sql(SQL)[0][2])
+
+    def test_minimal_and_csv_output(self) -> None:
+        """
+        Test minimal output is one compact JSON object per finding, and CSV has requested columns only.
+        """
+        scanner = SQLAntipatternScanner()
+        findings = locate_findings(scanner.scan_sql(SQL), SQL, "q.sql")
+        report_data = generate_findings_report_data(scanner, findings, fields=MINIMAL_FIELDS)
+        lines = ReportGenerator().generate_minimal(report_data).splitlines()
+        self.assertEqual(lines[0], '{"file":"q.sql","line":1,"name":"SELECT *","severity":"Medium"}')
+        self.assertEqual(len(lines), 2)
+        report_data = generate_findings_report_data(scanner, findings, fields=("name", "line"))
+        self.assertEqual(ReportGenerator().generate_csv(report_data, ("name", "line")).splitlines(),
+                         ["Name,Line", "SELECT *,1", "NULL Comparison,3"])
+
+    def test_status_messages_on_stderr(self) -> None:
+        """
+        Test command line writes only minimal report to stdout and status messages to stderr.
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch('sys.argv', ['sql-antipattern-scanner', '--query', SQL, '--format', 'minimal']):
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                main()
+        self.assertEqual([json.loads(line)["name"] for line in stdout.getvalue().splitlines()], ["SELECT *", "NULL Comparison"])
+        self.assertIn("Scanning SQL query", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
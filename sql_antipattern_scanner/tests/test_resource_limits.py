@@ -0,0 +1,85 @@
+# sql-antipattern-scanner/tests/test_resource_limits.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import json
+import unittest
+
+
+class TestResourceLimits(unittest.TestCase):
+    """
+    Test suite for scanner resource guards.
+    """
+
+    def test_within_limits_is_complete(self) -> None:
+        """
+        Test statement within limits is scanned in full.
+        """
+        scanner = SQLAntipatternScanner(max_bytes=1000, max_tokens=100, max_depth=5, timeout=10)
+        result = scanner.scan("SELECT * FROM users WHERE status = NULL")
+        self.assertEqual(result.partial_reasons, [])
+        self.assertEqual([issue[0].name for issue in result.issues], ["SELECT *", "NULL Comparison"])
+
+    def test_max_bytes_truncates_to_regex_scan(self) -> None:
+        """
+        Test oversized statement degrades to truncated regex-only scan.
+        """
+        scanner = SQLAntipatternScanner(max_bytes=40)
+        sql = "SELECT * FROM users WHERE name LIKE '%a%' AND id IN (" + ", ".join(str(i) for i in range(1000)) + ")"
+        result = scanner.scan(sql)
+        self.assertEqual(result.partial_reasons, ["max_bytes"])
+        names = [issue[0].name for issue in result.issues]
+        self.assertIn("SELECT *", names)
+        self.assertNotIn("Both-sided Wildcard", names)
+
+    def test_max_tokens_and_depth_skip_parsing(self) -> None:
+        """
+        Test token and nesting limits skip parsing but keep regex checks.
+        """
+        many_tokens = SQLAntipatternScanner(max_tokens=10).scan("SELECT * FROM t WHERE a IN (1, 2, 3, 4, 5)")
+        self.assertEqual(many_tokens.partial_reasons, ["max_tokens"])
+        self.assertEqual(many_tokens.issues[0][0].name, "SELECT *")
+
+        nested = "SELECT id FROM t WHERE a = " + "(" * 500 + "1" + ")" * 500
+        deep = SQLAntipatternScanner(max_depth=50).scan(nested)
+        self.assertEqual(deep.partial_reasons, ["max_depth"])
+
+    def test_token_and_depth_limits_truncate_fallback(self) -> None:
+        """
+        Test regex fallback only sees part of statement within token and nesting limits.
+        """
+        sql = "SELECT id FROM t WHERE a IN (1, 2, 3, 4, 5) ORDER BY RAND()"
+        many_tokens = SQLAntipatternScanner(max_tokens=10).scan(sql)
+        self.assertEqual(many_tokens.partial_reasons, ["max_tokens"])
+        self.assertEqual(many_tokens.issues, [])
+        deep = SQLAntipatternScanner(max_depth=0).scan(sql)
+        self.assertEqual(deep.partial_reasons, ["max_depth"])
+        self.assertEqual(deep.issues, [])
+        self.assertEqual([issue[0].name for issue in SQLAntipatternScanner(max_tokens=100).scan(sql).issues], ["ORDER BY RAND()"])
+
+    def test_deep_nesting_without_limits(self) -> None:
+        """
+        Test deeply nested SQL that parser rejects degrades to regex checks instead of crashing scanner.
+        """
+        nested = "SELECT * FROM t WHERE a = " + "(" * 500 + "1" + ")" * 500
+        result = SQLAntipatternScanner().scan(nested)
+        self.assertEqual(result.partial_reasons, ["parse_error"])
+        self.assertEqual([issue[0].name for issue in result.issues], ["SELECT *"])
+
+    def test_timeout_flags_partial(self) -> None:
+        """
+        Test exhausted time budget stops evaluation and flags scan as partial.
+        """
+        result = SQLAntipatternScanner(timeout=0).scan("SELECT * FROM users")
+        self.assertEqual(result.partial_reasons, ["timeout"])
+
+    def test_partial_flag_in_report(self) -> None:
+        """
+        Test partial scans are flagged in report.
+        """
+        scanner = SQLAntipatternScanner(max_tokens=2)
+        sql = "SELECT * FROM users"
+        result = scanner.scan(sql)
+        report = json.loads(scanner.generate_report(result.issues, sql, partial_reasons=result.partial_reasons))
+        self.assertTrue(report["partial"])
+        self.assertEqual(report["partial_reasons"], ["max_tokens"])
+        self.assertIn("Partial scan", scanner.generate_report(result.issues, sql, "html", result.partial_reasons))
@@ -0,0 +1,119 @@
+# sql-antipattern-scanner/tests/test_rewrites.py
+from sql_antipattern_scanner.rewrites import RewriteEngine, Edit, apply_edits
+
+import unittest
+
+
+class TestRewrites(unittest.TestCase):
+    """
+    Test suite for rewrite engine.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up rewrite engine before each test method.
+        """
+        self.engine = RewriteEngine()
+
+    def rewrite(self, sql: str) -> str:
+        """
+        Rewrite SQL with all rules.
+        """
+        return self.engine.rewrite(sql).text
+
+    def test_null_comparison(self) -> None:
+        """
+        Test NULL comparisons are rewritten but SET assignments are kept.
+        """
+        self.assertEqual(self.rewrite("SELECT a FROM t WHERE b = NULL AND c <> NULL"),
+                         "SELECT a FROM t WHERE b IS NULL AND c IS NOT NULL")
+        self.assertEqual(self.rewrite("UPDATE t SET b = NULL WHERE a = 1"), "UPDATE t SET b = NULL WHERE a = 1")
+        for sql in ["INSERT INTO t (a, b) VALUES (1, 2) ON DUPLICATE KEY UPDATE b = NULL",
+                    "MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN UPDATE SET b = NULL, c = NULL"]:
+            self.assertEqual(self.rewrite(sql), sql)
+
+    def test_between(self) -> None:
+        """
+        Test BETWEEN and NOT BETWEEN become range predicates.
+        """
+        self.assertEqual(self.rewrite("SELECT a FROM t WHERE t.d BETWEEN 1 AND 2 AND e NOT BETWEEN 'a' AND :hi"),
+                         "SELECT a FROM t WHERE t.d >= 1 AND t.d <= 2 AND (e < 'a' OR e > :hi)")
+        self.assertEqual(self.rewrite("SELECT a FROM t JOIN u ON u.d BETWEEN t.lo AND t.hi"),
+                         "SELECT a FROM t JOIN u ON u.d >= t.lo AND u.d <= t.hi")
+
+    def test_between_in_larger_expression_kept(self) -> None:
+        """
+        Test BETWEEN whose operands are part of larger expression is not rewritten.
+        """
+        for sql in ["SELECT a FROM t WHERE a + b BETWEEN 1 AND 10",
+                    "SELECT a FROM t WHERE a BETWEEN 1 AND 10 * 2",
+                    "SELECT a FROM t WHERE -a BETWEEN 1 AND 10"]:
+            self.assertEqual(self.rewrite(sql), sql)
+
+    def test_numeric_group_by(self) -> None:
+        """
+        Test GROUP BY positions are replaced with select expressions without aliases.
+        """
+        self.assertEqual(self.rewrite("SELECT u.dept d, u.x + 1, COUNT(*) AS n FROM emp u GROUP BY 1, 2"),
+                         "SELECT u.dept d, u.x + 1, COUNT(*) AS n FROM emp u GROUP BY u.dept, u.x + 1")
+
+    def test_comma_join(self) -> None:
+        """
+        Test comma joins become JOIN ... ON with join predicates moved out of WHERE.
+        """
+        self.assertEqual(
+            self.rewrite("SELECT * FROM users u, orders o, items i WHERE u.id = o.user_id AND o.id = i.order_id AND u.active = 1"),
+            "SELECT * FROM users u JOIN orders o ON u.id = o.user_id JOIN items i ON o.id = i.order_id WHERE u.active = 1")
+        self.assertEqual(self.rewrite("SELECT * FROM a, b"), "SELECT * FROM a CROSS JOIN b")
+        self.assertEqual(self.rewrite("SELECT * FROM a, b WHERE a.x = b.x OR a.y = 1"), "SELECT * FROM a, b WHERE a.x = b.x OR a.y = 1")
+
+    def test_in_subquery(self) -> None:
+        """
+        Test IN subqueries become correlated EXISTS, and NOT IN is kept.
+        """
+        self.assertEqual(
+            self.rewrite("SELECT * FROM users WHERE id IN (SELECT user_id FROM orders WHERE total > 5 OR x = 1)"),
+            "SELECT * FROM users WHERE EXISTS (SELECT 1 FROM orders WHERE (total > 5 OR x = 1) AND orders.user_id = users.id)")
+        sql = "SELECT * FROM users WHERE id NOT IN (SELECT user_id FROM orders)"
+        self.assertEqual(self.rewrite(sql), sql)
+        self.assertEqual(self.rewrite("SELECT * FROM users u WHERE a = 1 AND (b = 2 OR u.id IN (SELECT user_id FROM orders))"),
+                         "SELECT * FROM users u WHERE a = 1 AND (b = 2 OR EXISTS (SELECT 1 FROM orders WHERE orders.user_id = u.id))")
+
+    def test_in_subquery_outside_filter_kept(self) -> None:
+        """
+        Test IN subqueries under NOT or outside WHERE and ON conditions are not rewritten.
+        """
+        for sql in ["SELECT * FROM users WHERE NOT (id IN (SELECT user_id FROM orders))",
+                    "SELECT * FROM users WHERE NOT id IN (SELECT user_id FROM orders)",
+                    "SELECT * FROM users u WHERE NOT (a = 1 OR u.id IN (SELECT user_id FROM orders))",
+                    "SELECT id, id IN (SELECT user_id FROM orders) AS buyer FROM users",
+                    "SELECT * FROM users WHERE (id IN (SELECT user_id FROM orders)) = FALSE",
+                    "SELECT * FROM users WHERE COALESCE(id IN (SELECT user_id FROM orders), TRUE)"]:
+            self.assertEqual(self.rewrite(sql), sql)
+
+    def test_nested_edits_and_comments_are_kept(self) -> None:
+        """
+        Test edits nested in larger rewrite are applied in later pass and comments survive.
+        """
+        sql = "SELECT * FROM a, b -- pair\nWHERE a.id = b.a_id AND b.x BETWEEN 1 AND 2;\n/* next */ SELECT 1 FROM t WHERE c = NULL"
+        result = self.engine.rewrite(sql)
+        self.assertEqual(result.text, "SELECT * FROM a JOIN b ON a.id = b.a_id WHERE b.x >= 1 AND b.x <= 2;\n"
+                                      "/* next */ SELECT 1 FROM t WHERE c IS NULL")
+        self.assertEqual(sorted(edit.rule for edit in result.edits), ["ANSI-89 Join", "BETWEEN Operator", "NULL Comparison"])
+
+    def test_apply_edits_and_patch(self) -> None:
+        """
+        Test overlapping edits are skipped and patch is unified diff.
+        """
+        text, applied = apply_edits("abcdef", [Edit(1, 3, "X", "r"), Edit(2, 4, "Y", "r"), Edit(4, 5, "Z", "r")])
+        self.assertEqual(text, "aXdZf")
+        self.assertEqual(len(applied), 2)
+        patch = self.engine.patch("SELECT a\nFROM t\nWHERE b = NULL\n", "q.sql")
+        self.assertIn("+WHERE b IS NULL", patch)
+        self.assertIn("--- a/q.sql", patch)
+        with self.assertRaises(ValueError):
+            RewriteEngine(["SELECT *"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# sql-antipattern-scanner/tests/test_rule_packs.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.rule_packs import RulePack, load_rule_pack, clause_spans, clause_at, rule_triggers
+
+import os
+import tempfile
+import unittest
+
+RULE_PACK_YAML = """
+name: house-rules
+rules:
+  - name: NOLOCK Hint
+    description: NOLOCK reads uncommitted data.
+    severity: High
+    suggestion: Use snapshot isolation instead.
+    remediation: Remove WITH (NOLOCK)
+    keywords: [NOLOCK]
+  - name: Random Sort
+    description: Sorting by RANDOM() scans and sorts every row.
+    severity: High
+    suggestion: Sample rows with TABLESAMPLE or a random key.
+    remediation: Use TABLESAMPLE
+    sequence: [ORDER, BY, RANDOM, "(", ")"]
+  - name: OR in WHERE
+    description: OR across columns defeats single-column indexes.
+    severity: Low
+    suggestion: Consider UNION ALL.
+    remediation: Split into UNION ALL branches
+    keywords: [OR]
+    clause: WHERE
+"""
+
+
+class TestRulePacks(unittest.TestCase):
+    """
+    Test suite for declarative rule packs.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up compiled rule pack before each test method.
+        """
+        self.rule_pack = RulePack.from_text(RULE_PACK_YAML).compile()
+
+    def test_keyword_trigger(self) -> None:
+        """
+        Test keyword-triggered rule.
+        """
+        matches = self.rule_pack.match("SELECT id FROM users WITH (nolock)")
+        self.assertEqual([m[0].name for m in matches], ["NOLOCK Hint"])
+
+    def test_token_sequence(self) -> None:
+        """
+        Test token-sequence rule tolerates whitespace and case differences.
+        """
+        matches = self.rule_pack.match("SELECT id FROM users order  by random ( )")
+        self.assertEqual([m[0].name for m in matches], ["Random Sort"])
+        self.assertEqual(self.rule_pack.match("SELECT random() FROM users ORDER BY id"), [])
+
+    def test_clause_scoping(self) -> None:
+        """
+        Test clause-scoped rule only fires inside its clause.
+        """
+        in_where = self.rule_pack.match("SELECT id FROM users WHERE a = 1 OR b = 2")
+        in_select = self.rule_pack.match("SELECT a OR b FROM users WHERE (a = 1)")
+        self.assertEqual([m[0].name for m in in_where], ["OR in WHERE"])
+        self.assertEqual(in_select, [])
+
+    def test_clause_spans_restore_after_parenthesis(self) -> None:
+        """
+        Test enclosing clause is restored after subquery.
+        """
+        sql = "SELECT a FROM t WHERE x IN (SELECT y FROM u) OR z = 1"
+        spans = clause_spans(sql)
+        self.assertEqual(clause_at(spans, sql.index("OR")), "WHERE")
+        self.assertEqual(clause_at(spans, sql.index("y FROM")), "SELECT")
+
+    def test_candidates_skip_untriggered_rules(self) -> None:
+        """
+        Test rules without trigger words in SQL are never evaluated.
+        """
+        self.assertEqual(self.rule_pack.candidates("SELECT id FROM users"), [])
+
+    def test_punctuated_keywords(self) -> None:
+        """
+        Test keywords starting with, ending with or containing punctuation trigger and match.
+        """
+        metadata = {"description": "", "severity": "Low", "suggestion": "", "remediation": ""}
+        rule_pack = RulePack.from_dict({"rules": [
+            dict(metadata, name="Rand", keywords=["RAND()"]),
+            dict(metadata, name="Identity", keywords=["@@IDENTITY"]),
+            dict(metadata, name="Nolock", keywords=["WITH (NOLOCK)"]),
+        ]}).compile()
+        self.assertEqual([rule_triggers(rule) for rule in rule_pack.rules], [("RAND",), ("IDENTITY",), ("WITH",)])
+        matches = rule_pack.match("SELECT @@identity, RAND() FROM t WITH (NOLOCK)")
+        self.assertEqual(sorted(m[0].name for m in matches), ["Identity", "Nolock", "Rand"])
+        self.assertEqual(rule_pack.match("SELECT RANDOM() FROM t WITH (INDEX(i))"), [])
+
+    def test_regex_rules_indexed(self) -> None:
+        """
+        Test regex rules trigger on whole word they require, and unindexable regex rules need keywords.
+        """
+        metadata = {"description": "", "severity": "Low", "suggestion": "", "remediation": ""}
+        rule_pack = RulePack.from_dict({"rules": [
+            dict(metadata, name="Top", regex=r"\bTOP\s+\d+"),
+            dict(metadata, name="Exec", regex=r"\bEXEC\s*\(\s*@\w+"),
+            dict(metadata, name="Hints", regex=r"\b(?:NOLOCK|READPAST)\b", keywords=["NOLOCK", "READPAST"]),
+        ]}).compile()
+        self.assertEqual(rule_pack.trigger_index, {"TOP": [0], "EXEC": [1], "NOLOCK": [2], "READPAST": [2]})
+        self.assertEqual(rule_pack.candidates("SELECT id FROM t"), [])
+        self.assertEqual([m[0].name for m in rule_pack.match("SELECT TOP 5 id FROM t (READPAST)")], ["Top", "Hints"])
+        with self.assertRaises(ValueError):
+            RulePack.from_dict({"rules": [dict(metadata, name="x", regex=r"\b(?:NOLOCK|READPAST)\b")]})
+
+    def test_invalid_rule(self) -> None:
+        """
+        Test malformed rule is rejected.
+        """
+        with self.assertRaises(ValueError):
+            RulePack.from_dict({"rules": [{"name": "x", "description": "", "severity": "Severe",
+                                           "suggestion": "", "remediation": "", "keywords": ["X"]}]})
+
+    def test_load_rule_pack_cache(self) -> None:
+        """
+        Test rule data is cached as JSON and reloaded from cache, and corrupt cache entries are ignored.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pack.yaml")
+            with open(path, "w") as f:
+                f.write(RULE_PACK_YAML)
+            cache_dir = os.path.join(tmp, "cache")
+            first = load_rule_pack(path, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            self.assertTrue(cache_path.endswith(".json"))
+            second = load_rule_pack(path, cache_dir=cache_dir)
+            self.assertEqual(first.rules, second.rules)
+            with open(cache_path, "w") as f:
+                f.write('{"rules": [{"name": "x"}]}')
+            self.assertEqual(load_rule_pack(path, cache_dir=cache_dir).rules, first.rules)
+
+    def test_scanner_integration(self) -> None:
+        """
+        Test scanner reports rule pack findings alongside built-in ones.
+        """
+        scanner = SQLAntipatternScanner()
+        scanner.add_rule_pack(self.rule_pack)
+        issues = scanner.scan_sql("SELECT * FROM users WITH (NOLOCK)")
+        names = [issue[0].name for issue in issues]
+        self.assertIn("SELECT *", names)
+        self.assertIn("NOLOCK Hint", names)
@@ -0,0 +1,104 @@
+# sql-antipattern-scanner/tests/test_schema_catalog.py
+from sql_antipattern_scanner.schema_catalog import SchemaCatalog
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+DDL = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255) NOT NULL, name TEXT, CONSTRAINT uq_email UNIQUE (email));
+CREATE TABLE orders (id INT, user_id INT, total NUMERIC(10, 2), status TEXT, PRIMARY KEY (id),
+    FOREIGN KEY (user_id) REFERENCES users (id));
+CREATE INDEX CONCURRENTLY idx_orders_status ON public.orders USING btree (status DESC, id);
+"""
+
+
+class TestSchemaCatalog(unittest.TestCase):
+    """
+    Test suite for schema catalog and schema-aware checks.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up catalog and scanner before each test method.
+        """
+        self.catalog = SchemaCatalog.from_ddl(DDL)
+        self.scanner = SQLAntipatternScanner(schema_catalog=self.catalog)
+
+    def issues(self, sql: str) -> dict:
+        """
+        Scan SQL and index issues by name.
+        """
+        return {antipattern.name: (antipattern, offending_sql) for antipattern, offending_sql, _ in self.scanner.scan_sql(sql)}
+
+    def test_ddl_catalog(self) -> None:
+        """
+        Test columns, primary keys, unique constraints and CREATE INDEX are indexed.
+        """
+        self.assertEqual(self.catalog.table('"public"."users"').columns, ('id', 'email', 'name'))
+        self.assertTrue(self.catalog.is_indexed('users', 'email'))
+        self.assertTrue(self.catalog.is_indexed('orders', 'status'))
+        self.assertFalse(self.catalog.is_indexed('orders', 'user_id'))
+        self.assertEqual(self.catalog.tables_with_column('id'), {'users', 'orders'})
+
+    def test_sqlite_and_json_catalogs(self) -> None:
+        """
+        Test catalog built from SQLite database and JSON dump.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'schema.db')
+            connection = sqlite3.connect(path)
+            connection.executescript("CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT, c TEXT); CREATE INDEX t_c ON t (c, b);"
+                                     "INSERT INTO t (b, c) VALUES ('x', 'y'); ANALYZE;")
+            connection.close()
+            catalog = SchemaCatalog.load(path)
+        self.assertEqual(catalog.table('t').columns, ('a', 'b', 'c'))
+        self.assertEqual(catalog.table('t').row_count, 1)
+        self.assertTrue(catalog.is_indexed('t', 'c'))
+        self.assertFalse(catalog.is_indexed('t', 'b'))
+
+        catalog = SchemaCatalog.from_dict({"tables": {"t": {"columns": ["a", "b"], "indexes": ["a"], "row_count": 10}}})
+        self.assertTrue(catalog.is_indexed('t', 'a'))
+        with self.assertRaises(ValueError):
+            SchemaCatalog.from_dict({"t": {}})
+
+    def test_function_on_indexed_column_and_unindexed_join(self) -> None:
+        """
+        Test function on indexed column is explained and missing join index is reported.
+        """
+        issues = self.issues("SELECT o.id FROM users u JOIN orders o ON o.user_id = u.id WHERE LOWER(u.email) = 'a'")
+        self.assertIn("users.email", issues["Function in WHERE"][0].description)
+        self.assertEqual(issues["Function in WHERE"][0].severity, "Medium")
+        self.assertIn("orders.user_id", issues["Unindexed Join Column"][0].description)
+
+    def test_unindexed_filter_and_wildcards(self) -> None:
+        """
+        Test unindexed filter is reported and wildcards are graded by index coverage.
+        """
+        issues = self.issues("SELECT id FROM users WHERE name LIKE '%bob%'")
+        self.assertEqual(issues["Both-sided Wildcard"][0].severity, "Low")
+        self.assertEqual(issues["Unindexed Filter Column"][1], "name")
+        issues = self.issues("SELECT id FROM users WHERE email LIKE 'bob%'")
+        self.assertEqual(issues["Trailing Wildcard"][0].severity, "Low")
+        self.assertNotIn("Unindexed Filter Column", issues)
+
+    def test_small_tables_and_wide_select_star(self) -> None:
+        """
+        Test small tables are not reported and SELECT * on wide tables is escalated.
+        """
+        catalog = SchemaCatalog.from_dict({"tables": {
+            "tiny": {"columns": ["a"], "row_count": 5},
+            "wide": {"columns": [f"c{i}" for i in range(30)]},
+        }})
+        scanner = SQLAntipatternScanner(schema_catalog=catalog)
+        names = [antipattern.name for antipattern, _, _ in scanner.scan_sql("SELECT a FROM tiny WHERE a = 1")]
+        self.assertNotIn("Unindexed Filter Column", names)
+        select_star = scanner.scan_sql("SELECT * FROM wide")[0][0]
+        self.assertEqual(select_star.severity, "High")
+        self.assertIn("30 columns", select_star.description)
+
+
+if __name__ == '__main__':
+    unittest.main()
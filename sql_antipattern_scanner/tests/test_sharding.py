@@ -0,0 +1,131 @@
+# sql-antipattern-scanner/tests/test_sharding.py
+from sql_antipattern_scanner.sharding import ShardManifest, scan_shard, save_partial, load_partial, merge_partials, split_units
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+STATEMENTS = [
+    "SELECT id FROM a;\n",
+    "SELECT * FROM b;\n",
+    "SELECT id\nFROM c\nWHERE x = NULL;\n",
+    "SELECT id FROM d ORDER BY RAND();\n",
+]
+
+
+def scan_to_file(manifest_path: str, index: int, output: str) -> str:
+    """
+    Scan one shard in worker process, as scan-shard does on separate node.
+    """
+    save_partial(scan_shard(SQLAntipatternScanner(), ShardManifest.load(manifest_path), index), output)
+    return output
+
+
+class TestSharding(unittest.TestCase):
+    """
+    Test suite for sharded scans with mergeable partial results.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        for i in range(6):
+            os.makedirs(os.path.join(self.root, f"dir{i % 2}"), exist_ok=True)
+            with open(os.path.join(self.root, f"dir{i % 2}", f"q{i}.sql"), 'w') as f:
+                f.write(''.join(STATEMENTS * (i + 1)))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def findings(self, manifest: ShardManifest):
+        """
+        Scan all shards of manifest in this process and merge them.
+        """
+        scanner = SQLAntipatternScanner()
+        return merge_partials([scan_shard(scanner, manifest, i) for i in range(len(manifest.shards))])
+
+    def test_manifest_is_deterministic_and_balanced(self) -> None:
+        """
+        Test same inputs give same manifest, and shards are balanced by bytes.
+        """
+        first = ShardManifest.build([self.root], 3, self.root)
+        second = ShardManifest.build([os.path.join(self.root, "dir1"), self.root], 3, self.root)
+        self.assertEqual(first.digest, second.digest)
+        loads = [sum(unit.length for unit in shard) for shard in first.shards]
+        self.assertLessEqual(max(loads) - min(loads), max(unit.length for shard in first.shards for unit in shard))
+        path = os.path.join(self.root, "manifest.json")
+        first.save(path)
+        self.assertEqual(ShardManifest.load(path).digest, first.digest)
+        with self.assertRaises(ValueError):
+            ShardManifest.build([self.root], 0, self.root)
+
+    def test_large_files_split_between_statements(self) -> None:
+        """
+        Test large file is cut only at statement starts, and findings keep their file lines.
+        """
+        data = ''.join(STATEMENTS * 10).encode('utf-8')
+        units = split_units("q.sql", data, 100)
+        self.assertGreater(len(units), 1)
+        self.assertEqual(sum(unit.length for unit in units), len(data))
+        for unit in units:
+            self.assertTrue(data[unit.offset:unit.offset + unit.length].startswith(b"SELECT"))
+            self.assertEqual(unit.line, data[:unit.offset].count(b'\n') + 1)
+        whole = self.findings(ShardManifest.build([self.root], 1, self.root))
+        split = self.findings(ShardManifest.build([self.root], 4, self.root, max_unit_bytes=100))
+        self.assertEqual(split.findings, whole.findings)
+        self.assertEqual((split.severity_score, split.statements), (whole.severity_score, whole.statements))
+        self.assertEqual([(finding.line, finding.antipattern.name) for finding in whole.findings if finding.file == "dir0/q0.sql"],
+                         [(2, "SELECT *"), (5, "NULL Comparison"), (6, "ORDER BY RAND()")])
+
+    def test_multiprocess_merge_matches_single_scan(self) -> None:
+        """
+        Test shards scanned in separate processes merge to result of scanning everything as one shard.
+        """
+        manifest = ShardManifest.build([self.root], 3, self.root, max_unit_bytes=200)
+        manifest_path = os.path.join(self.root, "manifest.json")
+        manifest.save(manifest_path)
+        outputs = [os.path.join(self.root, f"part-{i}.json") for i in range(3)]
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            paths = list(pool.map(scan_to_file, [manifest_path] * 3, range(3), outputs))
+        merged = merge_partials([load_partial(path) for path in reversed(paths)])
+        expected = self.findings(ShardManifest.build([self.root], 1, self.root))
+        self.assertEqual(merged.findings, expected.findings)
+        self.assertEqual((merged.severity_score, merged.statements, merged.shards), (expected.severity_score, expected.statements, 3))
+
+    def test_changed_input_detected(self) -> None:
+        """
+        Test scanning shard whose input changed since sharding fails.
+        """
+        manifest = ShardManifest.build([self.root], 2, self.root)
+        with open(os.path.join(self.root, "dir0", "q0.sql"), 'r+') as f:
+            f.write("DELETE")
+        index = next(i for i, shard in enumerate(manifest.shards) if any(unit.path == "dir0/q0.sql" for unit in shard))
+        with self.assertRaises(ValueError):
+            scan_shard(SQLAntipatternScanner(), manifest, index)
+        with self.assertRaises(ValueError):
+            scan_shard(SQLAntipatternScanner(), manifest, 2)
+
+    def test_merge_rejects_inconsistent_partials(self) -> None:
+        """
+        Test merge rejects missing and duplicated shards, other manifests and other scanner configurations.
+        """
+        manifest = ShardManifest.build([self.root], 2, self.root)
+        scanner = SQLAntipatternScanner()
+        partials = [scan_shard(scanner, manifest, i) for i in range(2)]
+        with self.assertRaises(ValueError):
+            merge_partials(partials[:1])
+        with self.assertRaises(ValueError):
+            merge_partials([partials[0], partials[0]])
+        other = ShardManifest.build([os.path.join(self.root, "dir0")], 2, self.root)
+        with self.assertRaises(ValueError):
+            merge_partials([partials[0], scan_shard(scanner, other, 1)])
+        ignoring = SQLAntipatternScanner()
+        ignoring.ignore_pattern("SELECT *")
+        with self.assertRaises(ValueError):
+            merge_partials([partials[0], scan_shard(ignoring, manifest, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
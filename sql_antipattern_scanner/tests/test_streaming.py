@@ -0,0 +1,96 @@
+# sql-antipattern-scanner/tests/test_streaming.py
+from sql_antipattern_scanner.streaming import ReservoirSampler, SpaceSaving, StreamingScanner, UniformSampler, stream
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+
+import io
+import json
+import random
+import unittest
+
+
+class TestSketches(unittest.TestCase):
+    """
+    Test suite for samplers and heavy-hitter tracking.
+    """
+
+    def test_space_saving_keeps_heavy_hitters(self) -> None:
+        """
+        Test frequent keys are tracked with bounded error among many rare keys in fixed memory.
+        """
+        tracker = SpaceSaving(capacity=10)
+        for i in range(5000):
+            tracker.add('hot' if i % 4 == 0 else 'warm' if i % 10 == 1 else f'rare-{i}', str(i))
+        self.assertEqual(len(tracker.counts), 10)
+        self.assertEqual(len(tracker.heap), 10)
+        top = tracker.top(2)
+        self.assertEqual([key for key, _, _, _ in top], ['hot', 'warm'])
+        key, count, error, item = top[0]
+        self.assertLessEqual(count - error, 1250)
+        self.assertGreaterEqual(count, 1250)
+        self.assertEqual(item, '0')
+
+    def test_samplers_are_bounded(self) -> None:
+        """
+        Test reservoir keeps fixed-size sample and uniform sampling is capped.
+        """
+        reservoir = ReservoirSampler(50, random.Random(1))
+        uniform = UniformSampler(0.5, 50, random.Random(1))
+        for i in range(10000):
+            reservoir.add(str(i))
+            uniform.add(str(i))
+        self.assertEqual(len(reservoir.items), 50)
+        self.assertEqual(len(uniform.items), 50)
+        # Reservoir draws from whole stream, not only its start
+        self.assertGreater(max(int(item) for item in reservoir.items), 5000)
+        reservoir.reset()
+        self.assertEqual((reservoir.seen, reservoir.items), (0, []))
+
+
+class TestStreamingScanner(unittest.TestCase):
+    """
+    Test suite for sampled scanning of statement streams.
+    """
+
+    def test_snapshots(self) -> None:
+        """
+        Test snapshots are emitted per interval, report top shapes with issues and extrapolate sample.
+        """
+        streaming = StreamingScanner(SQLAntipatternScanner(), sample_size=10, top_k=1, seed=3)
+        lines = [f"SELECT * FROM users WHERE id = {i}\n" for i in range(30)] + ["\n", '{"sql": "SELECT id FROM t"}\n']
+        ticks = iter(range(100))
+        output = io.StringIO()
+        stream(lines, streaming, output, interval=20, clock=lambda: next(ticks))
+        snapshots = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([snapshot["statements"] for snapshot in snapshots], [20, 11])
+        self.assertEqual(snapshots[-1]["total_statements"], 31)
+
+        hitter = snapshots[0]["heavy_hitters"][0]
+        self.assertEqual((hitter["shape"], hitter["count"]), ("SELECT * FROM USERS WHERE ID = ?", 20))
+        self.assertEqual([issue["name"] for issue in hitter["issues"]], ["SELECT *"])
+        self.assertEqual(snapshots[0]["sample"]["statements"], 10)
+        self.assertEqual(snapshots[0]["sample"]["rules"][0]["estimated_statements"], 20)
+
+    def test_scans_are_cached_per_shape(self) -> None:
+        """
+        Test statements of same shape are scanned once.
+        """
+        scanner = SQLAntipatternScanner()
+        calls = []
+        original = scanner.scan
+        scanner.scan = lambda sql: calls.append(sql) or original(sql)
+        streaming = StreamingScanner(scanner, sample_size=100, top_k=5)
+        for i in range(100):
+            streaming.observe(f"SELECT * FROM users WHERE id = {i}")
+        streaming.snapshot(1.0)
+        self.assertEqual(len(calls), 1)
+
+    def test_unknown_sampling_mode(self) -> None:
+        """
+        Test unknown sampling mode is rejected.
+        """
+        with self.assertRaises(ValueError):
+            StreamingScanner(SQLAntipatternScanner(), sampling='stratified')
+
+
+if __name__ == '__main__':
+    unittest.main()
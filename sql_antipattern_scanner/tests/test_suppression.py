@@ -0,0 +1,85 @@
+# sql-antipattern-scanner/tests/test_suppression.py
+from sql_antipattern_scanner.suppression import ALL_RULES, Baseline, inline_suppressions
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import Finding
+from sql_antipattern_scanner.antipatterns import DEFAULT_ANTIPATTERNS
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+SELECT_STAR = DEFAULT_ANTIPATTERNS[0][1]
+NULL_COMPARISON = DEFAULT_ANTIPATTERNS[2][1]
+
+
+class TestInlineSuppressions(unittest.TestCase):
+    """
+    Test suite for '-- antipattern: ignore[rule]' comments.
+    """
+
+    def test_directives(self) -> None:
+        """
+        Test rule lists, bare ignore and comment-like text in strings are told apart.
+        """
+        self.assertEqual(inline_suppressions("-- antipattern: ignore[SELECT *, NULL Comparison]\nSELECT * FROM t"),
+                         {"select *", "null comparison"})
+        self.assertEqual(inline_suppressions("SELECT * FROM t /* antipattern: ignore */"), {ALL_RULES})
+        self.assertEqual(inline_suppressions("SELECT '-- antipattern: ignore' FROM t"), set())
+        # Only first statement counts
+        self.assertEqual(inline_suppressions("SELECT 1; -- antipattern: ignore\nSELECT * FROM t"), set())
+
+    def test_scanner_honors_suppressions(self) -> None:
+        """
+        Test suppressed rules are not reported and fully suppressed statements are not parsed.
+        """
+        scanner = SQLAntipatternScanner()
+        issues = scanner.scan_sql("-- antipattern: ignore[select *]\nSELECT * FROM t WHERE a = NULL")
+        self.assertEqual([issue[0].name for issue in issues], ["NULL Comparison"])
+        with mock.patch('sqlparse.parse') as parse:
+            self.assertEqual(scanner.scan_sql("SELECT * FROM t WHERE a = NULL -- antipattern: ignore[*]"), [])
+            parse.assert_not_called()
+
+
+class TestBaseline(unittest.TestCase):
+    """
+    Test suite for baseline of accepted findings.
+    """
+
+    def test_new_findings(self) -> None:
+        """
+        Test baseline survives reformatting and moved lines, and tells repeated statements apart.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'q.sql')
+            with open(path, 'w') as f:
+                f.write("SELECT * FROM a WHERE id = 1;\nSELECT * FROM a WHERE id = 2;\n")
+            findings = [Finding('q.sql', 1, SELECT_STAR, 'SELECT *', ''), Finding('q.sql', 2, SELECT_STAR, 'SELECT *', '')]
+            baseline_path = os.path.join(directory, 'baseline.json')
+            Baseline.from_findings(findings[:1], directory).save(baseline_path)
+            baseline = Baseline.load(baseline_path)
+
+            with open(path, 'w') as f:
+                f.write("-- moved\n\nselect *\n  from a where id = 7;\nSELECT * FROM a WHERE id = 8;\nSELECT id FROM b WHERE x = NULL;\n")
+            moved = [Finding('q.sql', 3, SELECT_STAR, 'select *', ''), Finding('q.sql', 5, SELECT_STAR, 'SELECT *', ''),
+                     Finding('q.sql', 6, NULL_COMPARISON, 'x = NULL', '')]
+            self.assertEqual(baseline.new_findings(moved, directory), [False, True, True])
+
+    def test_sources_and_invalid_file(self) -> None:
+        """
+        Test findings of in-memory SQL use given source, and non-baseline files are rejected.
+        """
+        finding = Finding('<query>', 1, SELECT_STAR, 'SELECT *', '')
+        baseline = Baseline.from_findings([finding], sources={'<query>': "SELECT * FROM t"})
+        changed = Baseline.from_findings([finding], sources={'<query>': "SELECT * FROM u"})
+        self.assertNotEqual(baseline.fingerprints, changed.fingerprints)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with open(path, 'w') as f:
+                f.write('{"fingerprints": []}')
+            with self.assertRaises(ValueError):
+                Baseline.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# sql-antipattern-scanner/tests/test_watch.py
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.watch import IncrementalScanner, PollingWatcher, create_watcher, watch
+
+import io
+import os
+import json
+import tempfile
+import unittest
+
+
+class ScriptedWatcher:
+    """
+    Watcher replaying scripted events, one batch per poll.
+    """
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def poll(self, timeout):
+        return self.batches.pop(0) if self.batches else (set(), set())
+
+    def close(self):
+        pass
+
+
+class TestWatch(unittest.TestCase):
+    """
+    Test suite for watch mode.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up temporary directory with SQL file before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.sql")
+        self.write("SELECT id FROM users;\nSELECT * FROM orders;\n")
+
+    def tearDown(self) -> None:
+        """
+        Remove temporary directory after each test method.
+        """
+        self.tmp.cleanup()
+
+    def write(self, sql: str) -> None:
+        """
+        Write SQL file.
+        """
+        with open(self.path, "w") as f:
+            f.write(sql)
+
+    def test_incremental_scanner_reuses_unchanged_statements(self) -> None:
+        """
+        Test only changed statements are rescanned.
+        """
+        scanner = SQLAntipatternScanner()
+        incremental = IncrementalScanner(scanner)
+        self.assertEqual([(f.line, f.antipattern.name) for f in incremental.scan_file(self.path)], [(2, "SELECT *")])
+        scanned = []
+        original_scan = scanner.scan_sql
+        scanner.scan_sql = lambda sql: scanned.append(sql) or original_scan(sql)
+        self.write("SELECT id FROM users;\nSELECT * FROM orders;\nSELECT id FROM t WHERE a = NULL;\n")
+        findings = incremental.scan_file(self.path)
+        self.assertEqual(scanned, ["SELECT id FROM t WHERE a = NULL;"])
+        self.assertEqual([f.line for f in findings], [2, 3])
+
+    def test_polling_watcher(self) -> None:
+        """
+        Test polling watcher reports modified and deleted files.
+        """
+        watcher = PollingWatcher(self.tmp.name)
+        self.write("SELECT 1;  ")
+        self.assertEqual(watcher.poll(0), ({self.path}, set()))
+        os.remove(self.path)
+        self.assertEqual(watcher.poll(0), (set(), {self.path}))
+
+    def test_inotify_watcher(self) -> None:
+        """
+        Test native watcher reports modified files.
+        """
+        watcher = create_watcher(self.tmp.name)
+        try:
+            self.write("SELECT 1;")
+            changed, _ = watcher.poll(1.0)
+            self.assertIn(self.path, changed)
+        finally:
+            watcher.close()
+
+    def test_watch_debounces_and_emits_json_lines(self) -> None:
+        """
+        Test burst of events triggers a single rescan emitted as JSON Lines.
+        """
+        output = io.StringIO()
+        polls = iter(range(10))
+        watcher = ScriptedWatcher([({self.path}, set()), ({self.path}, set())])
+        watch(self.tmp.name, SQLAntipatternScanner(), output=output, debounce=0, watcher=watcher,
+              should_stop=lambda: next(polls) >= 5)
+        events = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0]["file"], self.path)
+        self.assertEqual(events[1]["issues"][0]["name"], "SELECT *")
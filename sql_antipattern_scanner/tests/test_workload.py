@@ -0,0 +1,85 @@
+# sql-antipattern-scanner/tests/test_workload.py
+from sql_antipattern_scanner.workload import WorkloadAnalyzer, WorkloadEvent, read_workload
+
+import os
+import json
+import tempfile
+import unittest
+
+
+def names(findings: list) -> list:
+    """
+    Get rule names of findings.
+    """
+    return [finding.antipattern.name for finding in findings]
+
+
+class TestWorkloadAnalyzer(unittest.TestCase):
+    """
+    Test suite for workload-level analysis across statements.
+    """
+
+    def test_n_plus_one(self) -> None:
+        """
+        Test single-row lookup executed per item of loop is reported once with counts.
+        """
+        events = [WorkloadEvent("SELECT id, name FROM users WHERE id = 1", 'web-1', 0.0, 1)]
+        events += [WorkloadEvent(f"SELECT * FROM orders WHERE user_id = {i}", 'web-1', 0.01 * i, i + 2) for i in range(12)]
+        findings = WorkloadAnalyzer(window=1.0).analyze(events)
+        self.assertEqual(names(findings), ["N+1 Query"])
+        self.assertEqual(findings[0].line, 2)
+        self.assertIn("12 executions", findings[0].context)
+        self.assertIn("12 distinct parameter value(s)", findings[0].context)
+
+    def test_repeated_query_and_windows(self) -> None:
+        """
+        Test identical statements are reported per session and window, not across windows.
+        """
+        sql = "SELECT name FROM settings WHERE key = 'theme'"
+        events = [WorkloadEvent(sql, 'a', 0.0, 1), WorkloadEvent(sql, 'b', 0.1, 2), WorkloadEvent(sql, 'a', 0.2, 3),
+                  WorkloadEvent(sql, 'a', 0.3, 4), WorkloadEvent(sql, 'b', 5.0, 5), WorkloadEvent(sql, 'b', 5.1, 6)]
+        analyzer = WorkloadAnalyzer(window=1.0)
+        closed = []
+        for event in events:
+            closed.extend(analyzer.feed(event))
+        # Window of session 'a' is evaluated as soon as stream moves past it
+        self.assertEqual(names(closed), ["Repeated Query"])
+        self.assertIn("3 identical executions in session 'a'", closed[0].context)
+        self.assertEqual(analyzer.close(), [])
+
+    def test_chatty_session(self) -> None:
+        """
+        Test session issuing many distinct statements is reported as chatty.
+        """
+        events = [WorkloadEvent(f"INSERT INTO audit (n) VALUES ({i})", 's', None, i + 1) for i in range(60)]
+        findings = WorkloadAnalyzer(chatty_threshold=50).analyze(events)
+        self.assertEqual(names(findings), ["Chatty Session"])
+        self.assertIn("60 statements of 1 distinct shape(s)", findings[0].context)
+
+    def test_read_workload(self) -> None:
+        """
+        Test JSON Lines and SQL script workloads are read in order with line numbers.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            log = os.path.join(directory, 'queries.jsonl')
+            with open(log, 'w') as f:
+                f.write(json.dumps({"sql": "SELECT 1", "session": 7, "timestamp": "2024-01-01T00:00:00Z"}) + "\n\n")
+                f.write(json.dumps({"sql": "SELECT 2"}) + "\n")
+            events = list(read_workload(log))
+            self.assertEqual([(e.session, e.line) for e in events], [('7', 1), ('', 3)])
+            self.assertEqual(events[0].timestamp, 1704067200.0)
+            self.assertIsNone(events[1].timestamp)
+
+            script = os.path.join(directory, 'queries.sql')
+            with open(script, 'w') as f:
+                f.write("SELECT 1;\n\nSELECT 2;\n")
+            self.assertEqual([e.line for e in read_workload(script)], [1, 3])
+
+            with open(log, 'w') as f:
+                f.write('{"session": "x"}\n')
+            with self.assertRaises(ValueError):
+                list(read_workload(log))
+
+
+if __name__ == '__main__':
+    unittest.main()
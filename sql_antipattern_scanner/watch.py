@@ -0,0 +1,336 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/watch.py
+import os
+import sys
+import json
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from typing import Callable, Dict, List, Optional, Set, TextIO, Tuple
+from sql_antipattern_scanner.sql_antipattern_scanner import SQLAntipatternScanner
+from sql_antipattern_scanner.statements import Finding, split_statements, locate
+
+# inotify event masks from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def _iter_files(root: str, extensions: Tuple[str, ...]) -> List[str]:
+    """
+    List files under directory with matching extensions.
+
+    :param root: Directory to search
+    :param extensions: File extensions to include
+    :return: Sorted list of file paths
+    """
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, filename) for filename in filenames if filename.lower().endswith(extensions))
+    return sorted(paths)
+
+
+class PollingWatcher:
+    """
+    Pure-Python watcher comparing file modification times and sizes between polls.
+    """
+
+    def __init__(self, root: str, extensions: Tuple[str, ...] = ('.sql',)):
+        """
+        Initialize PollingWatcher and take initial snapshot.
+
+        :param root: Directory to watch
+        :param extensions: File extensions to watch
+        """
+        self.root = root
+        self.extensions = extensions
+        self.snapshot: Dict[str, Tuple[int, int]] = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Record modification time and size of watched files.
+
+        :return: Dictionary mapping path to (mtime_ns, size)
+        """
+        snapshot = {}
+        for path in _iter_files(self.root, self.extensions):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> Tuple[Set[str], Set[str]]:
+        """
+        Wait for timeout and report files changed since previous poll.
+
+        :param timeout: Seconds to wait before comparing snapshots
+        :return: Tuple of changed and deleted file paths
+        """
+        time.sleep(timeout)
+        current = self._snapshot()
+        changed = {path for path, stat in current.items() if self.snapshot.get(path) != stat}
+        deleted = set(self.snapshot) - set(current)
+        self.snapshot = current
+        return changed, deleted
+
+    def close(self) -> None:
+        """
+        Release watcher resources.
+        """
+
+
+class InotifyWatcher:
+    """
+    Linux watcher reading inotify events through libc, without external dependencies.
+    """
+
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, root: str, extensions: Tuple[str, ...] = ('.sql',)):
+        """
+        Initialize InotifyWatcher and watch every directory under root.
+
+        :param root: Directory to watch
+        :param extensions: File extensions to watch
+        :raises OSError: If inotify is unavailable
+        """
+        self.root = root
+        self.extensions = extensions
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.fd: int = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = {}
+        for dirpath, _, _ in os.walk(root):
+            self._add_watch(dirpath)
+
+    def _add_watch(self, path: str) -> None:
+        """
+        Add inotify watch for directory.
+
+        :param path: Directory path
+        """
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self.watches[wd] = path
+
+    def _read_events(self) -> bytes:
+        """
+        Drain pending inotify events.
+
+        :return: Raw event buffer
+        """
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def poll(self, timeout: float) -> Tuple[Set[str], Set[str]]:
+        """
+        Wait up to timeout for file events.
+
+        :param timeout: Maximum number of seconds to wait
+        :return: Tuple of changed and deleted file paths
+        """
+        changed: Set[str] = set()
+        deleted: Set[str] = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed, deleted
+
+        data = self._read_events()
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + _INOTIFY_EVENT.size:offset + _INOTIFY_EVENT.size + length].rstrip(b'\0')
+            offset += _INOTIFY_EVENT.size + length
+            if wd not in self.watches or not name:
+                continue
+            path = os.path.join(self.watches[wd], os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # New directories need their own watches, and may already hold files
+                    for dirpath, _, _ in os.walk(path):
+                        self._add_watch(dirpath)
+                    changed.update(_iter_files(path, self.extensions))
+                continue
+            if not path.lower().endswith(self.extensions):
+                continue
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                deleted.add(path)
+                changed.discard(path)
+            else:
+                changed.add(path)
+                deleted.discard(path)
+        return changed, deleted
+
+    def close(self) -> None:
+        """
+        Release watcher resources.
+        """
+        os.close(self.fd)
+
+
+def create_watcher(root: str, extensions: Tuple[str, ...] = ('.sql',)):
+    """
+    Create inotify watcher where available, falling back to polling watcher.
+
+    :param root: Directory to watch
+    :param extensions: File extensions to watch
+    :return: InotifyWatcher or PollingWatcher instance
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root, extensions)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, extensions)
+
+
+class IncrementalScanner:
+    """
+    Warm scanner that only rescans statements whose text changed since previous scan.
+    """
+
+    def __init__(self, scanner: SQLAntipatternScanner):
+        """
+        Initialize IncrementalScanner.
+
+        :param scanner: SQLAntipatternScanner instance kept warm across rescans
+        """
+        self.scanner = scanner
+        self.statement_cache: Dict[str, Dict[str, list]] = {}
+
+    def scan_file(self, path: str) -> List[Finding]:
+        """
+        Scan file, reusing results for statements unchanged since previous scan.
+
+        :param path: Path to SQL file
+        :return: List of findings
+        """
+        with open(path, 'r') as f:
+            sql = f.read()
+        previous = self.statement_cache.get(path, {})
+        current: Dict[str, list] = {}
+        findings = []
+        for statement in split_statements(sql):
+            issues = current.get(statement.text)
+            if issues is None:
+                issues = previous.get(statement.text)
+            if issues is None:
+                issues = self.scanner.scan_sql(statement.text)
+            current[statement.text] = issues
+            for antipattern, offending_sql, context in issues:
+                position = locate(statement.text, offending_sql)
+                line = statement.start_line + (statement.text.count('\n', 0, position) if position is not None else 0)
+                findings.append(Finding(path, line, antipattern, offending_sql, context))
+        self.statement_cache[path] = current
+        return findings
+
+    def forget(self, path: str) -> None:
+        """
+        Drop cached statements of deleted file.
+
+        :param path: Path to SQL file
+        """
+        self.statement_cache.pop(path, None)
+
+
+def findings_event(path: str, findings: List[Finding], scanner: SQLAntipatternScanner) -> dict:
+    """
+    Build JSON Lines event for rescanned file.
+
+    :param path: Path to SQL file
+    :param findings: Findings for file
+    :param scanner: Scanner used to compute severity score
+    :return: Event dictionary
+    """
+    return {
+        "event": "findings",
+        "file": path,
+        "total_issues": len(findings),
+        "severity_score": scanner.get_severity_score([(f.antipattern, f.offending_sql, f.context) for f in findings]),
+        "issues": [
+            {
+                "line": finding.line,
+                "name": finding.antipattern.name,
+                "severity": finding.antipattern.severity,
+                "offending_sql": finding.offending_sql,
+                "suggestion": finding.antipattern.suggestion
+            }
+            for finding in findings
+        ]
+    }
+
+
+def watch(root: str, scanner: SQLAntipatternScanner, output: TextIO = sys.stdout, debounce: float = 0.3,
+          interval: float = 0.1, extensions: Tuple[str, ...] = ('.sql',), watcher=None,
+          should_stop: Optional[Callable[[], bool]] = None) -> None:
+    """
+    Watch directory tree and emit findings of modified files as JSON Lines.
+
+    Every file is scanned once on start. Afterwards, events are collected until no new
+    event arrives for debounce seconds, so bursts of saves trigger a single rescan.
+
+    :param root: Directory to watch
+    :param scanner: SQLAntipatternScanner instance kept warm across rescans
+    :param output: Stream JSON Lines are written to
+    :param debounce: Quiet period in seconds before pending changes are rescanned
+    :param interval: Seconds to wait for events on each poll
+    :param extensions: File extensions to watch
+    :param watcher: Watcher instance, created with create_watcher if omitted
+    :param should_stop: Callable returning True to end watch loop (runs until interrupted if omitted)
+    """
+    incremental = IncrementalScanner(scanner)
+    watcher = watcher or create_watcher(root, extensions)
+
+    def emit(event: dict) -> None:
+        output.write(json.dumps(event) + '\n')
+        output.flush()
+
+    def rescan(paths: Set[str], deleted: Set[str]) -> None:
+        for path in sorted(paths | deleted):
+            if os.path.isfile(path):
+                try:
+                    emit(findings_event(path, incremental.scan_file(path), scanner))
+                except (OSError, UnicodeDecodeError) as e:
+                    emit({"event": "error", "file": path, "error": str(e)})
+            else:
+                incremental.forget(path)
+                emit({"event": "deleted", "file": path})
+
+    try:
+        rescan(set(_iter_files(root, extensions)), set())
+        pending_changed: Set[str] = set()
+        pending_deleted: Set[str] = set()
+        last_event = 0.0
+        while not (should_stop and should_stop()):
+            changed, deleted = watcher.poll(interval)
+            if changed or deleted:
+                pending_changed = (pending_changed - deleted) | changed
+                pending_deleted = (pending_deleted - changed) | deleted
+                last_event = time.monotonic()
+            elif (pending_changed or pending_deleted) and time.monotonic() - last_event >= debounce:
+                rescan(pending_changed, pending_deleted)
+                pending_changed, pending_deleted = set(), set()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
@@ -0,0 +1,206 @@
+# sql_antipattern_scanner/sql_antipattern_scanner/workload.py
+import re
+import json
+from collections import deque, namedtuple
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from sql_antipattern_scanner.antipatterns import Antipattern
+from sql_antipattern_scanner.statements import Finding, normalize_sql, split_statements
+
+# Statement executed in workload, in stream order; timestamp in seconds (None if unknown), line is 1-based
+WorkloadEvent = namedtuple('WorkloadEvent', ['sql', 'session', 'timestamp', 'line'])
+
+WORKLOAD_ANTIPATTERNS = {
+    "N+1 Query": Antipattern(
+        "N+1 Query", "The same single-row lookup is executed once per item of a loop, paying a round trip and a query execution for every row instead of one for the whole set.",
+        "High", "Fetch all rows in one query with IN (...) or a JOIN, or eager-load the association.",
+        "SELECT * FROM orders WHERE user_id IN (1, 2, 3) instead of one SELECT per user_id"),
+    "Repeated Query": Antipattern(
+        "Repeated Query", "An identical query, including its parameter values, is executed several times in a short window, so the same result is recomputed and transferred again.",
+        "Medium", "Reuse the first result within the request, or cache it.",
+        "Memoize the result of the query for the duration of the request"),
+    "Chatty Session": Antipattern(
+        "Chatty Session", "A session issues many statements in a short window, so round-trip latency dominates its response time.",
+        "Medium", "Batch statements, combine lookups into set-based queries, or move the loop into a single statement.",
+        "INSERT INTO t (a, b) VALUES (1, 2), (3, 4) instead of one INSERT per row"),
+}
+
+# Shape of parameterized single-row lookup: equality or single-value IN on parameter in WHERE
+_LOOKUP_RE = re.compile(r'^\(?\s*SELECT\b.*\bWHERE\b.*(?:=|\bIN\s*\()\s*(?:\?|\$\?|:\w+|%S|@\w+)', re.DOTALL)
+
+
+def _timestamp(value) -> Optional[float]:
+    """
+    Convert event timestamp to seconds.
+
+    :param value: Number of seconds, ISO 8601 string or None
+    :return: Seconds, or None if value is missing
+    :raises ValueError: If value cannot be parsed
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+
+
+def read_workload(path: str) -> Iterator[WorkloadEvent]:
+    """
+    Read ordered statement stream from file.
+
+    JSON Lines files (.jsonl, .ndjson) hold one object per statement with 'sql' and
+    optional 'session' and 'timestamp' (seconds or ISO 8601) keys. Other files are read
+    as SQL scripts whose statements form one session without timestamps.
+
+    :param path: Path to workload file
+    :return: Iterator of workload events
+    :raises ValueError: If JSON Lines record is malformed
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if not path.lower().endswith(('.jsonl', '.ndjson')):
+            for statement in split_statements(f.read()):
+                yield WorkloadEvent(statement.text, '', None, statement.start_line)
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield WorkloadEvent(record['sql'], str(record.get('session', '')), _timestamp(record.get('timestamp')), number)
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{number}: invalid workload record: {e}")
+
+
+class _Window:
+    """
+    Statements of one session within one time window, indexed by shape and by exact text.
+    """
+
+    def __init__(self, session: str, start: Optional[float], line: int):
+        """
+        Initialize empty window.
+        """
+        self.session = session
+        self.start = start
+        self.end = start
+        self.line = line
+        self.count = 0
+        # Shape -> [executions, first event, exact text -> [executions, line of first execution]]
+        self.shapes: Dict[str, list] = {}
+
+
+class WorkloadAnalyzer:
+    """
+    Detect antipatterns that only show across statements of workload: N+1 loops,
+    redundant repeated queries and chatty sessions.
+
+    Statements are grouped by session and tumbling time window, and within window by
+    normalized shape and exact text, using dictionaries so every statement costs one
+    normalization and a few hash lookups. Windows are evaluated as soon as they close,
+    so memory for statements is bounded by open windows rather than stream length.
+    """
+
+    def __init__(self, window: float = 1.0, n_plus_one_threshold: int = 10, repeat_threshold: int = 3,
+                 chatty_threshold: int = 50, source: str = ''):
+        """
+        Initialize WorkloadAnalyzer.
+
+        :param window: Window length in seconds (events without timestamps share one window per session)
+        :param n_plus_one_threshold: Executions of single-row lookup shape in window reported as N+1
+        :param repeat_threshold: Executions of identical statement in window reported as repeated
+        :param chatty_threshold: Statements of session in window reported as chatty
+        :param source: File path recorded on findings
+        """
+        self.window = window
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.repeat_threshold = repeat_threshold
+        self.chatty_threshold = chatty_threshold
+        self.source = source
+        self.windows: Dict[str, _Window] = {}
+        # Open windows in order of opening, so expired ones are closed without scanning all sessions
+        self.expiry: Deque[Tuple[float, str, _Window]] = deque()
+        self.findings: List[Finding] = []
+
+    def feed(self, event: WorkloadEvent) -> List[Finding]:
+        """
+        Add statement to workload.
+
+        :param event: Workload event; events must arrive in timestamp order
+        :return: Findings of windows closed by event
+        """
+        closed: List[Finding] = []
+        if event.timestamp is not None:
+            while self.expiry and self.expiry[0][0] < event.timestamp:
+                _, session, window = self.expiry.popleft()
+                if self.windows.get(session) is window:
+                    closed.extend(self._close(session))
+        window = self.windows.get(event.session)
+        if window is None:
+            window = self.windows[event.session] = _Window(event.session, event.timestamp, event.line)
+            if event.timestamp is not None:
+                self.expiry.append((event.timestamp + self.window, event.session, window))
+        window.count += 1
+        if event.timestamp is not None:
+            window.end = event.timestamp
+        normalized = normalize_sql(event.sql)
+        shape = window.shapes.get(normalized)
+        if shape is None:
+            shape = window.shapes[normalized] = [0, event, {}]
+        shape[0] += 1
+        text = ' '.join(event.sql.split())
+        repeats = shape[2].get(text)
+        if repeats is None:
+            repeats = shape[2][text] = [0, event.line]
+        repeats[0] += 1
+        return closed
+
+    def close(self) -> List[Finding]:
+        """
+        Evaluate all open windows at end of stream.
+
+        :return: Findings of closed windows
+        """
+        closed: List[Finding] = []
+        for session in list(self.windows):
+            closed.extend(self._close(session))
+        self.expiry.clear()
+        return closed
+
+    def analyze(self, events: Iterable[WorkloadEvent]) -> List[Finding]:
+        """
+        Analyze complete statement stream.
+
+        :param events: Workload events in stream order
+        :return: All findings, ordered by line of first statement involved
+        """
+        for event in events:
+            self.feed(event)
+        self.close()
+        return sorted(self.findings, key=lambda finding: finding.line)
+
+    def _close(self, session: str) -> List[Finding]:
+        """
+        Evaluate and drop open window of session.
+
+        :param session: Session identifier
+        :return: Findings of window
+        """
+        window = self.windows.pop(session)
+        where = f"session {session!r}" if session else "workload"
+        if window.start is not None:
+            where += f" within {window.end - window.start:.3g}s"
+        found = []
+        for shape, (executions, first, texts) in window.shapes.items():
+            if executions >= self.n_plus_one_threshold and _LOOKUP_RE.match(shape):
+                found.append(Finding(self.source, first.line, WORKLOAD_ANTIPATTERNS["N+1 Query"], first.sql,
+                                     f"{executions} executions of lookup in {where}, {len(texts)} distinct parameter value(s)"))
+                continue
+            for text, (repeats, line) in texts.items():
+                if repeats >= self.repeat_threshold:
+                    found.append(Finding(self.source, line, WORKLOAD_ANTIPATTERNS["Repeated Query"], text,
+                                         f"{repeats} identical executions in {where}"))
+        if window.count >= self.chatty_threshold:
+            # Most executed shape stands for session, as it is the first candidate for batching
+            busiest = max(window.shapes.values(), key=lambda shape: shape[0])[1]
+            found.append(Finding(self.source, window.line, WORKLOAD_ANTIPATTERNS["Chatty Session"], busiest.sql,
+                                 f"{window.count} statements of {len(window.shapes)} distinct shape(s) in {where}"))
+        self.findings.extend(found)
+        return found